@@ -13,11 +13,12 @@ provide model-specific admin classes for ``Author``, ``Book``, ``Genre``,
 ###########################
 from csv import writer
 from datetime import datetime
+from functools import wraps
 from json import dumps, loads
 from pathlib import Path
-from tempfile import TemporaryDirectory
+from tempfile import TemporaryDirectory, TemporaryFile
+from zipfile import is_zipfile
 from typing import Callable, Iterable
-from zipfile import ZipFile
 
 ###########################
 #    3rd Party Imports    #
@@ -25,14 +26,22 @@ from zipfile import ZipFile
 from adminsortable2.admin import SortableInlineAdminMixin, SortableAdminBase
 from auditlog.models import LogEntry
 from auditlog.context import set_actor, disable_auditlog
+from openpyxl import Workbook
 from django_admin_listfilter_dropdown.filters import DropdownFilter, RelatedDropdownFilter
 from django import forms
 from django.contrib import admin, messages
-from django.db.models import Count, Case, When, IntegerField, Sum, ForeignKey
-from django.http import HttpResponse, HttpResponseRedirect
-from django.urls import path
-from django.utils.html import format_html
-from django.shortcuts import render
+from django.contrib.admin.helpers import ACTION_CHECKBOX_NAME
+from django.contrib.admin.widgets import AutocompleteSelect
+from django.core.exceptions import PermissionDenied
+from django.core.paginator import Paginator
+from django.db import IntegrityError
+from django.db.models import Count, F, ForeignKey, Q, QuerySet, Value
+from django.db.models.functions import Concat
+from django.http import FileResponse, Http404, HttpResponse, HttpResponseRedirect, JsonResponse, StreamingHttpResponse
+from django.urls import path, reverse
+from django.utils.html import format_html, format_html_join
+from django.views.decorators.csrf import csrf_exempt
+from django.shortcuts import get_object_or_404, render
 
 ###########################
 #       Local Imports     #
@@ -41,12 +50,49 @@ from .management.commands.admin_init_author import Command as AuthorsCmd
 from .management.commands.admin_init_book import Command as BookCmd
 from .management.commands.admin_init_genre import Command as GenreCmd
 from .management.commands.admin_init_nationality import Command as NationalityCmd
-from .models import Author, Book, Genre, Nationality, BookAuthor, Statistic
-from .services import AuditLogService
+from .exports import write_export_bundle
+from .models import Author, Book, Genre, ImportRun, IsbnReallocation, Nationality, BookAuthor, Statistic
+from .pagination import EXACT_COUNT_VAR, ChangeList, EstimatedCountPaginator
+from .services import AuditLogService, BookBulkService, BookHistoryService
+from .uploads import MAX_COVER_SIZE, MAX_COVERS_UPLOAD_SIZE, MAX_IMPORT_SIZE, install_upload_handlers
+from .utils import parse_as_of
 
 ###########################
 #     Helper Classes      #
 ###########################
+def iterate_rows(rows):
+    """Iterate over export rows without caching querysets.
+
+    Parameters
+    ----------
+    rows : Iterable
+        A queryset or any other iterable of rows.
+
+    Returns
+    -------
+    Iterator
+        ``rows.iterator()`` for querysets, ``iter(rows)`` otherwise.
+    """
+    return rows.iterator() if isinstance(rows, QuerySet) else iter(rows)
+
+class Echo:
+    """Pseudo-buffer handing back what is written, for streamed CSV rows."""
+
+    def write(self, value):
+        """Return ``value`` instead of storing it.
+
+        Parameters
+        ----------
+        value : str
+            A line formatted by ``csv.writer``.
+
+        Returns
+        -------
+        str
+            ``value`` unchanged.
+        """
+        return value
+
 class AdminSave(admin.ModelAdmin):
     """Helper mixin to centralize save behaviour for admin models.
 
@@ -97,7 +143,11 @@ class AdminDelete(admin.ModelAdmin):
             super().delete_model(request, obj)
 
     def delete_queryset(self, request, queryset):
-        """Delete a queryset of objects with audit actor set.
+        """Delete a queryset of objects with their audit entries written in bulk.
+
+        Delegates to :meth:`bookprocess.services.AuditLogService.delete_queryset`,
+        which logs every deleted object, cascades included, with one
+        ``bulk_create`` in the same transaction as the delete.
 
         Parameters
         ----------
@@ -110,18 +160,110 @@ class AdminDelete(admin.ModelAdmin):
         -------
         None
         """
-        with set_actor(request.user):
-            super().delete_queryset(request, queryset)
+        AuditLogService.delete_queryset(request.user, queryset)
+
+class AdminEstimatedCount(admin.ModelAdmin):
+    """Mixin keeping changelist state per request and estimating large counts."""
+    change_list_template = "admin/estimated_count_changelist.html" #: Template showing whether the result count is estimated.
+    show_full_result_count = False #: Skip the unfiltered ``COUNT(*)`` Django runs next to the filtered one.
+    estimated_count_threshold: int | None = 10000 #: Unfiltered changelists of at least this many rows show an estimated count; ``None`` always counts.
+    changelist_params = (EXACT_COUNT_VAR,) #: GET parameters consumed by the admin instead of the changelist filters.
+
+    def changelist_view(self, request, extra_context=None):
+        """Move the admin's own GET parameters out of the changelist query.
+
+        The parameters listed in :attr:`changelist_params` are removed from
+        ``request.GET``, where the changelist would reject them as unknown
+        lookups, and kept in ``request.changelist_params`` for this request
+        only.
+
+        Parameters
+        ----------
+        request : django.http.HttpRequest
+            The current request object.
+        extra_context : dict
+            Additional context to include in the template.
+
+        Returns
+        -------
+        django.http.HttpResponse
+            The response returned by the parent ``changelist_view``.
+        """
+        request.GET = request.GET.copy()
+        request.changelist_params = {
+            name: request.GET.pop(name)[-1] for name in self.changelist_params if name in request.GET
+        }
+        return super().changelist_view(request, extra_context=extra_context)
+
+    def get_changelist(self, request, **kwargs):
+        """Return the changelist class reading the per-request settings.
+
+        Parameters
+        ----------
+        request : django.http.HttpRequest
+            The current request object.
+
+        Returns
+        -------
+        type[bookprocess.pagination.ChangeList]
+        """
+        return ChangeList
+
+    def get_list_per_page(self, request):
+        """Return the page size of the changelist for this request.
+
+        Parameters
+        ----------
+        request : django.http.HttpRequest
+            The current request object.
+
+        Returns
+        -------
+        int
+        """
+        return self.list_per_page
+
+    def get_paginator(self, request, queryset, per_page, orphans=0, allow_empty_first_page=True):
+        """Return a paginator that estimates large unfiltered counts.
+
+        An exact count is used when the threshold is disabled or the
+        request asks for it with ``?exact_count=1``.
+
+        Parameters
+        ----------
+        request : django.http.HttpRequest
+            The current request object.
+        queryset : django.db.models.query.QuerySet
+            The filtered changelist rows.
+        per_page : int
+            Rows per page.
+        orphans : int, optional
+            Passed to the paginator.
+        allow_empty_first_page : bool, optional
+            Passed to the paginator.
+
+        Returns
+        -------
+        django.core.paginator.Paginator
+        """
+        exact = getattr(request, "changelist_params", {}).get(EXACT_COUNT_VAR, "0")
+        if self.estimated_count_threshold is None or exact not in ("", "0"):
+            return super().get_paginator(request, queryset, per_page, orphans, allow_empty_first_page)
+        return EstimatedCountPaginator(
+            queryset, per_page, threshold=self.estimated_count_threshold,
+            orphans=orphans, allow_empty_first_page=allow_empty_first_page,
+        )
 
-class AdminPagination(admin.ModelAdmin):
+class AdminPagination(AdminEstimatedCount):
     """Mixin to add pagination controls and extra changelist context."""
     populate_url: str | None = None #: URL suffix for the model population view
     populate_button: str | None = None #:Label for the populate button shown in the changelist.
     multiple_url: str | None = None #: URL for multi-object operations (e.g. add-multiple view).
     multiple_button: str |None = None #: Label for the multiple action button.
     change_list_template = "admin/admin_pagination_changelist.html" #: Template path used to render the custom changelist when this mixin is applied.
-    list_per_page = 10 #:Current page size for the changelist (can be overridden via GET).
+    list_per_page = 10 #: Default page size for the changelist (can be overridden per request via GET).
     list_per_page_options = [10, 20, 50] #: Allowed page-size options presented to the user.
+    changelist_params = ("list_per_page", EXACT_COUNT_VAR) #: GET parameters consumed by the admin instead of the changelist filters.
 
     def __init__(self, model, admin_site):
         """Initialize the pagination helper.
@@ -148,11 +290,10 @@ class AdminPagination(admin.ModelAdmin):
             self.populate_button = f"Populate {model_verbose}"
 
     def changelist_view(self, request, extra_context=None):
-        """Customize the changelist view with pagination and extra template context.
+        """Customize the changelist view with extra template context.
 
-        Reads an optional ``list_per_page`` GET parameter to adjust the
-        page size for the changelist and injects UI labels/URLs used by
-        the custom changelist template.
+        Injects the page-size options and the UI labels/URLs used by the
+        custom changelist template.
 
         Parameters
         ----------
@@ -166,13 +307,6 @@ class AdminPagination(admin.ModelAdmin):
         django.http.HttpResponse
             The response returned by the parent ``changelist_view``.
         """
-        request.GET = request.GET.copy()
-        try:
-            page_param = int(request.GET.pop("list_per_page", [self.list_per_page])[0])
-            self.list_per_page = page_param
-        except (ValueError, TypeError):
-            self.list_per_page = self.list_per_page
-
         extra_context = extra_context or {}
         extra_context["list_per_page_options"] = self.list_per_page_options
         extra_context["populate_url"] = self.populate_url
@@ -182,6 +316,28 @@ class AdminPagination(admin.ModelAdmin):
 
         return super().changelist_view(request, extra_context=extra_context)
 
+    def get_list_per_page(self, request):
+        """Return the page size requested with ``?list_per_page=``.
+
+        Only the values in :attr:`list_per_page_options` are accepted; any
+        other value falls back to :attr:`list_per_page`. The size is read
+        from the request, so concurrent users never see each other's.
+
+        Parameters
+        ----------
+        request : django.http.HttpRequest
+            The current request object.
+
+        Returns
+        -------
+        int
+        """
+        try:
+            size = int(getattr(request, "changelist_params", {}).get("list_per_page", self.list_per_page))
+        except (ValueError, TypeError):
+            return self.list_per_page
+        return size if size in self.list_per_page_options else self.list_per_page
+
     class Media:
         """Media assets required by the pagination UI."""
         js = ("admin/js/admin_paginator_dropdown.js",) #: JavaScript files included on the admin pages that use this mixin.
@@ -235,12 +391,79 @@ class AdminPopulate(admin.ModelAdmin):
         custom_urls = [
             path(
                 self.populate_route,
-                self.admin_site.admin_view(self.populate_view),
+                self.upload_view(self.populate_view, MAX_IMPORT_SIZE, MAX_IMPORT_SIZE),
                 name=f"{opts.app_label}_{opts.model_name}_populate",
             ),
+            path(
+                "import-log/<int:run_id>/",
+                self.admin_site.admin_view(self.import_log_view),
+                name=f"{opts.app_label}_{opts.model_name}_import_log",
+            ),
         ]
         return custom_urls + urls
 
+    def upload_view(self, view, max_file_size, max_total_size):
+        """Wrap an admin view so its uploads stream through the capped handlers.
+
+        Upload handlers can only be replaced before the request body is
+        parsed, and the CSRF check of ``admin_view`` parses it. The handlers
+        are therefore installed first, with the CSRF check moved inside.
+
+        Parameters
+        ----------
+        view : Callable
+            The admin view receiving the uploads.
+        max_file_size : int
+            Largest accepted file, in bytes.
+        max_total_size : int
+            Largest accepted total of all files, in bytes.
+
+        Returns
+        -------
+        Callable
+            The wrapped view, protected like ``admin_site.admin_view``.
+        """
+        protected = self.admin_site.admin_view(view)
+
+        @csrf_exempt
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            install_upload_handlers(request, max_file_size, max_total_size)
+            return protected(request, *args, **kwargs)
+
+        return wrapper
+
+    def import_log_view(self, request, run_id):
+        """Download the full message log of an import run as CSV.
+
+        Parameters
+        ----------
+        request : django.http.HttpRequest
+            The current HTTP request.
+        run_id : int
+            Primary key of the :class:`bookprocess.models.ImportRun`.
+
+        Returns
+        -------
+        django.http.FileResponse
+            The CSV as an attachment.
+
+        Raises
+        ------
+        django.http.Http404
+            When the run does not exist, has no log or belongs to another
+            user (superusers may download every log).
+        """
+        run = get_object_or_404(ImportRun, pk=run_id)
+        if not run.log_file or not (request.user.is_superuser or run.user_id == request.user.pk):
+            raise Http404("Import log not found.")
+        return FileResponse(
+            run.log_file.open("rb"),
+            as_attachment=True,
+            filename=Path(run.log_file.name).name,
+            content_type="text/csv",
+        )
+
     def populate_view(self, request):
         """Handle requests to the populate endpoint.
 
@@ -300,22 +523,56 @@ class AdminPopulate(admin.ModelAdmin):
             )
             return HttpResponseRedirect("../")
 
+        cmd = self.populate_command_class()
         try:
-            cmd = self.populate_command_class()
             cmd.request = request
             cmd.handle(user=request.user, **extra_kwargs)
 
         except Exception as e:
             self.message_user(request, f"Error: {e}", messages.ERROR)
 
+        result = getattr(cmd, "result", None)
+        if result is not None and result.run is not None:
+            self._report_import_result(request, result)
+
         return HttpResponseRedirect("../")
 
+    def _report_import_result(self, request, result):
+        """Show one summary message for an import instead of one per row.
+
+        Parameters
+        ----------
+        request : django.http.HttpRequest
+            The current HTTP request.
+        result : bookprocess.importing.ImportResult
+            The finished result collector of the command.
+
+        Returns
+        -------
+        None
+        """
+        opts = self.model._meta
+        url = reverse(f"admin:{opts.app_label}_{opts.model_name}_import_log", args=[result.run.pk])
+        sample = format_html_join("", "<li>{}</li>", ((msg,) for _, msg in result.sample))
+        self.message_user(
+            request,
+            format_html(
+                '{}. <a href="{}">Download the full log</a>.{}',
+                result.summary(),
+                url,
+                format_html("<ul>{}</ul>", sample) if result.sample else "",
+            ),
+            {"error": messages.ERROR, "warning": messages.WARNING}.get(result.level, messages.SUCCESS),
+        )
+
     def _handle_file_upload(self, request):
         """Process the populate file upload and run the populate command.
 
-        On POST this validates the form, writes the uploaded file to a
-        temporary directory and, if configured, extracts an Excel file from
-        a ZIP archive before calling ``_execute_command`` with the file path.
+        On POST this validates the form and calls ``_execute_command`` with
+        the path of the uploaded file and the form's ``validate_only`` flag. Uploads Django already spooled to
+        disk are passed as they are; small in-memory uploads are written to
+        a temporary directory first. ZIP uploads are read by the command
+        itself, without extracting them.
 
         Parameters
         ----------
@@ -330,6 +587,11 @@ class AdminPopulate(admin.ModelAdmin):
         """
         if request.method == "POST":
             form = self.populate_form_class(request.POST, request.FILES)
+            upload_errors = getattr(request, "upload_errors", [])
+            if upload_errors:
+                for error in upload_errors:
+                    self.message_user(request, error, messages.ERROR)
+                return HttpResponseRedirect("../")
             if form.is_valid():
                 uploaded_file = form.cleaned_data.get("file")
 
@@ -338,24 +600,26 @@ class AdminPopulate(admin.ModelAdmin):
                     return HttpResponseRedirect("../")
 
                 with TemporaryDirectory() as tmpdir:
-                    tmpdir = Path(tmpdir)
-                    tmp_path = tmpdir / uploaded_file.name
-
-                    with open(tmp_path, "wb+") as f:
-                        for chunk in uploaded_file.chunks():
-                            f.write(chunk)
-
-                    if self.is_zip_file:
-                        excel_file = self._extract_excel_from_zip(tmp_path)
-                        if not excel_file:
-                            self.message_user(request, "No Excel file found in ZIP.",
-                                              messages.ERROR)
-                            return HttpResponseRedirect("../")
+                    # Large uploads are already spooled to disk by Django;
+                    # hand that file to the command instead of copying it.
+                    if hasattr(uploaded_file, "temporary_file_path"):
+                        upload_path = uploaded_file.temporary_file_path()
                     else:
-                        excel_file = tmp_path
+                        upload_path = Path(tmpdir) / Path(uploaded_file.name).name
+                        with open(upload_path, "wb+") as f:
+                            for chunk in uploaded_file.chunks():
+                                f.write(chunk)
+
+                    if self.is_zip_file and not is_zipfile(upload_path):
+                        self.message_user(request, "Uploaded file is not a ZIP archive.", messages.ERROR)
+                        return HttpResponseRedirect("../")
 
                     try:
-                        self._execute_command(request, excel_file=str(excel_file))
+                        self._execute_command(
+                            request,
+                            excel_file=str(upload_path),
+                            validate_only=form.cleaned_data.get("validate_only", False),
+                        )
                     except Exception as e:
                         self.message_user(request, f"Error: {e}", messages.ERROR)
 
@@ -391,30 +655,6 @@ class AdminPopulate(admin.ModelAdmin):
         """
         return self._execute_command(request)
 
-    def _extract_excel_from_zip(self, zip_path):
-        """Extract the first Excel file (``*.xlsx``) from a ZIP archive.
-
-        Parameters
-        ----------
-        zip_path : pathlib.Path
-            Path to the ZIP file on disk.
-
-        Returns
-        -------
-        pathlib.Path
-            Path to the extracted Excel file if found, otherwise ``None``.
-        """
-        extract_path = zip_path.parent / zip_path.stem
-
-        try:
-            with ZipFile(zip_path, "r") as zip_ref:
-                zip_ref.extractall(extract_path)
-
-            excel_file = next(extract_path.glob("*.xlsx"), None)
-            return excel_file
-        except Exception:
-            return None
-
 class AdminCount(admin.ModelAdmin):
     """Small mixin providing a grouped count helper used by statistics admins. """
     def aggregate_count(self, model, value_field):
@@ -466,7 +706,10 @@ class AdminWriteCSV(admin.ModelAdmin):
             self.filename = f"{model_name}.csv"
 
     def export_csv(self, sections):
-        """Generate an HttpResponse with the supplied sections written as CSV.
+        """Stream the supplied sections as one CSV file.
+
+        Rows are written as the response is consumed; querysets are read
+        with ``.iterator()`` so no section is held in memory.
 
         Parameters
         ----------
@@ -477,46 +720,66 @@ class AdminWriteCSV(admin.ModelAdmin):
 
         Returns
         -------
-        django.http.HttpResponse
-            Response object containing the CSV payload and appropriate
+        django.http.StreamingHttpResponse
+            Response streaming the CSV payload with an appropriate
             Content-Disposition header for download.
         """
-        response = HttpResponse(content_type='text/csv; charset=utf-8')
-        response['Content-Disposition'] = f'attachment; filename="{self.filename}"'
-        response.write('\ufeff')
-        writer_csv = writer(response)
-
-        def write_section(title, headers, rows, row_func):
-            """Write a single CSV section to the response writer.
-
-            Parameters
-            ----------
-            title : str
-                Section title written as a heading row.
-            headers : Iterable
-                Iterable of header column names.
-            rows : Iterable
-                Iterable of row objects to be formatted.
-            row_func : Callable
-                Callable that accepts a row object and returns an iterable
-                of column values for that row.
-
-            Returns
-            -------
-            None
-                Writes directly to the CSV writer attached to the response.
-            """
-            writer_csv.writerow([title])
-            writer_csv.writerow(headers)
-            for row in rows:
-                writer_csv.writerow(row_func(row))
-            writer_csv.writerow([])
+        writer_csv = writer(Echo())
 
-        for title, headers, rows, row_func in sections:
-            write_section(title, headers, rows, row_func)
+        def generate():
+            """Yield the CSV payload one line at a time.
 
+            Yields
+            ------
+            str
+                The byte order mark, then one encoded CSV line per row.
+            """
+            yield '\ufeff'
+            for title, headers, rows, row_func in sections:
+                yield writer_csv.writerow([title])
+                yield writer_csv.writerow(headers)
+                for row in iterate_rows(rows):
+                    yield writer_csv.writerow(row_func(row))
+                yield writer_csv.writerow([])
+
+        response = StreamingHttpResponse(generate(), content_type='text/csv; charset=utf-8')
+        response['Content-Disposition'] = f'attachment; filename="{self.filename}"'
         return response
 
+    def export_xlsx(self, sections):
+        """Write the supplied sections to a workbook, one sheet per section.
+
+        The workbook is built with openpyxl's write-only mode, which
+        flushes rows to a temporary file as they are appended, and is then
+        streamed back from disk.
+
+        Parameters
+        ----------
+        sections : Iterable
+            Same tuples as accepted by :meth:`export_csv`.
+
+        Returns
+        -------
+        django.http.FileResponse
+            The workbook as an attachment named after :attr:`filename`.
+        """
+        workbook = Workbook(write_only=True)
+        for title, headers, rows, row_func in sections:
+            sheet = workbook.create_sheet(title[:31])
+            sheet.append(list(headers))
+            for row in iterate_rows(rows):
+                sheet.append(list(row_func(row)))
+
+        output = TemporaryFile()
+        workbook.save(output)
+        output.seek(0)
+        return FileResponse(
+            output,
+            as_attachment=True,
+            filename=f"{Path(self.filename).stem}.xlsx",
+            content_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        )
+
 class AdminWriteJSON(admin.ModelAdmin):
     """Mixin to add a JSON export action to admin classes."""
 
@@ -628,6 +891,11 @@ class AdminPopulateForm(forms.Form):
             help_text=self.file_help_text,
             widget=forms.ClearableFileInput(attrs=widget_attrs)
         )
+        self.fields["validate_only"] = forms.BooleanField(
+            label="Validate only",
+            help_text="Check every row and report the problems without saving anything.",
+            required=False,
+        )
 
     def clean(self):
         """Validate the uploaded file and ensure allowed extension.
@@ -655,8 +923,8 @@ class AdminPopulateForm(forms.Form):
 @admin.register(Nationality)
 class NationalityAdmin(AdminPagination, AdminPopulate, AdminSave, AdminDelete):
     """Admin for the :class:`bookprocess.models.Nationality` lookup model."""
-    list_display = ('name', 'code') #: Fields shown in the changelist (``name``, ``code``).
-    search_fields = list_display #: Fields used for search.
+    list_display = ('name', 'code', 'author_count') #: Fields shown in the changelist (``name``, ``code``, ``author_count``).
+    search_fields = ('name', 'code') #: Fields used for search.
     populate_command_class = NationalityCmd #: Management command used to populate nationality data.
 
 ############################
@@ -665,8 +933,8 @@ class NationalityAdmin(AdminPagination, AdminPopulate, AdminSave, AdminDelete):
 @admin.register(Genre)
 class GenreAdmin(AdminPagination, AdminPopulate, AdminSave, AdminDelete):
     """Admin for the :class:`bookprocess.models.Genre` lookup model."""
-    list_display = ('name',) #: Fields shown in the changelist (``name``).
-    search_fields = list_display #: Fields used for search.
+    list_display = ('name', 'book_count') #: Fields shown in the changelist (``name``, ``book_count``).
+    search_fields = ('name',) #: Fields used for search.
     populate_command_class = GenreCmd #: Management command used to populate genre data.
 
 ############################
@@ -674,7 +942,7 @@ class GenreAdmin(AdminPagination, AdminPopulate, AdminSave, AdminDelete):
 ############################
 admin.site.unregister(LogEntry)
 @admin.register(LogEntry)
-class LogEntryAdmin(AdminWriteJSON):
+class LogEntryAdmin(AdminEstimatedCount, AdminWriteJSON):
     """Admin for audit log entries with helper formatters."""
     list_display = ("formatted_timestamp", "actor", "action", "object_repr", "changes_formatted") #: Standard Django admin option for list display and filtering.
     list_filter = ("action", "actor") #: Standard Django admin option for list display and filtering.
@@ -786,73 +1054,189 @@ class StatisticAdmin(AdminCount, AdminWriteCSV):
     """Admin used to display aggregated site statistics."""
 
     change_list_template = "admin/admin_statistics_changelist.html" #: Template used to render the statistics changelist.
+    author_stats_top = 10 #: Authors shown in the summary table and chart of the changelist.
+    author_stats_page_size = 50 #: Default page size of the author statistics endpoint.
+    author_stats_max_page_size = 500 #: Largest page size a client may request.
+    author_stats_sorts = {
+        "author": ("last_name", "first_name"),
+        "total_books": ("book_count",),
+        "solo_books": ("solo_book_count",),
+        "coauthored_books": ("coauthored_book_count",),
+    } #: Sort keys accepted by the author statistics endpoint and the columns they order by.
+    trend_days = 90 #: Default number of days shown by the trend charts.
+    max_trend_days = 3650 #: Longest period accepted from ``?days=``.
+    trend_periods = (7, 30) #: Periods, in days, of the period-over-period deltas.
+    trend_genres = 5 #: Largest genres (in the latest snapshot) charted individually.
 
     def get_books_per_genre(self):
         """Return counts of books grouped by genre name.
 
+        Reads the ``Genre.book_count`` counter cache.
+
         Returns
         -------
         django.db.models.query.QuerySet
-            QuerySet of dicts with keys ``genre__name`` and ``count``.
+            QuerySet of dicts with keys ``name`` and ``count``.
         """
-        return self.aggregate_count(Book, "genre__name")
+        return Genre.objects.filter(book_count__gt=0).order_by("-book_count").values("name", count=F("book_count"))
 
     def get_authors_per_nationality(self):
         """Return counts of authors grouped by nationality name.
 
+        Reads the ``Nationality.author_count`` counter cache.
+
         Returns
         -------
         django.db.models.query.QuerySet
-            QuerySet of dicts with keys ``nationality__name`` and ``count``.
+            QuerySet of dicts with keys ``name`` and ``count``.
         """
-        return self.aggregate_count(Author, "nationality__name")
+        return (
+            Nationality.objects.filter(author_count__gt=0)
+            .order_by("-author_count")
+            .values("name", count=F("author_count"))
+        )
 
-    def get_author_stats(self):
-        """Compute per-author statistics for solo and co-authored books.
+    def get_author_stats(self, search="", sort="author"):
+        """Return per-author statistics for solo and co-authored books.
 
-        The function annotates authors with counts of books where they are the
-        sole author and counts where the book has more than one author.
+        Reads the ``book_count``, ``solo_book_count`` and
+        ``coauthored_book_count`` counter caches of :class:`Author`, which
+        are indexed, so sorting and slicing the result is done by the
+        database. The queryset is lazy, so exports can stream it with
+        ``.iterator()``.
+
+        Parameters
+        ----------
+        search : str, optional
+            Words that must each appear in the first or last name.
+        sort : str, optional
+            Key of :attr:`author_stats_sorts`, prefixed with ``-`` for
+            descending order. Unknown keys sort by author.
 
         Returns
         -------
-        list
-            List of dictionaries in the form ``{"author": str, "solo_books": int, "coauthored_books": int}``.
+        django.db.models.query.QuerySet
+            QuerySet of dicts in the form ``{"id": int, "author": str,
+            "total_books": int, "solo_books": int, "coauthored_books": int}``.
+        """
+        descending = sort.startswith("-")
+        columns = self.author_stats_sorts.get(sort.lstrip("-"), self.author_stats_sorts["author"])
+        ordering = [f"-{c}" if descending else c for c in columns] + ["-pk" if descending else "pk"]
+
+        queryset = Author.objects.all()
+        for word in search.split():
+            queryset = queryset.filter(Q(first_name__icontains=word) | Q(last_name__icontains=word))
+        return queryset.order_by(*ordering).values(
+            "id",
+            author=Concat("first_name", Value(" "), "last_name"),
+            total_books=F("book_count"),
+            solo_books=F("solo_book_count"),
+            coauthored_books=F("coauthored_book_count"),
+        )
+
+    def get_trends(self, days):
+        """Return the snapshot time series and deltas for the changelist.
+
+        Everything is read from :class:`Statistic` snapshots, one row per
+        day, so the cost depends on the number of days shown only.
+
+        Parameters
+        ----------
+        days : int
+            Number of days to chart.
+
+        Returns
+        -------
+        dict
+            ``series`` (chart data: ``dates``, ``books``, ``authors``,
+            ``adaptation`` in percent and per-genre ``genres``) and
+            ``deltas``, a list of ``(period, deltas)`` pairs as returned by
+            :meth:`bookprocess.models.StatisticManager.deltas`.
         """
-        books_with_author_count = Book.objects.annotate(num_authors=Count('authors'))
+        snapshots = list(Statistic.objects.trend(days))
+        latest = snapshots[-1].books_per_genre if snapshots else {}
+        top_genres = sorted(latest, key=lambda name: -latest[name])[:self.trend_genres]
+        series = {
+            "dates": [f"{s.date:%Y-%m-%d}" for s in snapshots],
+            "books": [s.total_books for s in snapshots],
+            "authors": [s.total_authors for s in snapshots],
+            "adaptation": [round(s.adaptation_ratio * 100, 1) for s in snapshots],
+            "genres": {name: [s.books_per_genre.get(name, 0) for s in snapshots] for name in top_genres},
+        }
+        deltas = [(period, Statistic.objects.deltas(period)) for period in self.trend_periods]
+        return {"series": series, "deltas": [(period, d) for period, d in deltas if d]}
 
-        authors_stats_qs = Author.objects.annotate(
-            solo_books=Sum(
-                Case(
-                    When(books__in=books_with_author_count.filter(num_authors=1), then=1),
-                    default=0,
-                    output_field=IntegerField()
-                )
+    def get_urls(self):
+        """Return admin URLs, prepending the author statistics endpoint.
+
+        Returns
+        -------
+        list
+            List of URL patterns for this admin.
+        """
+        opts = self.model._meta
+        return [
+            path(
+                "author-stats/",
+                self.admin_site.admin_view(self.author_stats_view),
+                name=f"{opts.app_label}_{opts.model_name}_author_stats",
             ),
-            coauthored_books=Sum(
-                Case(
-                    When(books__in=books_with_author_count.filter(num_authors__gt=1), then=1),
-                    default=0,
-                    output_field=IntegerField()
-                )
-            )
-        )
+        ] + super().get_urls()
 
-        author_stats = [
-            {
-                "author": str(author),
-                "solo_books": author.solo_books or 0,
-                "coauthored_books": author.coauthored_books or 0,
-            }
-            for author in authors_stats_qs
-        ]
-        return author_stats
+    def author_stats_view(self, request):
+        """Return one page of the author statistics as JSON.
+
+        Accepts ``q`` (search words), ``sort`` (see
+        :attr:`author_stats_sorts`), ``page`` and ``page_size`` query
+        parameters.
+
+        Parameters
+        ----------
+        request : django.http.HttpRequest
+            The current request.
+
+        Returns
+        -------
+        django.http.JsonResponse
+            ``count``, ``page``, ``num_pages``, ``page_size``, ``sort`` and
+            the ``results`` of the requested page.
+
+        Raises
+        ------
+        django.core.exceptions.PermissionDenied
+            When the user may not view statistics.
+        """
+        if not self.has_view_permission(request):
+            raise PermissionDenied
+
+        sort = request.GET.get("sort", "author")
+        if sort.lstrip("-") not in self.author_stats_sorts:
+            sort = "author"
+        try:
+            page_size = int(request.GET.get("page_size", self.author_stats_page_size))
+        except ValueError:
+            page_size = self.author_stats_page_size
+        page_size = min(max(page_size, 1), self.author_stats_max_page_size)
+
+        paginator = Paginator(self.get_author_stats(request.GET.get("q", ""), sort), page_size)
+        page = paginator.get_page(request.GET.get("page"))
+        return JsonResponse({
+            "count": paginator.count,
+            "page": page.number,
+            "num_pages": paginator.num_pages,
+            "page_size": page_size,
+            "sort": sort,
+            "results": list(page.object_list),
+        })
 
     def changelist_view(self, request, extra_context=None):
         """Render the custom statistics changelist view.
 
         This view prepares multiple statistic sections (books per genre,
-        authors per nationality and per-author stats) and injects them into
-        the changelist template. Supports CSV export via ``?export=csv``.
+        authors per nationality and per-author stats) and the snapshot
+        trends of the last ``?days=`` days and injects them into the
+        changelist template. Supports CSV and XLSX exports via
+        ``?export=csv`` and ``?export=xlsx``.
 
         Parameters
         ----------
@@ -873,19 +1257,32 @@ class StatisticAdmin(AdminCount, AdminWriteCSV):
         author_stats = self.get_author_stats()
 
         sections = [
-            ("Books per Genre", ["Genre", "Count"], books_per_genre, lambda r: (r["genre__name"], r["count"])),
-            ("Authors per Nationality", ["Nationality", "Count"], authors_per_nationality, lambda r: (r["nationality__name"], r["count"])),
+            ("Books per Genre", ["Genre", "Count"], books_per_genre, lambda r: (r["name"], r["count"])),
+            ("Authors per Nationality", ["Nationality", "Count"], authors_per_nationality, lambda r: (r["name"], r["count"])),
             ("Author Statistics", ["Author", "Solo Books", "Co-authored Books"], author_stats, lambda r: (r["author"], r["solo_books"], r["coauthored_books"])),
         ]
 
-        if request.GET.get("export") == "csv":
+        export = request.GET.get("export")
+        if export == "csv":
             return self.export_csv(sections)
+        if export == "xlsx":
+            return self.export_xlsx(sections)
 
+        opts = self.model._meta
         stats = {
-            "books_per_genre": self.get_books_per_genre(),
-            "authors_per_nationality": self.get_authors_per_nationality(),
-            "author_stats": self.get_author_stats(),
+            "books_per_genre": books_per_genre,
+            "authors_per_nationality": authors_per_nationality,
+            "author_stats": self.get_author_stats(sort="-total_books")[:self.author_stats_top],
+            "author_stats_url": reverse(f"admin:{opts.app_label}_{opts.model_name}_author_stats"),
         }
+        params = request.GET.copy()
+        try:
+            days = min(max(int(params.pop("days", [self.trend_days])[-1]), 1), self.max_trend_days)
+        except ValueError:
+            days = self.trend_days
+        request.GET = params
+        trends = self.get_trends(days)
+        stats.update(trend_days=days, trend_series=trends["series"], trend_deltas=trends["deltas"])
         extra_context.update(stats)
 
         return super().changelist_view(request, extra_context=extra_context)
@@ -1033,7 +1430,7 @@ class AuthorPopulateForm(AdminPopulateForm):
 class AuthorAdmin(AdminPagination, AdminPopulate, AdminSave, AdminDelete):
     """Admin for the :class:`bookprocess.models.Author` model."""
     inlines = [AuthorBookInLine] #: Inline admin classes shown on the author change view (e.g. book list).
-    list_display = ('name', 'nationality') #: Columns shown in the changelist.
+    list_display = ('name', 'nationality', 'book_count', 'solo_book_count', 'coauthored_book_count') #: Columns shown in the changelist.
     search_fields = ('first_name', 'last_name') #: Fields used for search in the changelist.
     list_filter = (
         ('nationality', RelatedDropdownFilter),
@@ -1041,28 +1438,65 @@ class AuthorAdmin(AdminPagination, AdminPopulate, AdminSave, AdminDelete):
     populate_form_class = AuthorPopulateForm #: Form class used to upload author import files.
     populate_command_class = AuthorsCmd #:  Management command used to import author data.
 
-    def get_readonly_fields(self, request, obj=None):
-        """Return read-only fields for the Author admin.
+    def get_search_results(self, request, queryset, search_term):
+        """Search the author pickers by name prefix on the normalized name index.
+
+        Requests of the admin autocomplete endpoint behind the author
+        pickers go through :meth:`bookprocess.models.AuthorManager.search`,
+        whose result the endpoint pages through in index order. The
+        changelist keeps the substring search over :attr:`search_fields`.
+
+        Parameters
+        ----------
+        request : django.http.HttpRequest
+            The current request.
+        queryset : django.db.models.query.QuerySet
+            Authors to search.
+        search_term : str
+            Text typed by the user.
+
+        Returns
+        -------
+        tuple
+            ``(queryset, may_have_duplicates)`` as expected by the admin.
+        """
+        match = request.resolver_match
+        if match is not None and match.url_name == "autocomplete":
+            return Author.objects.search(search_term, queryset), False
+        return super().get_search_results(request, queryset, search_term)
 
-        If the author is the primary author on any book, prevent changing
-        the ``nationality`` via the admin to preserve data consistency.
+    def save_model(self, request, obj, form, change):
+        """Save the author and re-allocate ISBNs after a nationality change.
+
+        The books the author is first on carry the old nationality in
+        their ISBN country segment; they are renumbered through
+        :meth:`bookprocess.services.BookBulkService.schedule_author_isbn_reallocation`,
+        in the background for prolific authors.
 
         Parameters
         ----------
         request : django.http.HttpRequest
             The current request.
         obj : Author
-            The instance being viewed/edited (None on add form).
+            The instance being saved.
+        form : django.forms.ModelForm
+            The validated admin form.
+        change : bool
+            True if updating an existing object, False for creation.
 
         Returns
         -------
-        list
-            A list of field names that should be read-only.
+        None
         """
-        readonly = list(super().get_readonly_fields(request, obj))
-        if obj and obj.books.filter(bookauthor__order=1).exists():
-            readonly.append('nationality')
-        return readonly
+        super().save_model(request, obj, form, change)
+        if not change or "nationality" not in form.changed_data:
+            return
+
+        renumbered = BookBulkService.schedule_author_isbn_reallocation(request.user, obj)
+        if renumbered is None:
+            self.message_user(request, f"The ISBNs of {obj}'s books are being re-allocated in the background.", messages.INFO)
+        elif renumbered:
+            self.message_user(request, f"Re-allocated the ISBNs of {renumbered} book(s) by {obj}.", messages.SUCCESS)
 
     def name(self, obj):
         """Return a human-friendly name for the author instance.
@@ -1083,6 +1517,48 @@ class AuthorAdmin(AdminPagination, AdminPopulate, AdminSave, AdminDelete):
         return obj.name()
     name.admin_order_field = 'first_name'
 
+@admin.register(IsbnReallocation)
+class IsbnReallocationAdmin(admin.ModelAdmin):
+    """Read-only admin listing the background ISBN re-allocations."""
+    list_display = ('author', 'status', 'renumbered', 'user', 'started_at', 'updated_at') #: Columns shown in the changelist.
+    list_filter = ('status',) #: Filters shown in the sidebar.
+    list_select_related = ('author', 'user') #: Related rows fetched with the changelist.
+    readonly_fields = ('author', 'user', 'status', 'renumbered', 'error', 'started_at', 'updated_at') #: Every field; runs are only written by the service.
+    actions = ['retry'] #: Custom admin actions.
+
+    def has_add_permission(self, request):
+        """Runs are only created by the service.
+
+        Parameters
+        ----------
+        request : django.http.HttpRequest
+            The current request.
+
+        Returns
+        -------
+        bool
+            Always ``False``.
+        """
+        return False
+
+    @admin.action(description="Retry selected failed re-allocations", permissions=["change"])
+    def retry(self, request, queryset):
+        """Admin action: start the selected failed re-allocations again.
+
+        Parameters
+        ----------
+        request : django.http.HttpRequest
+            The current request.
+        queryset : django.db.models.query.QuerySet
+            The selected runs.
+
+        Returns
+        -------
+        None
+        """
+        count = BookBulkService.retry_isbn_reallocations(request.user, queryset)
+        self.message_user(request, f"Re-allocation started again for {count} author(s).", messages.SUCCESS)
+
 ############################
 #        Book Classes      #
 ############################
@@ -1119,14 +1595,57 @@ class BookForm(forms.ModelForm):
         js = ("admin/js/admin_book_form_adapted_film_isbn_cover.js","admin/js/admin_book_form_authors.js") #: JavaScript files included for dynamic behavior in the admin form.
 
 class BookAddMultipleForm(forms.Form):
-    """Form for adding multiple books for the same author dynamically."""
+    """Form for adding multiple books for the same author dynamically.
+
+    The author is picked with the admin's autocomplete widget, which
+    renders only the selected author and loads matches page by page from
+    the :class:`AuthorAdmin` search, so the page does not grow with the
+    number of authors.
+    """
     author = forms.ModelChoiceField(
         queryset=Author.objects.all(),
         label="Select Author",
         required=True,
-        widget=forms.Select(attrs={'class': 'vForeignKeyRawIdAdminField'})
+        widget=AutocompleteSelect(BookAuthor._meta.get_field("author"), admin.site),
     ) #: The ModelChoiceField selecting the author to attach to created books.
 
+class BookGenreForm(forms.Form):
+    """Form choosing the genre selected books are moved to."""
+    genre = forms.ModelChoiceField(queryset=Genre.objects.all(), label="New genre") #: Target genre of the reassignment.
+
+class IsbnMismatchFilter(admin.SimpleListFilter):
+    """Changelist filter for books whose ISBN country no longer matches their first author."""
+    title = "ISBN country" #: Filter title shown in the sidebar.
+    parameter_name = "isbn_country" #: GET parameter used by the filter.
+
+    def lookups(self, request, model_admin):
+        """Return the filter choices.
+
+        Returns
+        -------
+        tuple
+            ``(value, label)`` pairs.
+        """
+        return (("mismatch", "Does not match first author"),)
+
+    def queryset(self, request, queryset):
+        """Restrict ``queryset`` to mismatched books when selected.
+
+        Parameters
+        ----------
+        request : django.http.HttpRequest
+            The current request.
+        queryset : django.db.models.query.QuerySet
+            The changelist queryset.
+
+        Returns
+        -------
+        django.db.models.query.QuerySet
+        """
+        if self.value() == "mismatch":
+            return Book.objects.isbn_mismatches(queryset)
+        return queryset
+
 class BookAuthorInline(SortableInlineAdminMixin, admin.TabularInline):
     """Inline admin for the BookAuthor through-model.
 
@@ -1177,7 +1696,9 @@ class BookAdmin(SortableAdminBase, AdminPagination, AdminPopulate, AdminDelete):
     search_fields = ('title', 'isbn', 'bookauthor__author__first_name', 'bookauthor__author__last_name') #: Fields used in changelist search.
     list_filter = (
         ('genre', RelatedDropdownFilter),
+        ('primary_nationality', RelatedDropdownFilter),
         ('adapted', DropdownFilter),
+        IsbnMismatchFilter,
     ) #: Filters displayed in the changelist.
     readonly_fields = ('isbn', 'cover_preview') #:  Read-only fields in the change view.
     fieldsets = (
@@ -1193,7 +1714,10 @@ class BookAdmin(SortableAdminBase, AdminPagination, AdminPopulate, AdminDelete):
     multiple_button = "Add multiple books for the same author" #: Label for the multiple-add action button.
     populate_form_class = BookPopulateForm #: Populate form class used for importing books.
     populate_command_class = BookCmd #: Management command used for population imports.
-    is_zip_file = True #: When True the populate view expects a ZIP containing an Excel file.
+    is_zip_file = True #: When True the populate view expects a ZIP containing an Excel file and its covers.
+    actions = [
+        'export_as_import_bundle', 'reassign_genre', 'regenerate_isbns', 'regenerate_mismatched_isbns',
+    ] #: Admin actions available on the changelist.
 
     def display_authors(self, obj):
         """Return a comma-separated list of the book's authors for display.
@@ -1212,6 +1736,110 @@ class BookAdmin(SortableAdminBase, AdminPagination, AdminPopulate, AdminDelete):
         return ", ".join(str(a) for a in authors) if authors else "—"
     display_authors.short_description = "Authors"
 
+    @admin.action(description="Export selected books as import ZIP")
+    def export_as_import_bundle(self, request, queryset):
+        """Admin action: download the selected books as an import bundle.
+
+        The ZIP is written to a temporary file and streamed back, so it
+        can be imported again with the populate view.
+
+        Parameters
+        ----------
+        request : django.http.HttpRequest
+            The current request.
+        queryset : django.db.models.query.QuerySet
+            The selected books.
+
+        Returns
+        -------
+        django.http.FileResponse
+            The ZIP bundle as an attachment.
+        """
+        bundle = TemporaryFile()
+        write_export_bundle(bundle, queryset)
+        bundle.seek(0)
+        return FileResponse(bundle, as_attachment=True, filename="books.zip", content_type="application/zip")
+
+    @admin.action(description="Move selected books to another genre", permissions=["change"])
+    def reassign_genre(self, request, queryset):
+        """Admin action: move the selected books to a chosen genre.
+
+        The first request renders a confirmation page asking for the
+        genre; its submission updates all books with
+        :meth:`bookprocess.services.BookBulkService.reassign_genre`.
+
+        Parameters
+        ----------
+        request : django.http.HttpRequest
+            The current request.
+        queryset : django.db.models.query.QuerySet
+            The selected books.
+
+        Returns
+        -------
+        django.http.HttpResponse or None
+            The confirmation page, or ``None`` to return to the changelist.
+        """
+        form = BookGenreForm(request.POST if "apply" in request.POST else None)
+        if form.is_valid():
+            genre = form.cleaned_data["genre"]
+            moved = BookBulkService.reassign_genre(request.user, queryset, genre)
+            self.message_user(request, f"Moved {moved} book(s) to '{genre}'.", messages.SUCCESS)
+            return None
+
+        context = self.admin_site.each_context(request)
+        context.update({
+            "title": "Move books to another genre",
+            "opts": self.model._meta,
+            "form": form,
+            "count": queryset.count(),
+            "selected": request.POST.getlist(ACTION_CHECKBOX_NAME),
+            "action": "reassign_genre",
+            "action_checkbox_name": ACTION_CHECKBOX_NAME,
+            "select_across": request.POST.get("select_across", "0"),
+        })
+        return render(request, "admin/admin_book_reassign_genre.html", context)
+
+    @admin.action(description="Regenerate ISBNs of selected books", permissions=["change"])
+    def regenerate_isbns(self, request, queryset):
+        """Admin action: give the selected books new ISBNs.
+
+        Parameters
+        ----------
+        request : django.http.HttpRequest
+            The current request.
+        queryset : django.db.models.query.QuerySet
+            The selected books.
+
+        Returns
+        -------
+        None
+        """
+        renumbered = BookBulkService.regenerate_isbns(request.user, queryset)
+        self.message_user(request, f"Regenerated {renumbered} ISBN(s).", messages.SUCCESS)
+
+    @admin.action(description="Regenerate ISBNs that do not match the first author", permissions=["change"])
+    def regenerate_mismatched_isbns(self, request, queryset):
+        """Admin action: renumber the books whose ISBN country is stale.
+
+        Only the selected books whose ISBN country segment differs from
+        their first author's nationality are changed; select all books
+        to fix the whole catalog.
+
+        Parameters
+        ----------
+        request : django.http.HttpRequest
+            The current request.
+        queryset : django.db.models.query.QuerySet
+            The selected books.
+
+        Returns
+        -------
+        None
+        """
+        renumbered = BookBulkService.regenerate_isbns(request.user, Book.objects.isbn_mismatches(queryset))
+        self.message_user(request, f"Regenerated {renumbered} mismatched ISBN(s).", messages.SUCCESS)
+
     def cover_preview(self, obj):
         """Return HTML for a clickable cover preview image.
 
@@ -1313,8 +1941,12 @@ class BookAdmin(SortableAdminBase, AdminPagination, AdminPopulate, AdminDelete):
                 AuditLogService.log_book_update(request.user, book, changes)
 
     def _save_authors_from_formset(self, formset):
-        """Marks objects as ``_from_admin`` prior to saving so
-        downstream hooks can differentiate admin-created relations.
+        """Replace the book's author list with the inline rows in one batch.
+
+        Rows are sorted by the hidden ``order`` field maintained by
+        adminsortable2 (new rows without an order go last) and written
+        through :meth:`bookprocess.models.BookAuthorManager.replace`, so a
+        reorder costs one ``bulk_update`` rather than one save per row.
 
         Parameters
         ----------
@@ -1325,16 +1957,26 @@ class BookAdmin(SortableAdminBase, AdminPagination, AdminPopulate, AdminDelete):
         -------
         None
         """
-        instances = formset.save(commit=False)
-        for instance in instances:
-            instance._from_admin = True
-            instance.save()
-
-        for obj in formset.deleted_objects:
-            obj._from_admin = True
-            obj.delete()
-
-        formset.save_m2m()
+        rows = []
+        for position, inline_form in enumerate(formset.forms):
+            data = getattr(inline_form, "cleaned_data", None)
+            if not data or data.get("DELETE") or not data.get("author"):
+                continue
+            order = data.get("order") or 0
+            rows.append((order if order > 0 else float("inf"), position, data["author"]))
+
+        rows.sort(key=lambda row: row[:2])
+        links = BookAuthor.objects.replace(formset.instance, [author for _, _, author in rows])
+
+        kept = {link.pk for link in links}
+        initial = {inline_form.instance.pk: inline_form for inline_form in formset.initial_forms}
+        formset.new_objects = [link for link in links if link.pk not in initial]
+        formset.changed_objects = [
+            (inline_form.instance, inline_form.changed_data)
+            for pk, inline_form in initial.items()
+            if pk in kept and inline_form.has_changed()
+        ]
+        formset.deleted_objects = [inline_form.instance for pk, inline_form in initial.items() if pk not in kept]
 
     def _finalize_book_creation(self, user, book):
         """Generate an ISBN for a newly created Book and emit a CREATE log.
@@ -1373,19 +2015,11 @@ class BookAdmin(SortableAdminBase, AdminPagination, AdminPopulate, AdminDelete):
         -------
         None
         """
-        first_author_rel = (
-            book.bookauthor_set.order_by('order')
-            .select_related('author__nationality')
-            .first()
-        )
-        if not first_author_rel:
+        if not book.primary_nationality_id:
             return
 
-        author = first_author_rel.author
-        nat = getattr(author, "nationality", None)
-
         from .utils import _normalize_nat_code
-        nat_code_current = _normalize_nat_code(getattr(nat, "code", None)) if nat else ""
+        nat_code_current = _normalize_nat_code(book.primary_nationality.code)
 
         if not book.isbn:
             new_isbn = book.generate_isbn()
@@ -1463,10 +2097,62 @@ class BookAdmin(SortableAdminBase, AdminPagination, AdminPopulate, AdminDelete):
         list
             List of URL patterns for this admin.
         """
+        opts = self.model._meta
         return [
-            path("multiple/", self.admin_site.admin_view(self.add_multiple_books_view)),
+            path("multiple/", self.upload_view(self.add_multiple_books_view, MAX_COVER_SIZE, MAX_COVERS_UPLOAD_SIZE)),
+            path(
+                "<path:object_id>/as-of/",
+                self.admin_site.admin_view(self.book_as_of_view),
+                name=f"{opts.app_label}_{opts.model_name}_as_of",
+            ),
         ] + super().get_urls()
 
+    def book_as_of_view(self, request, object_id):
+        """Show a book as it was at the timestamp given by ``?as_of=``.
+
+        The state is rebuilt from the audit trail by
+        :meth:`bookprocess.services.BookHistoryService.book_as_of`, so it also
+        works for books that were deleted since.
+
+        Parameters
+        ----------
+        request : django.http.HttpRequest
+            The incoming request.
+        object_id : str
+            Primary key of the book.
+
+        Returns
+        -------
+        django.http.HttpResponse
+            Rendered page with the reconstructed fields.
+
+        Raises
+        ------
+        django.core.exceptions.PermissionDenied
+            When the user may not view books.
+        """
+        if not self.has_view_permission(request):
+            raise PermissionDenied
+
+        raw_as_of = request.GET.get("as_of", "").strip()
+        as_of = parse_as_of(raw_as_of) if raw_as_of else None
+
+        if raw_as_of and as_of is None:
+            messages.error(request, f"Invalid date: {raw_as_of}")
+
+        state = BookHistoryService.book_as_of(object_id, as_of) if as_of else None
+
+        context = self.admin_site.each_context(request)
+        context.update({
+            "title": f"Book {object_id} as of {as_of:%Y-%m-%d %H:%M:%S}" if as_of else f"Book {object_id} as of…",
+            "opts": self.model._meta,
+            "object_id": object_id,
+            "as_of": raw_as_of,
+            "searched": as_of is not None,
+            "state": sorted(state.items()) if state else None,
+        })
+        return render(request, "admin/admin_book_as_of.html", context)
+
     def add_multiple_books_view(self, request):
         """Handle the add-multiple-books admin view.
 
@@ -1491,6 +2177,11 @@ class BookAdmin(SortableAdminBase, AdminPagination, AdminPopulate, AdminDelete):
         """Validates the form, creates Book instances and associated
         BookAuthor relations and shows a summary message.
 
+        Every entry is validated before anything is written; the books
+        are then created together by
+        :meth:`bookprocess.services.BookBulkService.create_books`, so a
+        failure leaves no partial data behind.
+
         Parameters
         ----------
         request : django.http.HttpRequest
@@ -1507,104 +2198,68 @@ class BookAdmin(SortableAdminBase, AdminPagination, AdminPopulate, AdminDelete):
             return self._render_multiple_books_form(request, form)
 
         author = form.cleaned_data["author"]
-        books_created = self._create_books_from_post_data(request, author)
+        rows, errors = self._collect_books_from_post(request)
+        errors = getattr(request, "upload_errors", []) + errors
+        if errors:
+            for error in errors:
+                form.add_error(None, error)
+            return self._render_multiple_books_form(request, form)
+
+        try:
+            books = BookBulkService.create_books(request.user, author, rows)
+        except IntegrityError:
+            form.add_error(None, "An ISBN allocated for these books was taken meanwhile; please submit again.")
+            return self._render_multiple_books_form(request, form)
 
-        self._show_creation_message(request, books_created, author)
+        self._show_creation_message(request, len(books), author)
         return HttpResponseRedirect("../")
 
-    def _create_books_from_post_data(self, request, author):
-        """Loop through POSTed book entries and create Book objects.
+    def _collect_books_from_post(self, request):
+        """Read and validate every POSTed book entry before anything is saved.
+
+        Entries without a title are skipped; the genres of all entries are
+        loaded with one query.
 
         Parameters
         ----------
         request : django.http.HttpRequest
             The request containing POST data and FILES.
-        author : Author
-            The author to attach as the primary author to each created book.
 
         Returns
         -------
-        int
-            Number of successfully created books.
+        tuple
+            ``(rows, errors)``: keyword arguments for :class:`Book`, one
+            dict per entry, and the messages of invalid entries.
         """
-        books_created = 0
+        entries = []
         index = 0
-
         while f"book_{index}_title" in request.POST:
-            created = self._create_single_book_from_post(request, index, author)
-            if created:
-                books_created += 1
+            title = request.POST.get(f"book_{index}_title", "").strip()
+            if title:
+                entries.append((index, title))
             index += 1
 
-        return books_created
-
-    def _create_single_book_from_post(self, request, index, author):
-        """Create a single Book from indexed POST fields.
-
-        Parameters
-        ----------
-        request : django.http.HttpRequest
-            The request with POST data and FILES.
-        index : int
-            The index used to locate the set of fields for this book.
-        author : Author
-            The primary author to associate with the created Book.
-
-        Returns
-        -------
-        bool
-            True when the book was created, False when required fields
-            were missing.
-        """
-        title = request.POST.get(f"book_{index}_title", "").strip()
-        if not title:
-            return False
-
-        book_data = self._extract_book_data_from_post(request, index)
-
-        with disable_auditlog():
-            book = Book.objects.create(**book_data)
-            BookAuthor.objects.create(book=book, author=author, order=0)
-
-            new_isbn = book.generate_isbn()
-            if new_isbn:
-                book.isbn = new_isbn
-                book.save(update_fields=["isbn"])
-
-        AuditLogService.log_book_creation(request.user, book)
-
-        return True
-
-    def _extract_book_data_from_post(self, request, index):
-        """Extract a book's fields from POST using the given index.
-
-        Parameters
-        ----------
-        request : django.http.HttpRequest
-            The request containing POST and FILES.
-        index : int
-            The index used to construct field names.
-
-        Returns
-        -------
-        dict
-            Keyword args suitable for ``Book.objects.create(**kwargs)``.
-        """
-        genre_id = request.POST.get(f"book_{index}_genre")
-        adapted = request.POST.get(f"book_{index}_adapted") == "on"
-
-        try:
-            genre = Genre.objects.get(id=genre_id) if genre_id else None
-        except Genre.DoesNotExist:
-            genre = None
-
-        return {
-            "title": request.POST.get(f"book_{index}_title", "").strip(),
-            "genre": genre,
-            "adapted": adapted,
-            "film_title": request.POST.get(f"book_{index}_film_title", "").strip() if adapted else None,
-            "cover": request.FILES.get(f"book_{index}_cover")
-        }
+        genre_ids = {request.POST.get(f"book_{index}_genre", "") for index, _ in entries}
+        genres = Genre.objects.in_bulk([pk for pk in genre_ids if pk.isdigit()])
+        max_title = Book._meta.get_field("title").max_length
+
+        rows, errors = [], []
+        for index, title in entries:
+            genre_id = request.POST.get(f"book_{index}_genre", "")
+            genre = genres.get(int(genre_id)) if genre_id.isdigit() else None
+            if genre is None:
+                errors.append(f"Book {index + 1} ('{title}'): choose a valid genre.")
+            if max_title and len(title) > max_title:
+                errors.append(f"Book {index + 1}: the title is longer than {max_title} characters.")
+            adapted = request.POST.get(f"book_{index}_adapted") == "on"
+            rows.append({
+                "title": title,
+                "genre": genre,
+                "adapted": adapted,
+                "film_title": request.POST.get(f"book_{index}_film_title", "").strip() if adapted else None,
+                "cover": request.FILES.get(f"book_{index}_cover"),
+            })
+        return rows, errors
 
     def _show_creation_message(self, request, books_created, author):
         """Display a success or warning message after attempting creation.
@@ -11,3 +11,12 @@ class BookprocessConfig(AppConfig):
     """Application configuration for the ``bookprocess`` Django app. """
     default_auto_field = 'django.db.models.BigAutoField' #: The default type for automatically generated primary key fields.
     name = 'bookprocess' #: The Python path to the application package. Django uses this to look up the module.
+
+    def ready(self):
+        """Connect the app's signal handlers.
+
+        Returns
+        -------
+        None
+        """
+        from . import signals  # noqa: F401
@@ -0,0 +1,170 @@
+"""Read import spreadsheets and cover images straight from a ZIP upload.
+
+The book importer accepts a ZIP holding one ``*.xlsx`` sheet next to the
+cover images it references. Instead of extracting the archive to disk,
+:class:`ImportArchive` opens members on demand so every cover is streamed
+from the archive into storage exactly once.
+
+The central directory is checked before anything is read: too many
+members, a too large total uncompressed size or an implausible
+compression ratio reject the archive. ``zipfile`` never yields more than
+a member's declared size, so the checked totals also bound what is read.
+"""
+
+from io import BytesIO
+from posixpath import dirname, join, normpath
+from zipfile import BadZipFile, ZipFile
+
+MAX_MEMBERS = 20000 #: Maximum number of members accepted in one archive.
+MAX_UNCOMPRESSED_SIZE = 8 * 1024 ** 3 #: Maximum total uncompressed size in bytes.
+MAX_MEMBER_SIZE = 64 * 1024 ** 2 #: Maximum uncompressed size of a single member in bytes.
+MAX_COMPRESSION_RATIO = 100 #: Maximum uncompressed/compressed ratio of a single member.
+
+
+class ImportArchive:
+    """A validated, read-only view over an import ZIP.
+
+    Use as a context manager; the underlying ``ZipFile`` is closed on
+    exit.
+
+    Parameters
+    ----------
+    path : str or pathlib.Path or file-like
+        The ZIP archive.
+
+    Raises
+    ------
+    ValueError
+        When the file is not a ZIP archive or exceeds one of the limits.
+    """
+
+    def __init__(self, path):
+        try:
+            self.zip = ZipFile(path, "r") #: The opened archive.
+        except BadZipFile as e:
+            raise ValueError(f"Not a valid ZIP archive: {e}") from e
+
+        try:
+            self._check_limits()
+        except ValueError:
+            self.zip.close()
+            raise
+
+        self.members = { #: Regular file members keyed by normalized name.
+            normpath(info.filename): info
+            for info in self.zip.infolist()
+            if not info.is_dir()
+        }
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Close the underlying archive.
+
+        Returns
+        -------
+        None
+        """
+        self.zip.close()
+
+    def _check_limits(self):
+        """Reject archives that would expand beyond the configured limits.
+
+        Raises
+        ------
+        ValueError
+            Naming the first limit that is exceeded.
+
+        Returns
+        -------
+        None
+        """
+        infos = self.zip.infolist()
+        if len(infos) > MAX_MEMBERS:
+            raise ValueError(f"ZIP has {len(infos)} members, the limit is {MAX_MEMBERS}.")
+
+        total = 0
+        for info in infos:
+            if info.file_size > MAX_MEMBER_SIZE:
+                raise ValueError(f"ZIP member '{info.filename}' is larger than {MAX_MEMBER_SIZE} bytes.")
+            if info.compress_size and info.file_size / info.compress_size > MAX_COMPRESSION_RATIO:
+                raise ValueError(f"ZIP member '{info.filename}' has a suspicious compression ratio.")
+            total += info.file_size
+            if total > MAX_UNCOMPRESSED_SIZE:
+                raise ValueError(f"ZIP expands to more than {MAX_UNCOMPRESSED_SIZE} bytes.")
+
+    def excel_member(self):
+        """Return the name of the first top-level ``*.xlsx`` member.
+
+        Returns
+        -------
+        str or None
+            Member name, or ``None`` when the archive holds no sheet.
+        """
+        names = sorted(
+            name for name in self.members
+            if "/" not in name and name.lower().endswith(".xlsx")
+        )
+        return names[0] if names else None
+
+    def read_excel_bytes(self, name):
+        """Load a spreadsheet member into memory.
+
+        Spreadsheet readers need random access, which a compressed member
+        stream does not offer cheaply; the sheet is small next to the
+        covers so it is buffered whole.
+
+        Parameters
+        ----------
+        name : str
+            Member name as returned by :meth:`excel_member`.
+
+        Returns
+        -------
+        io.BytesIO
+            The member contents.
+        """
+        return BytesIO(self.zip.read(self.members[name]))
+
+    def resolve(self, path, base=""):
+        """Map a cover path from the sheet onto an archive member.
+
+        Parameters
+        ----------
+        path : str
+            Path as written in the sheet, relative to the sheet.
+        base : str, optional
+            Member name of the sheet; ``path`` is resolved from its folder.
+
+        Returns
+        -------
+        str or None
+            The member name, or ``None`` when the path escapes the archive
+            or names no member.
+        """
+        path = path.replace("\\", "/")
+        if path.startswith("/"):
+            return None
+        name = normpath(join(dirname(base), path))
+        if name.startswith("../") or name == "..":
+            return None
+        return name if name in self.members else None
+
+    def open(self, name):
+        """Open a member for streaming reads.
+
+        Parameters
+        ----------
+        name : str
+            Member name as returned by :meth:`resolve`.
+
+        Returns
+        -------
+        zipfile.ZipExtFile
+            A readable, seekable stream of the member's contents.
+        """
+        return self.zip.open(self.members[name])
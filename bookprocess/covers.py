@@ -0,0 +1,112 @@
+"""Process imported cover images in a background thread pool.
+
+Reading, decoding and storing covers dominates the time of a large book
+import. :func:`prefetch_covers` runs that work for upcoming rows in a
+bounded ``ThreadPoolExecutor`` while the importer writes the current row
+to the database. Image decoding (Pillow), decompression (``zlib``) and
+file writes release the GIL, so threads overlap well with the database
+work without the pickling cost of a process pool.
+
+At most ``lookahead`` rows are in flight, which bounds the number of
+cover images held in memory at once.
+"""
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+from django.core.files.base import ContentFile
+from PIL import Image
+
+from bookprocess.models import Book
+
+COVER_WORKERS = 4 #: Default number of threads processing covers.
+
+
+def store_cover(open_cover, cover_path):
+    """Read, validate and store one cover image.
+
+    Parameters
+    ----------
+    open_cover : callable
+        Takes ``cover_path`` and returns ``(file name, stream)``, or
+        ``None`` when there is no such file.
+    cover_path : str
+        Cover path as written in the sheet.
+
+    Returns
+    -------
+    str or None
+        Storage name of the saved cover, or ``None`` when the file does
+        not exist.
+
+    Raises
+    ------
+    ValueError
+        When the file is not a readable image.
+    """
+    cover = open_cover(cover_path)
+    if cover is None:
+        return None
+
+    name, stream = cover
+    with stream:
+        data = stream.read()
+
+    try:
+        with Image.open(BytesIO(data)) as image:
+            image.verify()
+    except Exception as e:
+        raise ValueError(f"cover '{cover_path}' is not a valid image ({e})") from e
+
+    field = Book._meta.get_field("cover")
+    return field.storage.save(
+        field.generate_filename(None, name),
+        ContentFile(data),
+        max_length=field.max_length,
+    )
+
+
+def prefetch_covers(items, open_cover, max_workers=COVER_WORKERS, lookahead=None):
+    """Yield ``items`` in order, each joined with its processed cover.
+
+    Parameters
+    ----------
+    items : iterable of tuple
+        ``(item, cover_path)`` pairs; ``cover_path`` may be empty for
+        items without a cover.
+    open_cover : callable
+        Passed to :func:`store_cover`.
+    max_workers : int, optional
+        Number of worker threads.
+    lookahead : int, optional
+        Maximum number of items submitted ahead of the one being yielded.
+        Defaults to twice ``max_workers``.
+
+    Yields
+    ------
+    tuple
+        ``(item, stored_name, error)`` where ``stored_name`` is the
+        storage name of the cover (or ``None``) and ``error`` the exception
+        raised while processing it (or ``None``).
+    """
+    lookahead = lookahead or 2 * max_workers
+    pending = deque()
+
+    def finish(item, future):
+        if future is None:
+            return item, None, None
+        try:
+            return item, future.result(), None
+        except Exception as e:
+            return item, None, e
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="cover") as pool:
+        for item, cover_path in items:
+            future = pool.submit(store_cover, open_cover, cover_path) if cover_path else None
+            pending.append((item, future))
+            if len(pending) > lookahead:
+                yield finish(*pending.popleft())
+
+        while pending:
+            yield finish(*pending.popleft())
@@ -0,0 +1,292 @@
+"""Shared plumbing for the resumable spreadsheet importers.
+
+Importers read the whole sheet, then commit its rows in chunks. Each
+chunk is written in one transaction together with the progress of the
+run's :class:`~bookprocess.models.ImportRun`, so a crashed import can be
+resumed with ``--resume`` right after the last committed chunk: the
+committed rows are neither validated nor looked up again.
+
+Per-row messages are collected by an :class:`ImportResult` instead of
+being pushed one by one into Django's messages: it counts them by level,
+keeps a bounded sample and writes the full log to a CSV attached to the
+run, which the admin offers for download next to a one-line summary.
+"""
+
+from collections import Counter
+from csv import writer
+from hashlib import sha256
+from io import TextIOWrapper
+from itertools import islice
+from tempfile import TemporaryFile
+
+from django.core.files import File
+from django.db import transaction
+from django.utils import timezone
+from pandas.util import hash_pandas_object
+
+from bookprocess.models import ImportRun
+from bookprocess.signals import deferred_refresh
+from bookprocess.utils import notify
+
+IMPORT_CHUNK_SIZE = 500 #: Rows committed per transaction.
+RESULT_SAMPLE_SIZE = 10 #: Warning/error messages kept for the admin summary.
+RESULT_LEVELS = ("success", "info", "warning", "error") #: Message levels, in summary order.
+
+
+class ImportResult:
+    """Collect the messages of one import run.
+
+    While a command has a ``result`` attribute, :func:`bookprocess.utils.notify`
+    hands its messages to :meth:`add` instead of emitting them. From the
+    command line every message is still echoed to stdout; from the admin
+    only the summary is shown.
+
+    Parameters
+    ----------
+    command : django.core.management.base.BaseCommand
+        The running command.
+    sample_size : int, optional
+        Number of warning and error messages kept in :attr:`sample`.
+    """
+
+    def __init__(self, command, sample_size=RESULT_SAMPLE_SIZE):
+        self.command = command
+        self.sample_size = sample_size
+        self.counts = Counter() #: Number of messages per level.
+        self.sample = [] #: First ``(level, message)`` warnings and errors.
+        self.run = None #: The run the log was attached to by :meth:`finish`.
+        self._buffer = TemporaryFile()
+        self._text = TextIOWrapper(self._buffer, encoding="utf-8", newline="")
+        self._csv = writer(self._text)
+        self._csv.writerow(["time", "level", "message"])
+
+    def add(self, msg, level="info"):
+        """Record one message.
+
+        Parameters
+        ----------
+        msg : str
+            The message text.
+        level : str
+            One of :data:`RESULT_LEVELS`.
+
+        Returns
+        -------
+        None
+        """
+        self.counts[level] += 1
+        self._csv.writerow([timezone.now().isoformat(timespec="seconds"), level, msg])
+        if level in ("warning", "error") and len(self.sample) < self.sample_size:
+            self.sample.append((level, msg))
+        if getattr(self.command, "request", None) is None:
+            style_fn = getattr(self.command.style, level.upper(), self.command.style.SUCCESS)
+            self.command.stdout.write(style_fn(msg))
+
+    @property
+    def level(self):
+        """The most severe level recorded.
+
+        Returns
+        -------
+        str
+            ``"error"``, ``"warning"`` or ``"success"``.
+        """
+        for level in ("error", "warning"):
+            if self.counts[level]:
+                return level
+        return "success"
+
+    def summary(self):
+        """Return the one-line outcome summary.
+
+        Returns
+        -------
+        str
+            For example ``"Import finished: 120 success, 3 warning"``.
+        """
+        parts = [f"{self.counts[level]} {level}" for level in RESULT_LEVELS if self.counts[level]]
+        return f"Import finished: {', '.join(parts) or 'nothing to do'}"
+
+    def finish(self, run):
+        """Attach the full log to ``run`` and report the summary.
+
+        Parameters
+        ----------
+        run : bookprocess.models.ImportRun
+            The run the messages belong to.
+
+        Returns
+        -------
+        None
+        """
+        self._text.flush()
+        self._buffer.seek(0)
+        name = f"{run.command}-{run.pk}.csv"
+        run.log_file.save(name, File(self._buffer, name=name), save=False)
+        run.save(update_fields=["log_file", "updated_at"])
+        self._text.close()
+        self.run = run
+
+        if getattr(self.command, "request", None) is None:
+            self.command.stdout.write(f"{self.summary()}. Full log: {run.log_file.name}")
+
+
+def file_sha256(path, chunk_size=1024 * 1024):
+    """Return the SHA-256 hex digest of a file.
+
+    Parameters
+    ----------
+    path : str or pathlib.Path
+        File to hash.
+    chunk_size : int, optional
+        Bytes read per step.
+
+    Returns
+    -------
+    str
+        Hex digest.
+    """
+    digest = sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(chunk_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def begin_import(command, path, df, user=None, resume=False):
+    """Start (or resume) the import run of ``path`` and trim committed rows.
+
+    Parameters
+    ----------
+    command : django.core.management.base.BaseCommand
+        The importing command; its module name identifies the run. An
+        :class:`ImportResult` is attached as ``command.result``; call its
+        ``finish`` once the import ends.
+    path : pathlib.Path
+        The imported file.
+    df : pandas.DataFrame
+        The sheet as read from the file.
+    user : django.contrib.auth.models.User, optional
+        The user running the import.
+    resume : bool, optional
+        Continue the last unfinished run of the same file.
+
+    Returns
+    -------
+    tuple
+        ``(run, df)`` where ``df`` only holds the rows still to import.
+        Row labels are kept so row numbers in messages stay correct.
+    """
+    request = getattr(command, "request", None)
+    command.result = ImportResult(command)
+    run = ImportRun.objects.start(
+        command=command.__module__.rsplit(".", 1)[-1],
+        file_name=path.name,
+        file_hash=file_sha256(path),
+        total_rows=len(df),
+        user=user,
+        resume=resume,
+    )
+    if run.last_row:
+        notify(
+            request,
+            command,
+            f"Resuming import run {run.pk}: rows 2-{run.last_row + 1} were already imported",
+            "info",
+        )
+    elif resume:
+        notify(request, command, "No unfinished import of this file; starting from the first row", "info")
+    return run, df.iloc[run.last_row:]
+
+
+def row_fingerprints(df, columns):
+    """Hash the given columns of every row.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Normalized rows.
+    columns : list of str
+        Columns making up the fingerprint, in a fixed order.
+
+    Returns
+    -------
+    pandas.Series
+        16-character hex digests aligned with ``df.index``.
+    """
+    hashes = hash_pandas_object(df[list(columns)], index=False)
+    return hashes.map("{:016x}".format)
+
+
+def commit_in_chunks(run, items, position, chunk_size=IMPORT_CHUNK_SIZE, on_chunk=None):
+    """Yield ``items`` inside per-chunk transactions that record progress.
+
+    Every ``chunk_size`` items the open transaction records the run's
+    progress and commits; counter refreshes queued by the chunk are
+    flushed in the same transaction. The run is marked completed once
+    ``items`` is exhausted. Wrap the work done for one item in its own
+    ``transaction.atomic()`` block so a failing row does not abort the
+    chunk.
+
+    Parameters
+    ----------
+    run : bookprocess.models.ImportRun
+        The run to record progress on.
+    items : iterable
+        Items to import, in row order.
+    position : callable
+        Returns the frame row label of an item.
+    chunk_size : int, optional
+        Items committed per transaction.
+    on_chunk : callable, optional
+        Called without arguments at the end of every chunk, inside its
+        transaction, to flush work the caller batched per chunk.
+
+    Yields
+    ------
+    object
+        The next item, while its chunk's transaction is open.
+    """
+    iterator = iter(items)
+    while True:
+        with transaction.atomic(), deferred_refresh():
+            last = None
+            for item in islice(iterator, chunk_size):
+                yield item
+                last = item
+            if last is None:
+                break
+            if on_chunk is not None:
+                on_chunk()
+            run.checkpoint(position(last) + 1)
+    run.finish()
+
+
+def report_validation(command, run, rows):
+    """Report the outcome of a validate-only run without writing any row.
+
+    Parameters
+    ----------
+    command : django.core.management.base.BaseCommand
+        The importing command.
+    run : bookprocess.models.ImportRun
+        The run; it is marked as validated.
+    rows : pandas.DataFrame
+        Validated rows with an ``error`` column.
+
+    Returns
+    -------
+    None
+    """
+    request = getattr(command, "request", None)
+    errors = rows["error"].dropna()
+    for message in errors:
+        notify(request, command, message, "warning")
+    notify(
+        request,
+        command,
+        f"Validation finished: {len(rows)} rows checked, {len(rows) - len(errors)} valid, "
+        f"{len(errors)} invalid; nothing was saved",
+        "info",
+    )
+    run.finish(ImportRun.Status.VALIDATED)
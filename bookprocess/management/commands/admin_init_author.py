@@ -2,24 +2,40 @@
 
 This module provides a Django management command intended for admins to
 import author names and their nationalities from an Excel spreadsheet.
-It performs lightweight validation, reports progress via the project's
+It validates the whole sheet up front (see
+:mod:`bookprocess.validation`), reports progress via the project's
 ``notify`` helper and records the acting user in the ``auditlog``
-context when available.
+context when available. Rows are committed in chunks tracked by an
+``ImportRun`` so ``--resume`` can continue an interrupted import (see
+:mod:`bookprocess.importing`). With ``--upsert`` an existing author
+whose row fingerprint changed gets the row's nationality (and the
+books it is first on new ISBNs), and
+``--validate-only`` reports the invalid rows without saving anything.
 
 The expected Excel sheet should contain at least two columns:
 - ``author``: a full author name (first name and optional last name(s)).
 - ``nationality``: the exact name of an existing ``Nationality`` row.
 """
+from copy import copy
+from functools import partial
+from operator import itemgetter
 from pathlib import Path
 from auditlog.context import set_actor
-from bookprocess.models import Author, Nationality
+from auditlog.diff import model_instance_diff
+from bookprocess.importing import begin_import, commit_in_chunks, report_validation, row_fingerprints
+from bookprocess.models import Author, Book, BookAuthor, ImportRun, Nationality
+from bookprocess.services import AuditLogService, BookBulkService
+from bookprocess.signals import queue_refresh
 from bookprocess.utils import notify
+from bookprocess.validation import validate_author_frame, validate_in_partitions
 from django.contrib.auth import get_user_model
 from django.core.management.base import BaseCommand
-from pandas import read_excel, isna
+from pandas import read_excel
 
 User = get_user_model()
 
+LOOKUP_BATCH_SIZE = 900 #: Number of first names looked up per query in upsert mode.
+
 class Command(BaseCommand):
     """A management command to import authors from an Excel file.
 
@@ -48,6 +64,27 @@ class Command(BaseCommand):
             type=str,
             help="Username of the user performing this action (for audit logging).",
         )
+        parser.add_argument(
+            "--resume",
+            action="store_true",
+            help="Continue the last unfinished import of the same file after its last committed chunk.",
+        )
+        parser.add_argument(
+            "--validate-only",
+            action="store_true",
+            help="Check every row and report the problems without saving anything.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Number of processes parsing and validating partitions of the sheet.",
+        )
+        parser.add_argument(
+            "--upsert",
+            action="store_true",
+            help="Update the nationality of existing authors; rows unchanged since the last import are skipped.",
+        )
 
     def handle(self, *args, **options):
         """Execute the import.
@@ -61,6 +98,10 @@ class Command(BaseCommand):
 
             - ``excel_file`` (str): Path to the Excel file to read.
             - ``user`` (str, optional): Username to set as the audit actor.
+            - ``resume`` (bool, optional): Continue the last unfinished run.
+            - ``upsert`` (bool, optional): Update existing authors by name.
+            - ``validate_only`` (bool, optional): Only report invalid rows.
+            - ``workers`` (int, optional): Processes validating the sheet.
 
         Returns
         -------
@@ -76,74 +117,168 @@ class Command(BaseCommand):
             notify(request, self, f"File not found: {excel_file}", "error")
             return
 
-        df = read_excel(excel_file)
-
-        for idx, row in df.iterrows():
-            row_num = idx + 2
+        validate_only = options.get("validate_only", False)
+        df = read_excel(excel_file, dtype=str)
+        run, df = begin_import(
+            self, excel_file, df, user=user, resume=options.get("resume") and not validate_only
+        )
+        nationalities = {n.name: n for n in Nationality.objects.all()}
+        rows = validate_in_partitions(validate_author_frame, df, options.get("workers") or 1, set(nationalities))
+        if validate_only:
+            report_validation(self, run, rows)
+            self.result.finish(run)
+            return
+        rows["fingerprint"] = row_fingerprints(rows, ["nationality"])
+        items = zip(rows.index, rows.itertuples(index=False))
 
-            try:
-                author_value = row.get("author")
-                nationality_value = row.get("nationality")
+        upsert = options.get("upsert", False)
+        existing = self._existing_authors(rows) if upsert else {}
+        updates = []
+        counts = {"create": 0, "update": 0, "skip": 0}
+        flush_updates = partial(self._apply_updates, request, user, nationalities, updates, counts)
 
-                if isna(author_value):
-                    notify(request, self, f"Row {row_num}: author missing, skipping", "warning")
+        try:
+            for idx, row in commit_in_chunks(run, items, itemgetter(0), on_chunk=flush_updates):
+                row_num = idx + 2
+                if row.error is not None:
+                    notify(request, self, row.error, "warning")
                     continue
 
-                if isna(nationality_value):
-                    notify(request, self, f"Row {row_num}: nationality missing, skipping", "warning")
-                    continue
+                try:
+                    author_name = row.author
+                    nationality_name = row.nationality
+                    nationality = nationalities[nationality_name]
 
-                author_name = str(author_value).strip()
-                nationality_name = str(nationality_value).strip()
+                    parts = author_name.split()
+                    first_name = parts[0]
+                    last_name = " ".join(parts[1:]) if len(parts) > 1 else ""
 
-                if not author_name:
-                    notify(request, self, f"Row {row_num}: author missing, skipping", "warning")
-                    continue
+                    matches = existing.get((first_name, last_name), [])
+                    if len(matches) == 1:
+                        pk, fingerprint = matches[0]
+                        if fingerprint == row.fingerprint:
+                            counts["skip"] += 1
+                        else:
+                            updates.append((row_num, pk, row))
+                        continue
 
-                if not nationality_name:
-                    notify(request, self, f"Row {row_num}: nationality missing, skipping", "warning")
-                    continue
+                    with set_actor(user):
+                        author, created = Author.objects.get_or_create(
+                            first_name=first_name,
+                            last_name=last_name,
+                            defaults={"nationality": nationality, "import_fingerprint": row.fingerprint},
+                        )
 
-                if not any(c.isalpha() for c in author_name):
-                    notify(request, self, f"Row {row_num}: author name '{author_name}' contains no letters, skipping", "warning")
-                    continue
+                        if created:
+                            counts["create"] += 1
+                            notify(
+                                request,
+                                self,
+                                f"Row {row_num}: Created author '{author_name}' ({nationality_name})",
+                                "success",
+                            )
+                        else:
+                            notify(
+                                request,
+                                self,
+                                f"Row {row_num}: Author '{author_name}' already exists, skipping",
+                                "info",
+                            )
 
-                try:
-                    nationality = Nationality.objects.get(name=nationality_name)
-                except Nationality.DoesNotExist:
-                    notify(
-                        request,
-                        self,
-                        f"Row {row_num}: Nationality '{nationality_name}' not found, skipping",
-                        "warning",
-                    )
-                    continue
+                except Exception as e:
+                    notify(request, self, f"Row {row_num}: Error — {e}", "error")
 
-                parts = author_name.split()
-                first_name = parts[0]
-                last_name = " ".join(parts[1:]) if len(parts) > 1 else ""
-
-                with set_actor(user):
-                    author, created = Author.objects.get_or_create(
-                        first_name=first_name,
-                        last_name=last_name,
-                        defaults={"nationality": nationality},
-                    )
-
-                    if created:
-                        notify(
-                            request,
-                            self,
-                            f"Row {row_num}: Created author '{author_name}' ({nationality_name})",
-                            "success",
-                        )
-                    else:
-                        notify(
-                            request,
-                            self,
-                            f"Row {row_num}: Author '{author_name}' already exists, skipping",
-                            "info",
-                        )
+            if upsert:
+                notify(
+                    request,
+                    self,
+                    f"Upsert finished: {counts['create']} created, {counts['update']} updated, "
+                    f"{counts['skip']} unchanged",
+                    "info",
+                )
+        except Exception:
+            run.finish(ImportRun.Status.FAILED)
+            raise
+        finally:
+            self.result.finish(run)
+
+    def _existing_authors(self, rows):
+        """Look up the stored authors named in the sheet.
+
+        Parameters
+        ----------
+        rows : pandas.DataFrame
+            Validated rows.
+
+        Returns
+        -------
+        dict
+            ``(first_name, last_name)`` -> list of ``(pk, fingerprint)``.
+            Names shared by several authors map to several entries and
+            are not updated.
+        """
+        first_names = sorted(set(rows["author"].str.split().str[0].dropna()))
+        existing = {}
+        for start in range(0, len(first_names), LOOKUP_BATCH_SIZE):
+            for pk, first, last, fingerprint in Author.objects.filter(
+                first_name__in=first_names[start:start + LOOKUP_BATCH_SIZE]
+            ).values_list("pk", "first_name", "last_name", "import_fingerprint"):
+                existing.setdefault((first, last), []).append((pk, fingerprint))
+        return existing
+
+    def _apply_updates(self, request, user, nationalities, updates, counts):
+        """Write the nationality changes of one chunk with ``bulk_update``.
+
+        The books of the moved authors get their ``primary_nationality``
+        refreshed right away, so the ISBNs of the books those authors are
+        first on can be re-allocated in the same transaction.
+
+        Parameters
+        ----------
+        request : django.http.HttpRequest or None
+            Request used for notifications when run from the admin.
+        user : django.contrib.auth.models.User or None
+            Audit actor.
+        nationalities : dict
+            Nationalities keyed by name.
+        updates : list of tuple
+            ``(row number, author pk, row)`` collected for the chunk;
+            emptied on return.
+        counts : dict
+            Running totals; ``counts["update"]`` is increased.
+
+        Returns
+        -------
+        None
+        """
+        if not updates:
+            return
+
+        authors = Author.objects.in_bulk([pk for _, pk, _ in updates])
+        changed, audit, touched = [], [], set()
+        for row_num, pk, row in updates:
+            author = authors[pk]
+            before = copy(author)
+            author.nationality = nationalities[row.nationality]
+            author.import_fingerprint = row.fingerprint
+            changes = {
+                field: list(values)
+                for field, values in (model_instance_diff(before, author) or {}).items()
+            }
+            changed.append(author)
+            if changes:
+                audit.append((author, changes))
+                touched.update({before.nationality_id, author.nationality_id})
+                notify(request, self, f"Row {row_num}: Updated author '{row.author}' ({row.nationality})", "success")
+                counts["update"] += 1
 
-            except Exception as e:
-                notify(request, self, f"Row {row_num}: Error — {e}", "error")
+        Author.objects.bulk_update(changed, ["nationality", "import_fingerprint"])
+        AuditLogService.log_bulk_updates(user, audit)
+        moved = [author.pk for author, _ in audit]
+        if moved:
+            Book.objects.refresh_primary_nationality(
+                BookAuthor.objects.filter(author_id__in=moved).values("book_id")
+            )
+            BookBulkService.reallocate_author_isbns(user, moved)
+        queue_refresh(nationalities=touched)
+        updates.clear()
@@ -4,7 +4,9 @@ This command reads a spreadsheet containing book metadata and creates
 ``Book``, ``Author``, and ``BookAuthor`` records. It performs several
 validation checks (ISBN format, matching counts of authors and
 nationalities, genre existence and ISBN -> nationality consistency)
-and reports progress using the project's ``notify`` helper.
+over the whole sheet before any row is written (see
+:mod:`bookprocess.validation`) and reports progress using the project's
+``notify`` helper.
 
 The expected columns in the Excel file include::
 
@@ -13,52 +15,54 @@ The expected columns in the Excel file include::
 
 Where ``authors`` and ``nationalities`` are comma-separated lists of
 equal length mapping each author to a nationality.
+
+The file may also be a ZIP archive holding the sheet and the cover
+images; covers are then streamed from the archive into storage without
+extracting it (see :mod:`bookprocess.archives`).
+
+Rows are committed in chunks and the progress is recorded on an
+``ImportRun``; ``--resume`` continues an interrupted import of the same
+file after its last committed chunk (see :mod:`bookprocess.importing`).
+
+With ``--upsert`` rows whose ISBN already exists update that book. Each
+book stores a fingerprint of the row it was imported from; unchanged
+rows are skipped without loading the book, changed rows are written with
+``bulk_update`` and audited with one entry per book.
+
+``--validate-only`` runs the same checks (with read-only bulk lookups)
+and reports every invalid row without writing any book.
 """
 
-from pathlib import Path
+from contextlib import ExitStack
+from copy import copy
+from functools import partial
+from pathlib import Path, PurePosixPath
 from auditlog.context import set_actor
-from bookprocess.models import Book, Author, Genre, BookAuthor, Nationality
+from auditlog.diff import model_instance_diff
+from bookprocess.archives import ImportArchive
+from bookprocess.covers import COVER_WORKERS, prefetch_covers
+from bookprocess.importing import begin_import, commit_in_chunks, report_validation, row_fingerprints
+from bookprocess.models import Book, Author, Genre, BookAuthor, ImportRun, Nationality
+from bookprocess.services import AuditLogService
+from bookprocess.signals import queue_refresh
 from bookprocess.utils import notify
+from bookprocess.validation import normalize_isbn_series, validate_book_frame, validate_in_partitions
 from django.contrib.auth import get_user_model
-from django.core.files import File
 from django.core.management.base import BaseCommand
+from django.db import transaction
 from pandas import read_excel
 
 
 User = get_user_model()
 
+#: Number of ISBNs checked against the database per query.
+ISBN_LOOKUP_BATCH_SIZE = 900
 
-def _to_isbn_string(cell):
-    """Normalize a raw Excel cell to a 13-digit ISBN string candidate.
+#: Row columns hashed into a book's import fingerprint (besides the cover).
+BOOK_FINGERPRINT_COLUMNS = ["title", "adapted", "film_title", "authors", "nationalities", "genre"]
 
-    Parameters
-    ----------
-    cell : Any
-        Raw value from the Excel cell.
-
-    Returns
-    -------
-    str
-        A cleaned string with separators removed and trailing ".0" stripped.
-        Can be empty when the cell is blank.
-    """
-    if cell is None:
-        return ""
-    try:
-        from math import isnan
-        if isinstance(cell, float):
-            if isnan(cell):
-                return ""
-            s = f"{cell:.0f}"
-        else:
-            s = str(cell).strip()
-    except Exception:
-        s = str(cell).strip()
-
-    if s.endswith(".0"):
-        s = s[:-2]
-    s = s.replace(" ", "").replace("-", "")
-    return s
+#: Book columns written when an upsert updates an existing book.
+BOOK_UPDATE_FIELDS = ["title", "genre", "adapted", "film_title", "cover", "import_fingerprint"]
 
 
 class Command(BaseCommand):
@@ -89,6 +93,33 @@ class Command(BaseCommand):
             type=str,
             help="Username of the user performing this action (for audit logging).",
         )
+        parser.add_argument(
+            "--cover-workers",
+            type=int,
+            default=COVER_WORKERS,
+            help="Number of threads reading, validating and storing covers.",
+        )
+        parser.add_argument(
+            "--resume",
+            action="store_true",
+            help="Continue the last unfinished import of the same file after its last committed chunk.",
+        )
+        parser.add_argument(
+            "--validate-only",
+            action="store_true",
+            help="Check every row and report the problems without saving anything.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Number of processes parsing and validating partitions of the sheet.",
+        )
+        parser.add_argument(
+            "--upsert",
+            action="store_true",
+            help="Update books whose ISBN already exists; rows unchanged since the last import are skipped.",
+        )
 
     def handle(self, *args, **options):
         """Execute the import.
@@ -100,8 +131,14 @@ class Command(BaseCommand):
         **options
             A dict-like object with keys expected by this command:
 
-            - ``excel_file`` (str): path to the Excel file
+            - ``excel_file`` (str): path to the Excel file, or to a ZIP
+              holding the Excel file and the cover images it references
             - ``user`` (str, optional): username to set as the audit actor
+            - ``cover_workers`` (int, optional): size of the cover thread pool
+            - ``resume`` (bool, optional): continue the last unfinished run
+            - ``upsert`` (bool, optional): update existing books by ISBN
+            - ``validate_only`` (bool, optional): only report invalid rows
+            - ``workers`` (int, optional): processes validating the sheet
 
         Returns
         -------
@@ -113,119 +150,325 @@ class Command(BaseCommand):
         request = getattr(self, "request", None)
 
         excel_file = Path(options["excel_file"])
-        excel_folder = excel_file.parent
 
         if not excel_file.exists():
             notify(request, self, f"File not found: {excel_file}", "error")
             return
 
-        df = read_excel(
-            excel_file,
-            dtype=str,
-            keep_default_na=False,
-            converters={"isbn": _to_isbn_string},
+        with ExitStack() as stack:
+            if excel_file.suffix.lower() == ".zip":
+                try:
+                    archive = stack.enter_context(ImportArchive(excel_file))
+                except ValueError as e:
+                    notify(request, self, str(e), "error")
+                    return
+                sheet = archive.excel_member()
+                if sheet is None:
+                    notify(request, self, "No Excel file found in ZIP.", "error")
+                    return
+                source = archive.read_excel_bytes(sheet)
+                open_cover = partial(self._open_archive_cover, archive, sheet)
+            else:
+                source = excel_file
+                open_cover = partial(self._open_disk_cover, excel_file.parent)
+
+            validate_only = options.get("validate_only", False)
+            df = read_excel(source, dtype=str, keep_default_na=False)
+            run, df = begin_import(
+                self, excel_file, df, user=user, resume=options.get("resume") and not validate_only
+            )
+            try:
+                self._import_rows(
+                    request, user, df, open_cover, run,
+                    cover_workers=options.get("cover_workers") or COVER_WORKERS,
+                    upsert=options.get("upsert", False),
+                    validate_only=validate_only,
+                    workers=options.get("workers") or 1,
+                )
+            except Exception:
+                run.finish(ImportRun.Status.FAILED)
+                raise
+            finally:
+                self.result.finish(run)
+
+    def _open_archive_cover(self, archive, sheet, cover_path):
+        """Open a cover stored next to the sheet inside an import ZIP.
+
+        Parameters
+        ----------
+        archive : bookprocess.archives.ImportArchive
+            The opened import archive.
+        sheet : str
+            Member name of the spreadsheet; covers are relative to it.
+        cover_path : str
+            Cover path as written in the sheet.
+
+        Returns
+        -------
+        tuple or None
+            ``(file name, readable stream)``, or ``None`` when the archive
+            holds no such member.
+        """
+        member = archive.resolve(cover_path, sheet)
+        if member is None:
+            return None
+        return PurePosixPath(member).name, archive.open(member)
+
+    def _open_disk_cover(self, excel_folder, cover_path):
+        """Open a cover file on disk, relative to the sheet's folder.
+
+        Parameters
+        ----------
+        excel_folder : pathlib.Path
+            Folder holding the spreadsheet.
+        cover_path : str
+            Cover path as written in the sheet.
+
+        Returns
+        -------
+        tuple or None
+            ``(file name, readable stream)``, or ``None`` when the file does
+            not exist.
+        """
+        cover_file = Path(cover_path)
+        if not cover_file.is_absolute():
+            cover_file = excel_folder / cover_path
+        if not cover_file.exists():
+            return None
+        return cover_file.name, open(cover_file, "rb")
+
+    def _import_rows(self, request, user, df, open_cover, run, cover_workers=COVER_WORKERS, upsert=False,
+                     validate_only=False, workers=1):
+        """Validate the sheet and create the books of its valid rows.
+
+        Parameters
+        ----------
+        request : django.http.HttpRequest or None
+            Request used for notifications when run from the admin.
+        user : django.contrib.auth.models.User or None
+            Audit actor.
+        df : pandas.DataFrame
+            The sheet as read from the file.
+        open_cover : callable
+            Takes a cover path from the sheet and returns
+            ``(file name, stream)`` or ``None``.
+        run : bookprocess.models.ImportRun
+            Run recording the committed rows.
+        cover_workers : int, optional
+            Number of threads processing covers.
+        upsert : bool, optional
+            Update books whose ISBN already exists instead of skipping
+            them; rows whose fingerprint did not change are skipped.
+        validate_only : bool, optional
+            Only report the invalid rows; nothing is written.
+        workers : int, optional
+            Number of processes validating partitions of the sheet.
+
+        Returns
+        -------
+        None
+        """
+        genres = {genre.name: genre for genre in Genre.objects.all()}
+        nationality_codes = dict(Nationality.objects.values_list("name", "code"))
+        isbns = sorted(set(normalize_isbn_series(df["isbn"]))) if "isbn" in df.columns else []
+        existing = {}
+        for start in range(0, len(isbns), ISBN_LOOKUP_BATCH_SIZE):
+            existing.update(
+                Book.objects.filter(
+                    isbn__in=isbns[start:start + ISBN_LOOKUP_BATCH_SIZE]
+                ).values_list("isbn", "import_fingerprint")
+            )
+        rows = validate_in_partitions(
+            validate_book_frame, df, workers,
+            nationality_codes, set(genres), set() if upsert else set(existing),
         )
+        if validate_only:
+            report_validation(self, run, rows)
+            return
 
-        for idx, row in df.iterrows():
-            row_num = idx + 2
-            try:
-                title = str(row.get("title") or "").strip()
-                isbn = _to_isbn_string(row.get("isbn"))
-                raw_adapted = str(row.get("adapted") or "").strip()
-                adapted = raw_adapted.lower() in ["true", "1", "yes"]
-                film_title = str(row.get("film_title") or "").strip()
-                cover_path = str(row.get("cover_path") or "").strip()
-                authors_raw = str(row.get("authors") or "").strip()
-                nationalities_raw = str(row.get("nationalities") or "").strip()
-                genre_name = str(row.get("genre") or "").strip()
-
-                required_fields = {
-                    "title": title,
-                    "isbn": isbn,
-                    "authors": authors_raw,
-                    "nationalities": nationalities_raw,
-                    "genre": genre_name,
-                    "adapted": raw_adapted,
-                }
-                if adapted:
-                    required_fields["film_title"] = film_title
-
-                invalid = False
-                for field, value in required_fields.items():
-                    if not value or str(value).lower() == "nan":
-                        notify(request, self, f"Row {row_num}: {field} missing, skipping", "warning")
-                        invalid = True
-                        break
-                if invalid:
-                    continue
-
-                if not (isbn.isdigit() and len(isbn) == 13):
-                    notify(request, self, f"Row {row_num}: Invalid ISBN '{isbn}'", "warning")
-                    continue
-
-                authors_list = [a.strip() for a in authors_raw.split(",") if a.strip()]
-                nationalities_list = [n.strip() for n in nationalities_raw.split(",") if n.strip()]
-
-                if len(authors_list) != len(nationalities_list):
-                    notify(request, self, f"Row {row_num}: authors count != nationalities count", "warning")
-                    continue
+        # A fingerprint is "<row hash>:<cover hash>" so an update only
+        # re-stores the cover when the cover path itself changed.
+        rows["fingerprint"] = (
+            row_fingerprints(rows, BOOK_FINGERPRINT_COLUMNS) + ":"
+            + row_fingerprints(rows, ["cover_path"])
+        )
+        stored = rows["isbn"].map(existing)
+        rows["action"] = "create"
+        rows.loc[stored.notna(), "action"] = "update"
+        rows.loc[stored == rows["fingerprint"], "action"] = "skip"
+        cover_changed = stored.fillna("").str.split(":").str[1] != rows["fingerprint"].str.split(":").str[1]
+        fetch_cover = rows["error"].isna() & (rows["action"] != "skip") & cover_changed
+
+        # Covers of upcoming rows are read, validated and stored by a
+        # thread pool while the current row is written to the database.
+        items = (
+            ((idx, row), row.cover_path if fetch else "")
+            for idx, row, fetch in zip(rows.index, rows.itertuples(index=False), fetch_cover)
+        )
+        covers = prefetch_covers(items, open_cover, max_workers=cover_workers)
 
-                try:
-                    primary_nat = Nationality.objects.get(name=nationalities_list[0])
-                except Nationality.DoesNotExist:
-                    notify(request, self, f"Row {row_num}: Primary nationality '{nationalities_list[0]}' not found", "warning")
-                    continue
+        updates = []
+        counts = {"create": 0, "update": 0, "skip": 0}
+        flush_updates = partial(self._apply_updates, request, user, genres, updates, counts)
 
-                country_code_from_isbn = isbn[3:6]
-                if str(primary_nat.code).zfill(3) != country_code_from_isbn:
-                    notify(request, self, f"Row {row_num}: ISBN code {country_code_from_isbn} != primary author {authors_list[0]} code {primary_nat.code}", "warning")
-                    continue
+        for (idx, row), cover_name, cover_error in commit_in_chunks(run, covers, lambda item: item[0][0], on_chunk=flush_updates):
+            row_num = idx + 2
+            if row.error is not None:
+                notify(request, self, row.error, "warning")
+                continue
+            if row.action == "skip":
+                counts["skip"] += 1
+                continue
+            if cover_error is not None:
+                notify(request, self, f"Row {row_num}: {cover_error}, importing without cover", "warning")
+            if row.action == "update":
+                updates.append((row_num, row, cover_name))
+                continue
+            try:
+                with transaction.atomic():
+                    title = row.title
+                    isbn = row.isbn
+                    adapted = row.adapted
+                    film_title = row.film_title
+                    genre = genres[row.genre]
 
-                try:
-                    genre = Genre.objects.get(name=genre_name)
-                except Genre.DoesNotExist:
-                    notify(request, self, f"Row {row_num}: Genre '{genre_name}' not found", "warning")
-                    continue
-
-                if Book.objects.filter(isbn=isbn).exists():
-                    notify(request, self, f"Row {row_num}: ISBN {isbn} already exists, skipping", "warning")
-                    continue
-
-                with set_actor(user):
-                    book = Book(
-                        title=title,
-                        genre=genre,
-                        adapted=adapted,
-                        film_title=film_title if adapted else None,
-                        isbn=isbn,
-                    )
-                    if cover_path:
-                        cover_file = Path(cover_path)
-                        if not cover_file.is_absolute():
-                            cover_file = excel_folder / cover_path
-                        if cover_file.exists():
-                            with open(cover_file, "rb") as f:
-                                book.cover.save(cover_file.name, File(f))
-                    book.save()
-
-                book_authors = []
-                for order, (author_name, nat_name) in enumerate(zip(authors_list, nationalities_list)):
-                    parts = author_name.split()
-                    first = parts[0]
-                    last = " ".join(parts[1:]) if len(parts) > 1 else ""
-                    nationality, _ = Nationality.objects.get_or_create(name=nat_name)
                     with set_actor(user):
-                        author, created = Author.objects.get_or_create(
-                            first_name=first,
-                            last_name=last,
-                            defaults={"nationality": nationality},
+                        book = Book(
+                            title=title,
+                            genre=genre,
+                            adapted=adapted,
+                            film_title=film_title if adapted else None,
+                            isbn=isbn,
+                            import_fingerprint=row.fingerprint,
                         )
-                        if created:
-                            notify(request, self, f"Row {row_num}: Created author '{first} {last}' ({nat_name})", "success")
-                    book_authors.append(BookAuthor(book=book, author=author, order=order + 1))
-                BookAuthor.objects.bulk_create(book_authors)
+                        if cover_name:
+                            book.cover.name = cover_name
+                        book.save()
+
+                    book_authors = self._resolve_authors(request, user, row_num, row)
+                    BookAuthor.objects.attach(book, book_authors)
 
-                notify(request, self, f"Row {row_num}: Imported book '{title}' ({isbn})", "success")
+                    notify(request, self, f"Row {row_num}: Imported book '{title}' ({isbn})", "success")
+                    counts["create"] += 1
 
             except Exception as e:
+                if cover_name and not Book.objects.filter(cover=cover_name).exists():
+                    Book.cover.field.storage.delete(cover_name)
                 notify(request, self, f"Row {row_num}: Error — {e}", "error")
+
+        if upsert:
+            notify(
+                request,
+                self,
+                f"Upsert finished: {counts['create']} created, {counts['update']} updated, "
+                f"{counts['skip']} unchanged",
+                "info",
+            )
+
+    def _resolve_authors(self, request, user, row_num, row):
+        """Return the authors named by a row, creating missing ones.
+
+        Parameters
+        ----------
+        request : django.http.HttpRequest or None
+            Request used for notifications when run from the admin.
+        user : django.contrib.auth.models.User or None
+            Audit actor.
+        row_num : int
+            Spreadsheet row number, for messages.
+        row : tuple
+            Validated row; ``authors`` and ``nationalities`` are
+            comma-joined lists of equal length.
+
+        Returns
+        -------
+        list[Author]
+            Authors in sheet order.
+        """
+        book_authors = []
+        for author_name, nat_name in zip(row.authors.split(","), row.nationalities.split(",")):
+            parts = author_name.split()
+            first = parts[0]
+            last = " ".join(parts[1:]) if len(parts) > 1 else ""
+            nationality, _ = Nationality.objects.get_or_create(name=nat_name)
+            with set_actor(user):
+                author, created = Author.objects.get_or_create(
+                    first_name=first,
+                    last_name=last,
+                    defaults={"nationality": nationality},
+                )
+                if created:
+                    notify(request, self, f"Row {row_num}: Created author '{first} {last}' ({nat_name})", "success")
+            book_authors.append(author)
+        return book_authors
+
+    def _apply_updates(self, request, user, genres, updates, counts):
+        """Write the changed rows of one chunk with ``bulk_update``.
+
+        Only fields whose value actually differs are written and audited;
+        a row whose fingerprint changed without a real difference only
+        refreshes the stored fingerprint.
+
+        Parameters
+        ----------
+        request : django.http.HttpRequest or None
+            Request used for notifications when run from the admin.
+        user : django.contrib.auth.models.User or None
+            Audit actor.
+        genres : dict
+            Genres keyed by name.
+        updates : list of tuple
+            ``(row number, row, stored cover name)`` collected for the
+            chunk; emptied on return.
+        counts : dict
+            Running totals; ``counts["update"]`` is increased.
+
+        Returns
+        -------
+        None
+        """
+        if not updates:
+            return
+
+        books = Book.objects.in_bulk([row.isbn for _, row, _ in updates], field_name="isbn")
+        current_authors = {}
+        for book_id, first, last in (
+            BookAuthor.objects.filter(book__in=books.values())
+            .order_by("book_id", "order", "pk")
+            .values_list("book_id", "author__first_name", "author__last_name")
+        ):
+            current_authors.setdefault(book_id, []).append(f"{first} {last}")
+
+        changed_books, audit, touched_genres = [], [], set()
+        for row_num, row, cover_name in updates:
+            book = books[row.isbn]
+            before = copy(book)
+            book.title = row.title
+            book.genre = genres[row.genre]
+            book.adapted = row.adapted
+            book.film_title = row.film_title if row.adapted else None
+            if cover_name:
+                book.cover = cover_name
+            book.import_fingerprint = row.fingerprint
+
+            changes = {
+                field: list(values)
+                for field, values in (model_instance_diff(before, book) or {}).items()
+            }
+            old_authors = current_authors.get(book.pk, [])
+            new_authors = [" ".join(name.split()) for name in row.authors.split(",")]
+            if [" ".join(name.split()) for name in old_authors] != new_authors:
+                BookAuthor.objects.replace(book, self._resolve_authors(request, user, row_num, row))
+                changes["authors"] = [", ".join(old_authors) or None, ", ".join(new_authors)]
+
+            changed_books.append(book)
+            if changes:
+                audit.append((book, changes))
+                touched_genres.update({before.genre_id, book.genre_id})
+                notify(request, self, f"Row {row_num}: Updated book '{book.title}' ({book.isbn}): {', '.join(changes)}", "success")
+                counts["update"] += 1
+
+        Book.objects.bulk_update(changed_books, BOOK_UPDATE_FIELDS)
+        AuditLogService.log_bulk_updates(user, audit)
+        queue_refresh(genres=touched_genres)
+        updates.clear()
@@ -1,53 +1,25 @@
 """Management command to populate the project's ``Genre`` table.
 
 This module provides a small Django management command used by
-administrators to ensure a canonical set of genres exists in the
-database.
+administrators to ensure the canonical set of genres, defined in
+``bookprocess/data/genres.json``, exists in the database (see
+:mod:`bookprocess.reference`).
 """
-from auditlog.context import set_actor
-from bookprocess.models import Genre
+from bookprocess.reference import sync_reference
 from bookprocess.utils import notify
 from django.contrib.auth import get_user_model
 from django.core.management.base import BaseCommand
 
-GENRES = [
-    "Adventure",
-    "Archaeology",
-    "Art",
-    "Biography",
-    "Cooking",
-    "Crime",
-    "Drama",
-    "Fantasy",
-    "Fiction",
-    "Folklore",
-    "Historical Fiction",
-    "History",
-    "Horror",
-    "Mystery",
-    "Nature",
-    "Non-Fiction",
-    "Philosophy",
-    "Poetry",
-    "Romance",
-    "Science Fiction",
-    "Science",
-    "Self-Help",
-    "Technology",
-    "Thriller",
-    "Travel"
-] #: Choices available.
-
 User = get_user_model()
 class Command(BaseCommand):
-    """Populate the ``Genre`` table with a canonical list of genres.
+    """Sync the ``Genre`` table with the canonical list of genres.
 
-    This command is idempotent and safe to run multiple times. For each
-    entry in the module-level :data:`GENRES` list the command will call
-    :meth:`django.db.models.Manager.get_or_create` to ensure the row
-    exists. Creation and informational messages are emitted via the
-    :func:`bookprocess.utils.notify` helper which integrates with the
-    project's admin messaging system.
+    This command is idempotent and safe to run multiple times. The
+    genres of the data file are compared with the table in one query;
+    missing genres are created in bulk and genres that are not in the
+    file are reported, or deleted with ``--prune``. Messages are emitted
+    via the :func:`bookprocess.utils.notify` helper which integrates
+    with the project's admin messaging system.
     """
 
     def add_arguments(self, parser):
@@ -69,6 +41,11 @@ class Command(BaseCommand):
             type=str,
             help="Username of the user performing this action (for audit logging).",
         )
+        parser.add_argument(
+            "--prune",
+            action="store_true",
+            help="Delete genres that are not in the reference data and have no books.",
+        )
 
     def handle(self, *args, **kwargs):
         """Execute the genre population.
@@ -81,6 +58,7 @@ class Command(BaseCommand):
             Keyword args parsed from the CLI. Relevant keys:
 
             - ``user`` (str, optional): username to set as the audit actor.
+            - ``prune`` (bool, optional): delete genres missing from the file.
 
         Returns
         -------
@@ -91,15 +69,6 @@ class Command(BaseCommand):
         user = User.objects.filter(username=username).first() if username else None
         request = getattr(self, "request", None)
 
-        for name in GENRES:
-            try:
-                with set_actor(user):
-                    obj, created = Genre.objects.get_or_create(name=name)
-
-                    if created:
-                        notify(request, self, f"Created genre '{name}'", "success")
-                    else:
-                        notify(request, self, f"Genre '{name}' already exists.", "info")
-
-            except Exception as e:
-                notify(request, self, f"Failed to create genre '{name}': {e}", "error")
+        report = sync_reference("genres", user=user, prune=kwargs.get("prune", False))
+        for msg, level in report.messages():
+            notify(request, self, msg, level)
@@ -1,63 +1,19 @@
 """
 Django management command to populate the Nationality table
 with all countries and their corresponding ISBN codes.
+
+The countries are defined in ``bookprocess/data/nationalities.json`` and
+matched with the table by code (see :mod:`bookprocess.reference`).
 """
-from auditlog.context import set_actor
+from bookprocess.reference import sync_reference
 from bookprocess.utils import notify
-from bookprocess.models import Nationality
 from django.contrib.auth import get_user_model
 from django.core.management.base import BaseCommand
 
-COUNTRIES = [
-("950", "Argentina"),
-("984", "Bangladesh"),
-("985", "Belarus"),
-("619", "Bulgaria"),
-("976", "Caribbean Community"),
-("956", "Chile"),
-("958", "Colombia"),
-("953", "Croatia"),
-("959", "Cuba"),
-("977", "Egypt"),
-("951", "Finland"),
-("618", "Greece"),
-("962", "Hong Kong"),
-("615", "Hungary"),
-("602", "Indonesia"),
-("600", "Iran"),
-("965", "Israel"),
-("601", "Kazakhstan"),
-("614", "Lebanon"),
-("609", "Lithuania"),
-("967", "Malaysia"),
-("613", "Mauritius"),
-("607", "Mexico"),
-("978", "Nigeria"),
-("608", "North Macedonia"),
-("969", "Pakistan"),
-("612", "Peru"),
-("621", "Philippines"),
-("972", "Portugal"),
-("606", "Romania"),
-("603", "Saudi Arabia"),
-("981", "Singapore"),
-("961", "Slovenia"),
-("982", "South Pacific"),
-("955", "Sri Lanka"),
-("957", "Taiwan"),
-("611", "Thailand"),
-("605", "Türkiye"),
-("617", "Ukraine"),
-("111", "United Kingdom"),
-("000", "United States"),
-("980", "Venezuela"),
-("604", "Vietnam"),
-] #: Choices available.
-
 User = get_user_model()
 class Command(BaseCommand):
     """
-    Populates the Nationality table with all countries and their codes.
+    Syncs the Nationality table with all countries and their codes.
     """
 
     def add_arguments(self, parser):
@@ -79,6 +35,11 @@ class Command(BaseCommand):
             type=str,
             help="Username of the user performing this action (for audit logging)."
         )
+        parser.add_argument(
+            "--prune",
+            action="store_true",
+            help="Delete nationalities that are not in the reference data and have no authors.",
+        )
 
     def handle(self, *args, **kwargs):
         """Execute the import.
@@ -87,11 +48,11 @@ class Command(BaseCommand):
         ----------
         *args
             Positional arguments passed by Django.
-        **options
+        **kwargs
             A mapping containing the parsed CLI options. Expected keys:
 
-            - ``excel_file`` (str): Path to the Excel file to read.
             - ``user`` (str, optional): Username to set as the audit actor.
+            - ``prune`` (bool, optional): Delete nationalities missing from the file.
 
         Returns
         -------
@@ -101,18 +62,6 @@ class Command(BaseCommand):
         user = User.objects.filter(username=username).first() if username else None
         request = getattr(self, "request", None)
 
-        for code, name in COUNTRIES:
-            try:
-                with set_actor(user):
-                    obj, created = Nationality.objects.get_or_create(
-                        code=code,
-                        defaults={"name": name}
-                    )
-
-                    if created:
-                        notify(request, self, f"Created nationality '{name}' ({code})", "success")
-                    else:
-                        notify(request, self, f"Nationality '{name}' ({code}) already exists.", "info")
-
-            except Exception as e:
-                notify(request, self, f"Failed to process nationality '{name}' ({code}): {e}", "error")
+        report = sync_reference("nationalities", user=user, prune=kwargs.get("prune", False))
+        for msg, level in report.messages():
+            notify(request, self, msg, level)
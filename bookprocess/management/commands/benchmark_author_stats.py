@@ -0,0 +1,226 @@
+"""Management command to benchmark the author statistics queries.
+
+For every requested size a throwaway in-memory SQLite database is built
+with the project's schema and filled with synthetic books, authors and
+``BookAuthor`` links. Three ways of computing each author's solo and
+co-authored book counts are then timed against it:
+
+- ``legacy``: the ``Sum(Case(When(books__in=...)))`` query the statistics
+  page used to run;
+- ``correlated``: the correlated subqueries of
+  :meth:`bookprocess.models.AuthorManager.counter_expressions`;
+- ``single-pass``: :func:`bookprocess.statistics.author_book_counts`.
+
+The configured database is never touched. The three plans must return
+the same counts. The two earlier plans look up the link table once per
+row they produce; use ``--slow-limit`` to skip them for large sizes.
+"""
+from random import Random
+from time import perf_counter
+
+from bookprocess.models import Author, Book, BookAuthor, Genre, Nationality
+from bookprocess.statistics import author_book_counts_sql, legacy_author_stats_queryset
+from django.core.management.base import BaseCommand, CommandError
+from django.db.utils import ConnectionHandler
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000] #: Numbers of ``BookAuthor`` rows benchmarked by default.
+LINKS_PER_AUTHOR = 10 #: Average number of books per synthetic author.
+AUTHORS_PER_BOOK = (1, 1, 1, 2, 2, 3) #: Distribution the number of authors of a synthetic book is drawn from.
+INSERT_BATCH_SIZE = 10_000 #: Rows inserted per ``executemany`` call.
+
+
+class Command(BaseCommand):
+    """Time the author statistics query plans on synthetic data."""
+
+    def add_arguments(self, parser):
+        """Register command-line arguments.
+
+        Parameters
+        ----------
+        parser : argparse.ArgumentParser
+            The parser instance provided by Django's management
+            framework. This method should call ``add_argument`` on the
+            parser to declare accepted CLI parameters.
+
+        Returns
+        -------
+        None
+        """
+        parser.add_argument(
+            "--sizes",
+            type=int,
+            nargs="+",
+            default=DEFAULT_SIZES,
+            help="Numbers of BookAuthor rows to benchmark.",
+        )
+        parser.add_argument(
+            "--slow-limit",
+            type=int,
+            default=max(DEFAULT_SIZES),
+            help="Largest size the legacy and correlated plans are run at.",
+        )
+        parser.add_argument("--seed", type=int, default=0, help="Seed of the synthetic data.")
+        parser.add_argument("--explain", action="store_true", help="Print the query plan of every query.")
+
+    def handle(self, *args, **options):
+        """Execute the benchmark.
+
+        Parameters
+        ----------
+        *args
+            Positional arguments passed by Django.
+        **options
+            A mapping containing the parsed CLI options. Expected keys:
+
+            - ``sizes`` (list of int): numbers of links to benchmark.
+            - ``slow_limit`` (int): largest size for the slow plans.
+            - ``seed`` (int): random seed.
+            - ``explain`` (bool): print the query plans.
+
+        Returns
+        -------
+        None
+        """
+        self.stdout.write(f"{'links':>9} {'books':>9} {'authors':>9} {'legacy':>10} {'correlated':>11} {'single-pass':>12}")
+        for size in options["sizes"]:
+            if size < 1:
+                raise CommandError("Sizes must be positive.")
+            connection = ConnectionHandler(
+                {"default": {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"}}
+            )["default"]
+            try:
+                books, authors = self._populate(connection, size, Random(options["seed"]))
+                timings = self._run_plans(connection, size <= options["slow_limit"], options["explain"])
+            finally:
+                connection.close()
+            cells = ["skipped" if t is None else f"{t:.3f}s" for t in timings]
+            self.stdout.write(f"{size:>9} {books:>9} {authors:>9} {cells[0]:>10} {cells[1]:>11} {cells[2]:>12}")
+
+    def _populate(self, connection, size, rng):
+        """Create the schema and ``size`` synthetic links.
+
+        Parameters
+        ----------
+        connection : django.db.backends.sqlite3.base.DatabaseWrapper
+            The benchmark database.
+        size : int
+            Number of ``BookAuthor`` rows to create.
+        rng : random.Random
+            Source of the synthetic distribution.
+
+        Returns
+        -------
+        tuple
+            ``(books, authors)`` created.
+        """
+        with connection.schema_editor() as editor:
+            for model in (Nationality, Genre, Author, Book, BookAuthor):
+                editor.create_model(model)
+
+        num_authors = max(size // LINKS_PER_AUTHOR, max(AUTHORS_PER_BOOK))
+        links, book_id = [], 0
+        while len(links) < size:
+            book_id += 1
+            count = min(rng.choice(AUTHORS_PER_BOOK), size - len(links))
+            for order, author_id in enumerate(rng.sample(range(1, num_authors + 1), count), start=1):
+                links.append({"id": len(links) + 1, "book_id": book_id, "author_id": author_id, "order": order})
+
+        self._insert(connection, Nationality, [{"id": 1, "name": "Synthetic", "code": "000"}])
+        self._insert(connection, Genre, [{"id": 1, "name": "Synthetic"}])
+        self._insert(connection, Author, (
+            {"id": pk, "first_name": "Author", "last_name": str(pk), "nationality_id": 1}
+            for pk in range(1, num_authors + 1)
+        ))
+        self._insert(connection, Book, (
+            {"id": pk, "title": f"Book {pk}", "isbn": f"{pk:013d}", "genre_id": 1}
+            for pk in range(1, book_id + 1)
+        ))
+        self._insert(connection, BookAuthor, links)
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+        return book_id, num_authors
+
+    @staticmethod
+    def _insert(connection, model, rows):
+        """Insert rows with field defaults filled in, bypassing the ORM.
+
+        Parameters
+        ----------
+        connection : django.db.backends.sqlite3.base.DatabaseWrapper
+            The benchmark database.
+        model : type[django.db.models.Model]
+            Model whose table receives the rows.
+        rows : Iterable[dict]
+            Values keyed by field ``attname``.
+
+        Returns
+        -------
+        None
+        """
+        qn = connection.ops.quote_name
+        fields = model._meta.concrete_fields
+        defaults = {field.attname: field.get_default() for field in fields}
+        sql = "INSERT INTO {} ({}) VALUES ({})".format(
+            qn(model._meta.db_table),
+            ", ".join(qn(field.column) for field in fields),
+            ", ".join(["%s"] * len(fields)),
+        )
+        batch = []
+        with connection.cursor() as cursor:
+            for row in rows:
+                batch.append([
+                    field.get_db_prep_save(row.get(field.attname, defaults[field.attname]), connection)
+                    for field in fields
+                ])
+                if len(batch) == INSERT_BATCH_SIZE:
+                    cursor.executemany(sql, batch)
+                    batch = []
+            if batch:
+                cursor.executemany(sql, batch)
+
+    def _run_plans(self, connection, run_slow, explain):
+        """Time the three plans and check they agree.
+
+        Parameters
+        ----------
+        connection : django.db.backends.sqlite3.base.DatabaseWrapper
+            The populated benchmark database.
+        run_slow : bool
+            Whether to run the legacy and correlated plans.
+        explain : bool
+            Print each query's plan.
+
+        Returns
+        -------
+        list
+            Seconds taken by the legacy, correlated and single-pass plans;
+            ``None`` for skipped plans.
+        """
+        correlated = Author.objects.order_by().annotate(
+            **{f"actual_{column}": value for column, value in Author.objects.counter_expressions().items()}
+        ).values_list("pk", "actual_solo_book_count", "actual_coauthored_book_count")
+        plans = [
+            legacy_author_stats_queryset().query.get_compiler(connection=connection).as_sql() if run_slow else None,
+            correlated.query.get_compiler(connection=connection).as_sql() if run_slow else None,
+            author_book_counts_sql(connection=connection),
+        ]
+
+        timings, results = [], []
+        for plan in plans:
+            if plan is None:
+                timings.append(None)
+                continue
+            sql, params = plan
+            with connection.cursor() as cursor:
+                if explain:
+                    cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+                    self.stdout.write("\n".join(str(row[-1]) for row in cursor.fetchall()))
+                start = perf_counter()
+                cursor.execute(sql, params)
+                rows = cursor.fetchall()
+                timings.append(perf_counter() - start)
+            results.append({row[0]: tuple(row[-2:]) for row in rows if any(row[-2:])})
+
+        if any(result != results[-1] for result in results):
+            raise CommandError("The query plans returned different counts.")
+        return timings
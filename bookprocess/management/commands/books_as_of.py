@@ -0,0 +1,75 @@
+"""Management command to reconstruct the whole catalog at a past moment.
+
+Every book alive at the requested timestamp is rebuilt from the audit
+trail (see :class:`bookprocess.services.BookHistoryService`) and written
+as one JSON object per line, so the output can be streamed into other
+tools without holding the catalog in memory.
+"""
+from json import dumps
+from pathlib import Path
+
+from bookprocess.services import BookHistoryService
+from bookprocess.utils import notify, parse_as_of
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    """Write the catalog as of a timestamp as JSON lines."""
+
+    def add_arguments(self, parser):
+        """Register command-line arguments.
+
+        Parameters
+        ----------
+        parser : argparse.ArgumentParser
+            The parser instance provided by Django's management
+            framework. This method should call ``add_argument`` on the
+            parser to declare accepted CLI parameters.
+
+        Returns
+        -------
+        None
+        """
+        parser.add_argument("as_of", type=str, help="Date or datetime to reconstruct (ISO format).")
+        parser.add_argument(
+            "--output",
+            type=str,
+            help="Path of the JSON lines file to write (defaults to stdout).",
+        )
+
+    def handle(self, *args, **options):
+        """Execute the reconstruction.
+
+        Parameters
+        ----------
+        *args
+            Positional arguments passed by Django.
+        **options
+            A mapping containing the parsed CLI options. Expected keys:
+
+            - ``as_of`` (str): date or datetime to reconstruct.
+            - ``output`` (str, optional): destination file path.
+
+        Returns
+        -------
+        None
+        """
+        request = getattr(self, "request", None)
+
+        as_of = parse_as_of(options["as_of"])
+        if as_of is None:
+            raise CommandError(f"Invalid date: {options['as_of']}")
+
+        output = options.get("output")
+        stream = open(Path(output), "w", encoding="utf-8") if output else self.stdout
+        count = 0
+        try:
+            for object_pk, state in BookHistoryService.catalog_as_of(as_of):
+                stream.write(dumps({"pk": object_pk, **state}, ensure_ascii=False, default=str) + "\n")
+                count += 1
+        finally:
+            if output:
+                stream.close()
+
+        if output:
+            notify(request, self, f"Reconstructed {count} book(s) as of {as_of:%Y-%m-%d %H:%M:%S}.", "success")
@@ -0,0 +1,59 @@
+"""Management command to write book history checkpoints.
+
+Checkpoints are periodic snapshots of a book's audited state. They keep
+point-in-time reconstruction cheap by bounding how many audit entries
+must be replayed. Entries logged through
+:class:`bookprocess.services.AuditLogService` are checkpointed as they
+are written; this command backfills every other entry and is meant to be
+run periodically (for example after large imports).
+"""
+from bookprocess.services import BookHistoryService, CHECKPOINT_INTERVAL
+from bookprocess.utils import notify
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    """Create the missing :class:`bookprocess.models.BookCheckpoint` rows."""
+
+    def add_arguments(self, parser):
+        """Register command-line arguments.
+
+        Parameters
+        ----------
+        parser : argparse.ArgumentParser
+            The parser instance provided by Django's management
+            framework. This method should call ``add_argument`` on the
+            parser to declare accepted CLI parameters.
+
+        Returns
+        -------
+        None
+        """
+        parser.add_argument(
+            "--interval",
+            type=int,
+            default=CHECKPOINT_INTERVAL,
+            help="Number of audit entries folded into each checkpoint.",
+        )
+
+    def handle(self, *args, **options):
+        """Execute the checkpoint backfill.
+
+        Parameters
+        ----------
+        *args
+            Positional arguments passed by Django.
+        **options
+            A mapping containing the parsed CLI options. Expected keys:
+
+            - ``interval`` (int, optional): entries per checkpoint.
+
+        Returns
+        -------
+        None
+        """
+        request = getattr(self, "request", None)
+        interval = options.get("interval") or CHECKPOINT_INTERVAL
+
+        created = BookHistoryService.build_checkpoints(interval=interval)
+        notify(request, self, f"Created {created} book checkpoint(s).", "success")
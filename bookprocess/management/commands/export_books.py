@@ -0,0 +1,57 @@
+"""Management command to export the catalog as an import bundle.
+
+The written ZIP holds a ``books.xlsx`` sheet with the columns
+``admin_init_book`` expects and the cover images it references, so the
+bundle can be imported into another library as is (see
+:mod:`bookprocess.exports`).
+"""
+from pathlib import Path
+
+from bookprocess.exports import write_export_bundle
+from bookprocess.utils import notify
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    """Write every book, with its authors and cover, to a ZIP bundle."""
+
+    def add_arguments(self, parser):
+        """Register command-line arguments.
+
+        Parameters
+        ----------
+        parser : argparse.ArgumentParser
+            The parser instance provided by Django's management
+            framework. This method should call ``add_argument`` on the
+            parser to declare accepted CLI parameters.
+
+        Returns
+        -------
+        None
+        """
+        parser.add_argument("output", type=str, help="Path of the ZIP bundle to write.")
+
+    def handle(self, *args, **options):
+        """Execute the export.
+
+        Parameters
+        ----------
+        *args
+            Positional arguments passed by Django.
+        **options
+            A mapping containing the parsed CLI options. Expected keys:
+
+            - ``output`` (str): destination ZIP path.
+
+        Returns
+        -------
+        None
+        """
+        request = getattr(self, "request", None)
+
+        output = Path(options["output"])
+        if output.suffix.lower() != ".zip":
+            raise CommandError("The output file must have a .zip extension.")
+
+        books, covers = write_export_bundle(output)
+        notify(request, self, f"Exported {books} book(s) and {covers} cover(s) to {output}.", "success")
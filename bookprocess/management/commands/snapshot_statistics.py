@@ -0,0 +1,68 @@
+"""Management command to record the daily statistics snapshot.
+
+Each run stores one :class:`bookprocess.models.Statistic` row for the
+day, built from the counter caches; running it again on the same day
+refreshes that row. Schedule it once a day (for example from cron) to
+build the time series shown by the statistics admin.
+"""
+from bookprocess.models import Statistic
+from bookprocess.utils import notify
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_date
+
+
+class Command(BaseCommand):
+    """Write today's (or the given day's) statistics snapshot."""
+
+    def add_arguments(self, parser):
+        """Register command-line arguments.
+
+        Parameters
+        ----------
+        parser : argparse.ArgumentParser
+            The parser instance provided by Django's management
+            framework. This method should call ``add_argument`` on the
+            parser to declare accepted CLI parameters.
+
+        Returns
+        -------
+        None
+        """
+        parser.add_argument(
+            "--date",
+            type=str,
+            help="Day to store the snapshot under (ISO format, defaults to today).",
+        )
+
+    def handle(self, *args, **options):
+        """Execute the snapshot.
+
+        Parameters
+        ----------
+        *args
+            Positional arguments passed by Django.
+        **options
+            A mapping containing the parsed CLI options. Expected keys:
+
+            - ``date`` (str, optional): day of the snapshot.
+
+        Returns
+        -------
+        None
+        """
+        request = getattr(self, "request", None)
+
+        day = None
+        if options.get("date"):
+            day = parse_date(options["date"])
+            if day is None:
+                raise CommandError(f"Invalid date: {options['date']}")
+
+        snapshot = Statistic.objects.snapshot(day)
+        notify(
+            request,
+            self,
+            f"Saved statistics for {snapshot.date:%Y-%m-%d}: {snapshot.total_books} book(s), "
+            f"{snapshot.total_authors} author(s), {snapshot.adaptation_ratio:.0%} adapted.",
+            "success",
+        )
@@ -0,0 +1,89 @@
+"""Management command to sync all reference data in one go.
+
+Genres, nationalities and permission groups are compared with their data
+files under ``bookprocess/data`` (see :mod:`bookprocess.reference`). A
+run against an up-to-date database only reads each table once, so the
+command can be part of every deployment or application start.
+"""
+from bookprocess.reference import REFERENCE_MODELS, sync_reference, sync_roles
+from bookprocess.utils import notify
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    """Sync genres, nationalities and roles with the reference data files."""
+
+    def add_arguments(self, parser):
+        """Register command-line arguments.
+
+        Parameters
+        ----------
+        parser : argparse.ArgumentParser
+            The parser instance provided by Django's management
+            framework. This method should call ``add_argument`` on the
+            parser to declare accepted CLI parameters.
+
+        Returns
+        -------
+        None
+        """
+        parser.add_argument(
+            "--user",
+            type=str,
+            help="Username of the user performing this action (for audit logging).",
+        )
+        parser.add_argument(
+            "--prune",
+            action="store_true",
+            help="Delete unused rows and groups that are not in the reference data.",
+        )
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Only report drift without writing; fail when the database is out of sync.",
+        )
+
+    def handle(self, *args, **options):
+        """Execute the sync.
+
+        Parameters
+        ----------
+        *args
+            Positional arguments passed by Django.
+        **options
+            A mapping containing the parsed CLI options. Expected keys:
+
+            - ``user`` (str, optional): username to set as the audit actor.
+            - ``prune`` (bool, optional): delete rows missing from the files.
+            - ``check`` (bool, optional): report drift only.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        django.core.management.base.CommandError
+            With ``--check``, when any table differs from its data file.
+        """
+        username = options.get("user")
+        user = User.objects.filter(username=username).first() if username else None
+        request = getattr(self, "request", None)
+        apply = not options.get("check", False)
+        prune = options.get("prune", False)
+
+        reports = [
+            sync_reference(name, user=user, prune=prune, apply=apply)
+            for name in REFERENCE_MODELS
+        ]
+        reports.append(sync_roles(prune=prune, apply=apply))
+
+        for report in reports:
+            for msg, level in report.messages():
+                notify(request, self, msg, level)
+
+        if not apply and not all(report.in_sync for report in reports):
+            raise CommandError("Reference data is out of sync.")
@@ -0,0 +1,73 @@
+"""Management command to verify and repair the counter-cache columns.
+
+The counters on ``Author``, ``Genre`` and ``Nationality`` are maintained
+incrementally by :mod:`bookprocess.signals`. This command recomputes
+them from the underlying tables, reports every row that drifted and,
+with ``--repair``, rewrites the drifted rows.
+"""
+from bookprocess.models import Author, Genre, Nationality
+from bookprocess.utils import notify
+from django.core.management.base import BaseCommand
+
+COUNTER_MODELS = (Author, Genre, Nationality) #: Models carrying counter-cache columns.
+
+
+class Command(BaseCommand):
+    """Report (and optionally fix) counter-cache drift."""
+
+    def add_arguments(self, parser):
+        """Register command-line arguments.
+
+        Parameters
+        ----------
+        parser : argparse.ArgumentParser
+            The parser instance provided by Django's management
+            framework. This method should call ``add_argument`` on the
+            parser to declare accepted CLI parameters.
+
+        Returns
+        -------
+        None
+        """
+        parser.add_argument(
+            "--repair",
+            action="store_true",
+            help="Rewrite the counters of every drifted row.",
+        )
+
+    def handle(self, *args, **options):
+        """Execute the verification.
+
+        Parameters
+        ----------
+        *args
+            Positional arguments passed by Django.
+        **options
+            A mapping containing the parsed CLI options. Expected keys:
+
+            - ``repair`` (bool, optional): fix the drifted rows.
+
+        Returns
+        -------
+        None
+        """
+        request = getattr(self, "request", None)
+        repair = options.get("repair", False)
+
+        for model in COUNTER_MODELS:
+            label = model._meta.verbose_name_plural.title()
+            columns = model.counter_fields
+            drifted = list(model.objects.counter_drift())
+
+            for obj in drifted:
+                details = ", ".join(
+                    f"{column} {getattr(obj, column)} != {getattr(obj, f'actual_{column}')}" for column in columns
+                    if getattr(obj, column) != getattr(obj, f"actual_{column}")
+                )
+                notify(request, self, f"{label} '{obj}': {details}", "warning")
+
+            if drifted and repair:
+                model.objects.refresh_counters([obj.pk for obj in drifted])
+                notify(request, self, f"{label}: repaired {len(drifted)} row(s).", "success")
+            elif not drifted:
+                notify(request, self, f"{label}: counters are consistent.", "success")
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-18 21:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookprocess', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BookCheckpoint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('object_pk', models.CharField(max_length=255)),
+                ('log_entry_id', models.BigIntegerField()),
+                ('timestamp', models.DateTimeField()),
+                ('state', models.JSONField(null=True)),
+            ],
+            options={
+                'ordering': ['object_pk', '-timestamp'],
+                'indexes': [models.Index(fields=['object_pk', 'timestamp'], name='bookcheckpoint_pk_ts')],
+            },
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-18 21:42
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def fill_primary_nationality(apps, schema_editor):
+    """Populate ``Book.primary_nationality`` from each book's first author."""
+    Book = apps.get_model('bookprocess', 'Book')
+    BookAuthor = apps.get_model('bookprocess', 'BookAuthor')
+    first_nationality = (
+        BookAuthor.objects.filter(book=OuterRef('pk'))
+        .order_by('order', 'pk')
+        .values('author__nationality_id')[:1]
+    )
+    Book.objects.update(primary_nationality_id=Subquery(first_nationality))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookprocess', '0002_bookcheckpoint'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='book',
+            name='primary_nationality',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='primary_books', to='bookprocess.nationality'),
+        ),
+        migrations.RunPython(fill_primary_nationality, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,70 @@
+# Generated by Django 5.2.18 on 2026-10-18 21:44
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def _count_of(queryset, group_field):
+    """Return a correlated ``COUNT`` subquery defaulting to zero."""
+    counted = queryset.order_by().values(group_field).annotate(count=Count('pk')).values('count')
+    return Coalesce(Subquery(counted), 0)
+
+
+def fill_counters(apps, schema_editor):
+    """Compute the counter-cache columns for existing rows."""
+    Author = apps.get_model('bookprocess', 'Author')
+    Book = apps.get_model('bookprocess', 'Book')
+    BookAuthor = apps.get_model('bookprocess', 'BookAuthor')
+    Genre = apps.get_model('bookprocess', 'Genre')
+    Nationality = apps.get_model('bookprocess', 'Nationality')
+
+    Genre.objects.update(book_count=_count_of(Book.objects.filter(genre=OuterRef('pk')), 'genre'))
+    Nationality.objects.update(author_count=_count_of(Author.objects.filter(nationality=OuterRef('pk')), 'nationality'))
+
+    authors_per_book = (
+        BookAuthor.objects.filter(book=OuterRef('book'))
+        .order_by().values('book').annotate(count=Count('pk')).values('count')
+    )
+    links = BookAuthor.objects.filter(author=OuterRef('pk')).annotate(num_authors=Subquery(authors_per_book))
+    Author.objects.update(
+        book_count=_count_of(links, 'author'),
+        solo_book_count=_count_of(links.filter(num_authors=1), 'author'),
+        coauthored_book_count=_count_of(links.filter(num_authors__gt=1), 'author'),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookprocess', '0003_book_primary_nationality'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='author',
+            name='book_count',
+            field=models.PositiveIntegerField(db_index=True, default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='author',
+            name='coauthored_book_count',
+            field=models.PositiveIntegerField(db_index=True, default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='author',
+            name='solo_book_count',
+            field=models.PositiveIntegerField(db_index=True, default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='genre',
+            name='book_count',
+            field=models.PositiveIntegerField(db_index=True, default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='nationality',
+            name='author_count',
+            field=models.PositiveIntegerField(db_index=True, default=0, editable=False),
+        ),
+        migrations.RunPython(fill_counters, migrations.RunPython.noop),
+    ]
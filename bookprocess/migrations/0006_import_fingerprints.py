@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-18 21:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookprocess', '0005_importrun'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='author',
+            name='import_fingerprint',
+            field=models.CharField(blank=True, default='', editable=False, max_length=64),
+        ),
+        migrations.AddField(
+            model_name='book',
+            name='import_fingerprint',
+            field=models.CharField(blank=True, default='', editable=False, max_length=64),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 21:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookprocess', '0006_import_fingerprints'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='importrun',
+            name='log_file',
+            field=models.FileField(blank=True, upload_to='import_logs/'),
+        ),
+    ]
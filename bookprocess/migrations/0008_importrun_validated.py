@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 21:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookprocess', '0007_importrun_log_file'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='importrun',
+            name='status',
+            field=models.CharField(choices=[('running', 'Running'), ('completed', 'Completed'), ('failed', 'Failed'), ('validated', 'Validated only')], default='running', max_length=10),
+        ),
+    ]
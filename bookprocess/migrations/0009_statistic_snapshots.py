@@ -0,0 +1,59 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:10
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+def drop_undated_statistics(apps, schema_editor):
+    """Remove the old container rows; they cannot be given a snapshot date."""
+    apps.get_model("bookprocess", "Statistic").objects.filter(date__isnull=True).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookprocess', '0008_importrun_validated'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='statistic',
+            options={'ordering': ['-date'], 'verbose_name_plural': 'Statistics'},
+        ),
+        migrations.RemoveField(
+            model_name='statistic',
+            name='authors_stats',
+        ),
+        migrations.AddField(
+            model_name='statistic',
+            name='date',
+            field=models.DateField(null=True),
+        ),
+        migrations.RunPython(drop_undated_statistics, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='statistic',
+            name='date',
+            field=models.DateField(unique=True),
+        ),
+        migrations.AddField(
+            model_name='statistic',
+            name='total_books',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='statistic',
+            name='total_authors',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='statistic',
+            name='adapted_books',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='statistic',
+            name='taken_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:33
+
+from django.db import migrations, models
+
+from bookprocess.utils import normalize_search_name
+
+
+def fill_search_names(apps, schema_editor):
+    """Compute the normalized search name of existing authors."""
+    Author = apps.get_model('bookprocess', 'Author')
+    authors = list(Author.objects.only('first_name', 'last_name'))
+    for author in authors:
+        author.search_name = normalize_search_name(author.last_name, author.first_name)
+    Author.objects.bulk_update(authors, ['search_name'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookprocess', '0009_statistic_snapshots'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='author',
+            name='search_name',
+            field=models.CharField(blank=True, db_index=True, default='', editable=False, max_length=201),
+        ),
+        migrations.RunPython(fill_search_names, migrations.RunPython.noop),
+    ]
@@ -6,15 +6,23 @@ This module defines the core data models used by the application:
 - ``Author`` -- book author
 - ``Book`` -- main book record
 - ``BookAuthor`` -- through model to order book authors
-- ``Statistic`` -- simple JSON-backed statistics container
+- ``Statistic`` -- daily snapshot of the catalog statistics
+- ``BookCheckpoint`` -- periodic snapshot of a book's audited state
+- ``ImportRun`` -- progress checkpoint of a spreadsheet import
+- ``IsbnReallocation`` -- status of a background ISBN re-allocation
 """
 
+from datetime import timedelta
+
 from auditlog.registry import auditlog
 from django.contrib.auth import get_user_model
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Count, F, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce, Substr
 from django.core.validators import RegexValidator
+from django.utils import timezone
 
-from .utils import generate_unique_isbn_from_book
+from .utils import generate_unique_isbn_from_book, isbn_nat_code, normalize_search_name
 
 User = get_user_model()
 isbn_validator = RegexValidator(
@@ -23,10 +31,130 @@ isbn_validator = RegexValidator(
     code="invalid_isbn",
 )
 
-class Nationality(models.Model):
+SEARCH_NAME_END = "\U0010ffff" #: Sorts after every name, closing the prefix ranges of :meth:`AuthorManager.search`.
+
+def _count_of(queryset, group_field):
+    """Return a correlated ``COUNT`` subquery defaulting to zero.
+
+    Parameters
+    ----------
+    queryset : django.db.models.query.QuerySet
+        Rows to count, already filtered on an ``OuterRef``.
+    group_field : str
+        Field the rows are grouped by (the correlated foreign key).
+
+    Returns
+    -------
+    django.db.models.functions.Coalesce
+        Expression usable in ``update()`` and ``annotate()``.
+    """
+    counted = queryset.order_by().values(group_field).annotate(count=Count("pk")).values("count")
+    return Coalesce(Subquery(counted), 0)
+
+
+class CounterCacheManager(models.Manager):
+    """Manager for models carrying counter-cache columns.
+
+    Subclasses implement :meth:`counter_expressions`, mapping each counter
+    column to the expression computing its true value. The counters are
+    refreshed by :mod:`bookprocess.signals` and by the bulk code paths, and
+    checked by the ``verify_counters`` management command.
+    """
+
+    def counter_expressions(self):
+        """Return ``{column: expression}`` for the model's counter columns.
+
+        Returns
+        -------
+        dict
+            Mapping of counter column name to a query expression.
+        """
+        raise NotImplementedError
+
+    def refresh_counters(self, ids=None):
+        """Recompute the counter columns in a single UPDATE.
+
+        Parameters
+        ----------
+        ids : Iterable[int], optional
+            Primary keys to refresh; every row when ``None``.
+
+        Returns
+        -------
+        int
+            Number of rows updated.
+        """
+        rows = self.all() if ids is None else self.filter(pk__in=ids)
+        return rows.update(**self.counter_expressions())
+
+    def counter_drift(self):
+        """Return the rows whose stored counters differ from their true value.
+
+        Returns
+        -------
+        django.db.models.query.QuerySet
+            Rows annotated with ``actual_<column>`` for every counter column.
+        """
+        expressions = self.counter_expressions()
+        drifted = Q()
+        for column in expressions:
+            drifted |= ~Q(**{column: F(f"actual_{column}")})
+        return self.annotate(**{f"actual_{column}": value for column, value in expressions.items()}).filter(drifted)
+
+
+class CounterCacheModel(models.Model):
+    """Abstract base for models carrying counter-cache columns.
+
+    Counters are written with set-based UPDATEs, so an instance loaded
+    earlier may hold stale values; saving an existing row therefore never
+    writes the columns listed in :attr:`counter_fields`.
+    """
+    counter_fields = () #: Names of the counter-cache columns.
+
+    class Meta:
+        """Model metadata for :class:`CounterCacheModel`."""
+        abstract = True
+
+    def save(self, *args, **kwargs):
+        """Save the instance, leaving counter columns untouched on updates.
+
+        Parameters
+        ----------
+        *args
+            Positional arguments passed to the parent save method.
+        **kwargs
+            Keyword arguments passed to the parent save method.
+        """
+        if not self._state.adding and kwargs.get("update_fields") is None and not kwargs.get("force_insert"):
+            kwargs["update_fields"] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.counter_fields
+            ]
+        super().save(*args, **kwargs)
+
+
+class NationalityManager(CounterCacheManager):
+    """Manager maintaining :attr:`Nationality.author_count`."""
+
+    def counter_expressions(self):
+        """Return the expression computing ``author_count``.
+
+        Returns
+        -------
+        dict
+            Mapping of counter column name to a query expression.
+        """
+        return {"author_count": _count_of(Author.objects.filter(nationality=OuterRef("pk")), "nationality")}
+
+
+class Nationality(CounterCacheModel):
     """A country or nationality used to classify authors."""
     name = models.CharField(max_length=100, unique=True) #: Human-readable name of the nationality (unique).
     code = models.CharField(max_length=3, unique=True) #: ISO-like short code for the nationality (unique, max length 3).
+    author_count = models.PositiveIntegerField(default=0, editable=False, db_index=True) #: Number of authors with this nationality (counter cache).
+
+    objects = NationalityManager() #: Manager maintaining the counter columns.
+    counter_fields = ("author_count",) #: Counter-cache columns.
 
     class Meta:
         """Model metadata for :class:`Nationality`."""
@@ -44,12 +172,30 @@ class Nationality(models.Model):
         return f"{self.name}"
 
 
-auditlog.register(Nationality)
+auditlog.register(Nationality, exclude_fields=list(Nationality.counter_fields))
+
+
+class GenreManager(CounterCacheManager):
+    """Manager maintaining :attr:`Genre.book_count`."""
+
+    def counter_expressions(self):
+        """Return the expression computing ``book_count``.
+
+        Returns
+        -------
+        dict
+            Mapping of counter column name to a query expression.
+        """
+        return {"book_count": _count_of(Book.objects.filter(genre=OuterRef("pk")), "genre")}
 
 
-class Genre(models.Model):
+class Genre(CounterCacheModel):
     """A book genre/category."""
     name = models.CharField(max_length=100, unique=True) #: Name of the genre (unique).
+    book_count = models.PositiveIntegerField(default=0, editable=False, db_index=True) #: Number of books in this genre (counter cache).
+
+    objects = GenreManager() #: Manager maintaining the counter columns.
+    counter_fields = ("book_count",) #: Counter-cache columns.
 
     class Meta:
         """Model metadata for :class:`Genre`."""
@@ -66,14 +212,111 @@ class Genre(models.Model):
         return f"{self.name}"
 
 
-auditlog.register(Genre)
+auditlog.register(Genre, exclude_fields=list(Genre.counter_fields))
+
+
+class AuthorManager(CounterCacheManager):
+    """Manager maintaining the book counters of :class:`Author`."""
+
+    def counter_expressions(self):
+        """Return the expressions computing the author book counters.
+
+        A book is solo when it has exactly one author and co-authored when
+        it has more.
+
+        Returns
+        -------
+        dict
+            Mapping of counter column name to a query expression.
+        """
+        authors_per_book = (
+            BookAuthor.objects.filter(book=OuterRef("book"))
+            .order_by().values("book").annotate(count=Count("pk")).values("count")
+        )
+        links = BookAuthor.objects.filter(author=OuterRef("pk")).annotate(num_authors=Subquery(authors_per_book))
+        return {
+            "book_count": _count_of(links, "author"),
+            "solo_book_count": _count_of(links.filter(num_authors=1), "author"),
+            "coauthored_book_count": _count_of(links.filter(num_authors__gt=1), "author"),
+        }
+
+    def refresh_counters(self, ids=None):
+        """Recompute the author counters with one scan of ``BookAuthor``.
+
+        The correlated expressions of :meth:`counter_expressions` recount
+        a book's authors for every link; the refresh uses the single-pass
+        query of :mod:`bookprocess.statistics` instead and only writes
+        the authors whose counters changed.
+
+        Parameters
+        ----------
+        ids : Iterable[int], optional
+            Primary keys to refresh; every row when ``None``.
+
+        Returns
+        -------
+        int
+            Number of rows updated.
+        """
+        from .statistics import refresh_author_counters
+
+        return refresh_author_counters(ids, using=self.db)
+
+    def search(self, term, queryset=None):
+        """Return the authors whose name starts with ``term``.
+
+        The term is normalized like :attr:`Author.search_name` and matched
+        as a prefix of the indexed ``"last first"`` name. A name typed
+        first name first is matched too: its last word must start the
+        indexed name and the other words must start later words of it.
+        The first alternative is a range on the index; the second reads
+        the index range of the last word and checks the other words on
+        those rows only, with a substring test. A first name on its own
+        therefore does not match.
+
+        Parameters
+        ----------
+        term : str
+            Text typed by the user, e.g. ``"pop"``, ``"pop io"`` or ``"Ion Pop"``.
+        queryset : django.db.models.query.QuerySet, optional
+            Authors to search; all of them when omitted.
+
+        Returns
+        -------
+        django.db.models.query.QuerySet
+            Matching authors ordered by ``search_name``; ``queryset``
+            unfiltered when the term is blank.
+        """
+        if queryset is None:
+            queryset = self.get_queryset()
+        words = normalize_search_name(term).split()
+        if not words:
+            return queryset
+
+        def starts_with(prefix):
+            return Q(search_name__gte=prefix, search_name__lt=prefix + SEARCH_NAME_END)
+
+        condition = starts_with(" ".join(words))
+        if len(words) > 1:
+            condition |= starts_with(words[-1]) & Q(
+                *(Q(search_name__contains=f" {word}") for word in words[:-1])
+            )
+        return queryset.filter(condition).order_by("search_name", "pk")
 
 
-class Author(models.Model):
+class Author(CounterCacheModel):
     """An author of books in the library."""
     first_name = models.CharField(max_length=100) #: Given name of the author.
     last_name = models.CharField(max_length=100) #: Family name of the author.
     nationality = models.ForeignKey(Nationality, on_delete=models.PROTECT, default=0) #: Foreign key to the author's nationality.
+    book_count = models.PositiveIntegerField(default=0, editable=False, db_index=True) #: Number of books by this author (counter cache).
+    solo_book_count = models.PositiveIntegerField(default=0, editable=False, db_index=True) #: Number of books this author wrote alone (counter cache).
+    coauthored_book_count = models.PositiveIntegerField(default=0, editable=False, db_index=True) #: Number of books this author co-wrote (counter cache).
+    import_fingerprint = models.CharField(max_length=64, blank=True, default="", editable=False) #: Hash of the spreadsheet row this author was last imported from.
+    search_name = models.CharField(max_length=201, blank=True, default="", editable=False, db_index=True) #: Normalized "last first" name searched by the author pickers.
+
+    objects = AuthorManager() #: Manager maintaining the counter columns.
+    counter_fields = ("book_count", "solo_book_count", "coauthored_book_count") #: Counter-cache columns.
 
     def name(self):
         """Return the author's full name as "First Last".
@@ -85,6 +328,22 @@ class Author(models.Model):
         """
         return f"{self.first_name} {self.last_name}"
 
+    def save(self, *args, **kwargs):
+        """Save the author, keeping :attr:`search_name` in step with the name.
+
+        Parameters
+        ----------
+        *args
+            Positional arguments passed to the parent save method.
+        **kwargs
+            Keyword arguments passed to the parent save method.
+        """
+        self.search_name = normalize_search_name(self.last_name, self.first_name)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and {"first_name", "last_name"} & set(update_fields):
+            kwargs["update_fields"] = {*update_fields, "search_name"}
+        super().save(*args, **kwargs)
+
     class Meta:
         """Model metadata for :class:`Author`."""
         ordering = ['last_name', 'first_name'] #: Default ordering used when querying authors in the admin.
@@ -103,7 +362,89 @@ class Author(models.Model):
         return f"{self.first_name} {self.last_name}"
 
 
-auditlog.register(Author)
+auditlog.register(Author, exclude_fields=list(Author.counter_fields) + ['import_fingerprint', 'search_name'])
+
+
+class BookManager(models.Manager):
+    """Manager for :class:`Book` with helpers for denormalized columns."""
+
+    def refresh_primary_nationality(self, book_ids):
+        """Recompute ``primary_nationality`` for the given books in one UPDATE.
+
+        The value is the nationality of the author with the lowest
+        :attr:`BookAuthor.order`, or ``NULL`` for books without authors.
+
+        Parameters
+        ----------
+        book_ids : Iterable[int] or django.db.models.query.QuerySet
+            Primary keys of the books to refresh (a ``values('pk')``
+            queryset is used as a subquery).
+
+        Returns
+        -------
+        int
+            Number of rows updated.
+        """
+        first_nationality = (
+            BookAuthor.objects.filter(book=OuterRef("pk"))
+            .order_by("order", "pk")
+            .values("author__nationality_id")[:1]
+        )
+        return self.filter(pk__in=book_ids).update(primary_nationality_id=Subquery(first_nationality))
+
+    def first_authored_by(self, author):
+        """Return the books whose first author (lowest ``order``) is ``author``.
+
+        Parameters
+        ----------
+        author : Author, int or Iterable[int]
+            The author, its primary key, or the primary keys of several
+            authors.
+
+        Returns
+        -------
+        django.db.models.query.QuerySet
+        """
+        first_author = (
+            BookAuthor.objects.filter(book=OuterRef("pk"))
+            .order_by("order", "pk")
+            .values("author_id")[:1]
+        )
+        author = getattr(author, "pk", author)
+        author_ids = [author] if isinstance(author, int) else list(author)
+        return self.filter(
+            pk__in=BookAuthor.objects.filter(author_id__in=author_ids).values("book_id")
+        ).annotate(first_author_id=Subquery(first_author)).filter(first_author_id__in=author_ids)
+
+    def isbn_mismatches(self, queryset=None):
+        """Return the books whose ISBN country segment no longer matches their first author.
+
+        The expected segment of every nationality is computed once with
+        :func:`bookprocess.utils.isbn_nat_code`; the books are then
+        compared on the indexed ``primary_nationality`` column in a
+        single query. Books without authors are never reported.
+
+        Parameters
+        ----------
+        queryset : django.db.models.query.QuerySet, optional
+            Books to check; defaults to all books.
+
+        Returns
+        -------
+        django.db.models.query.QuerySet
+            The mismatched books.
+        """
+        queryset = self.get_queryset() if queryset is None else queryset
+        expected = {}
+        for pk, code in Nationality.objects.values_list("pk", "code"):
+            expected.setdefault(isbn_nat_code(code), []).append(pk)
+        if not expected:
+            return queryset.none()
+
+        mismatch = Q()
+        for code, ids in expected.items():
+            mismatch |= Q(primary_nationality_id__in=ids) & ~Q(isbn_country=code)
+        return queryset.annotate(isbn_country=Substr("isbn", 4, 3)).filter(mismatch)
 
 
 class Book(models.Model):
@@ -121,6 +462,17 @@ class Book(models.Model):
         validators=[isbn_validator],
         help_text="ISBN-13: 13 digits, generated automatically.",
     ) #: Unique, non-editable ISBN generated for the book.
+    primary_nationality = models.ForeignKey(
+        Nationality,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name="primary_books",
+    ) #: Nationality of the first author, kept in sync by :mod:`bookprocess.signals` and :class:`BookAuthorManager`.
+    import_fingerprint = models.CharField(max_length=64, blank=True, default="", editable=False) #: Hash of the spreadsheet row this book was last imported from.
+
+    objects = BookManager() #: Manager providing denormalized-column helpers.
 
     def generate_isbn(self):
         """Generate a unique ISBN for this book.
@@ -158,7 +510,235 @@ class Book(models.Model):
         """Model metadata for :class:`Book`."""
         ordering = ['title'] #: Default ordering for books (by title).
 
-auditlog.register(Book)
+auditlog.register(Book, exclude_fields=['primary_nationality', 'import_fingerprint'])
+
+class BookAuthorManager(models.Manager):
+    """Manager with batched operations on a book's ordered author list.
+
+    Orders are assigned in memory and written with ``bulk_create`` and
+    ``bulk_update`` inside a single transaction, instead of one
+    ``MAX(order)`` query and one ``INSERT``/``UPDATE`` per row.
+    Authors may be given as :class:`Author` instances or primary keys.
+    """
+
+    @staticmethod
+    def _author_ids(authors):
+        """Return author primary keys in order, without duplicates.
+
+        Parameters
+        ----------
+        authors : Iterable[Author or int]
+            Authors or author primary keys.
+
+        Returns
+        -------
+        list[int]
+            Unique author ids, keeping their first position.
+        """
+        ids = (getattr(author, "pk", author) for author in authors)
+        return list(dict.fromkeys(ids))
+
+    def attach(self, book, authors):
+        """Append authors to the end of a book's author list.
+
+        Authors already linked to the book are left where they are.
+
+        Parameters
+        ----------
+        book : Book
+            The book to link the authors to.
+        authors : Iterable[Author or int]
+            Authors to append, in order.
+
+        Returns
+        -------
+        list[BookAuthor]
+            The newly created relations.
+        """
+        with transaction.atomic():
+            existing = dict(self.filter(book=book).values_list("author_id", "order"))
+            next_order = max(existing.values(), default=0) + 1
+
+            links = []
+            for author_id in self._author_ids(authors):
+                if author_id in existing:
+                    continue
+                links.append(self.model(book=book, author_id=author_id, order=next_order))
+                next_order += 1
+            links = self.bulk_create(links)
+
+            if links and not existing:
+                self._sync_primary_nationality(book)
+            if links:
+                self._queue_counters(book)
+            return links
+
+    def attach_to_books(self, books, authors):
+        """Append the same authors to the end of the author lists of several books.
+
+        Like :meth:`attach`, but the existing links of all books are read
+        in one query, the new links inserted with one ``bulk_create`` and
+        ``primary_nationality`` refreshed with one UPDATE for the books
+        that had no author yet. The refreshed column is written to the
+        database only, not to the ``books`` instances.
+
+        Parameters
+        ----------
+        books : Iterable[Book]
+            The books to link the authors to.
+        authors : Iterable[Author or int]
+            Authors to append, in order.
+
+        Returns
+        -------
+        list[BookAuthor]
+            The newly created relations.
+        """
+        from .signals import queue_refresh
+
+        books = list(books)
+        author_ids = self._author_ids(authors)
+        with transaction.atomic():
+            existing = {}
+            for book_id, author_id, order in self.filter(book__in=books).values_list("book_id", "author_id", "order"):
+                existing.setdefault(book_id, {})[author_id] = order
+
+            links, first_links = [], []
+            for book in books:
+                linked = existing.get(book.pk, {})
+                next_order = max(linked.values(), default=0) + 1
+                for author_id in author_ids:
+                    if author_id in linked:
+                        continue
+                    links.append(self.model(book=book, author_id=author_id, order=next_order))
+                    next_order += 1
+                if not linked and next_order > 1:
+                    first_links.append(book.pk)
+            links = self.bulk_create(links)
+
+            if first_links:
+                Book.objects.refresh_primary_nationality(first_links)
+            if links:
+                queue_refresh(book_authors={link.book_id for link in links})
+            return links
+
+    def reorder(self, book, authors):
+        """Renumber a book's existing author links following ``authors``.
+
+        Linked authors missing from ``authors`` keep their relative order
+        after the listed ones.
+
+        Parameters
+        ----------
+        book : Book
+            The book whose authors are reordered.
+        authors : Iterable[Author or int]
+            Authors in their new order.
+
+        Returns
+        -------
+        int
+            Number of relations whose order changed.
+        """
+        with transaction.atomic():
+            links = {link.author_id: link for link in self.filter(book=book).order_by("order")}
+            wanted = [author_id for author_id in self._author_ids(authors) if author_id in links]
+            wanted += [author_id for author_id in links if author_id not in wanted]
+
+            changed = []
+            for order, author_id in enumerate(wanted, start=1):
+                link = links[author_id]
+                if link.order != order:
+                    link.order = order
+                    changed.append(link)
+            updated = self.bulk_update(changed, ["order"])
+
+            if wanted and wanted[0] != next(iter(links)):
+                self._sync_primary_nationality(book)
+            return updated
+
+    def replace(self, book, authors):
+        """Make ``authors`` the book's exact author list, in that order.
+
+        Parameters
+        ----------
+        book : Book
+            The book whose authors are replaced.
+        authors : Iterable[Author or int]
+            The complete new author list.
+
+        Returns
+        -------
+        list[BookAuthor]
+            The book's relations after the update, in order.
+        """
+        with transaction.atomic():
+            links = {link.author_id: link for link in self.filter(book=book).order_by("order")}
+            wanted = self._author_ids(authors)
+            first_before = next(iter(links), None)
+
+            stale = [link.pk for author_id, link in links.items() if author_id not in wanted]
+            if stale:
+                self.filter(pk__in=stale).delete()
+
+            created, changed, result = [], [], []
+            for order, author_id in enumerate(wanted, start=1):
+                link = links.get(author_id)
+                if link is None:
+                    link = self.model(book=book, author_id=author_id, order=order)
+                    created.append(link)
+                elif link.order != order:
+                    link.order = order
+                    changed.append(link)
+                result.append(link)
+
+            self.bulk_create(created)
+            self.bulk_update(changed, ["order"])
+
+            if (wanted[0] if wanted else None) != first_before:
+                self._sync_primary_nationality(book)
+            if created or stale:
+                self._queue_counters(book)
+            return result
+
+    @staticmethod
+    def _queue_counters(book):
+        """Queue the counter refresh for the authors of ``book``.
+
+        ``bulk_create`` sends no signals, so the batched operations queue
+        the refresh themselves.
+
+        Parameters
+        ----------
+        book : Book
+            The book whose author list changed.
+
+        Returns
+        -------
+        None
+        """
+        from .signals import queue_refresh
+
+        queue_refresh(book_authors=[book.pk])
+
+    @staticmethod
+    def _sync_primary_nationality(book):
+        """Refresh ``book.primary_nationality`` in the database and on ``book``.
+
+        Parameters
+        ----------
+        book : Book
+            The book whose first author changed.
+
+        Returns
+        -------
+        None
+        """
+        Book.objects.refresh_primary_nationality([book.pk])
+        book.primary_nationality_id = (
+            Book.objects.filter(pk=book.pk).values_list("primary_nationality_id", flat=True).first()
+        )
+
 
 class BookAuthor(models.Model):
     """Through model that preserves the ordering of authors for a book. """
@@ -166,6 +746,8 @@ class BookAuthor(models.Model):
     author = models.ForeignKey(Author, on_delete=models.PROTECT) #: ForeignKey to the related author.
     order = models.PositiveIntegerField(default=1) #: Position of the author in the book's author list.
 
+    objects = BookAuthorManager() #: Manager providing batched attach/reorder/replace operations.
+
     class Meta:
         """Model metadata for :class:`BookAuthor`."""
         ordering = ['order'] #: Ensures BookAuthor rows are ordered by the ``order`` field
@@ -177,6 +759,9 @@ class BookAuthor(models.Model):
         """
         Auto-assign order based on existing authors for this book.
 
+        This costs one ``MAX(order)`` query per insert; code linking
+        several authors at once should use :class:`BookAuthorManager`.
+
         Parameters
         ----------
         *args
@@ -208,11 +793,123 @@ class BookAuthor(models.Model):
         """
         return f"{self.order}. {self.author}"
 
+class StatisticManager(models.Manager):
+    """Manager for :class:`Statistic` taking and reading daily snapshots."""
+
+    def snapshot(self, day=None):
+        """Record the catalog statistics of ``day``.
+
+        Counts are read from the counter caches of :class:`Genre` and
+        :class:`Nationality`, so a snapshot costs a handful of small
+        queries however large the catalog is. Taking a second snapshot on
+        the same day replaces the first.
+
+        Parameters
+        ----------
+        day : datetime.date, optional
+            Date the snapshot is stored under; defaults to today.
+
+        Returns
+        -------
+        Statistic
+            The saved snapshot.
+        """
+        day = day or timezone.localdate()
+        books = Book.objects.aggregate(total=Count("pk"), adapted=Count("pk", filter=Q(adapted=True)))
+        snapshot, _ = self.update_or_create(
+            date=day,
+            defaults={
+                "books_per_genre": dict(
+                    Genre.objects.filter(book_count__gt=0).order_by("name").values_list("name", "book_count")
+                ),
+                "authors_per_nationality": dict(
+                    Nationality.objects.filter(author_count__gt=0).order_by("name").values_list("name", "author_count")
+                ),
+                "total_books": books["total"],
+                "total_authors": Author.objects.count(),
+                "adapted_books": books["adapted"],
+            },
+        )
+        return snapshot
+
+    def trend(self, days=90, until=None):
+        """Return the snapshots of the last ``days`` days, oldest first.
+
+        Parameters
+        ----------
+        days : int, optional
+            Length of the period.
+        until : datetime.date, optional
+            Last day of the period; defaults to today.
+
+        Returns
+        -------
+        django.db.models.query.QuerySet
+            Snapshots dated within the period.
+        """
+        until = until or timezone.localdate()
+        return self.filter(date__gt=until - timedelta(days=days), date__lte=until).order_by("date")
+
+    def deltas(self, period=7, until=None):
+        """Compare the newest snapshot with the one a ``period`` earlier.
+
+        Parameters
+        ----------
+        period : int, optional
+            Number of days between the compared snapshots. The earlier
+            snapshot is the newest one taken at least ``period`` days
+            before the latest.
+        until : datetime.date, optional
+            Ignore snapshots taken after this day.
+
+        Returns
+        -------
+        dict or None
+            ``current`` and ``previous`` snapshots, the change of each
+            total under ``totals`` (``{name: (value, delta)}``) and of each
+            genre under ``genres``; ``None`` when fewer than two snapshots
+            are that far apart.
+        """
+        snapshots = self.filter(date__lte=until) if until else self.all()
+        current = snapshots.order_by("-date").first()
+        if current is None:
+            return None
+        previous = snapshots.filter(date__lte=current.date - timedelta(days=period)).order_by("-date").first()
+        if previous is None:
+            return None
+
+        totals = {
+            "Books": (current.total_books, current.total_books - previous.total_books),
+            "Authors": (current.total_authors, current.total_authors - previous.total_authors),
+            "Adapted books": (current.adapted_books, current.adapted_books - previous.adapted_books),
+        }
+        genre_names = sorted(set(current.books_per_genre) | set(previous.books_per_genre))
+        genres = {
+            name: (
+                current.books_per_genre.get(name, 0),
+                current.books_per_genre.get(name, 0) - previous.books_per_genre.get(name, 0),
+            )
+            for name in genre_names
+        }
+        return {"current": current, "previous": previous, "totals": totals, "genres": genres}
+
+
 class Statistic(models.Model):
-    """Container for precomputed statistics serialized as JSON."""
-    books_per_genre = models.JSONField(default=dict) #: Mapping of genre identifiers/names to book counts.
-    authors_per_nationality = models.JSONField(default=dict) #: Mapping of nationality identifiers/names to author counts.
-    authors_stats = models.JSONField(default=list) #: Free-form list used to store computed author statistics.
+    """Daily snapshot of the catalog statistics.
+
+    One compact row per day, written by :meth:`StatisticManager.snapshot`
+    (see the ``snapshot_statistics`` command). Trends are read from these
+    rows instead of aggregating the catalog again.
+    """
+    date = models.DateField(unique=True) #: Day the snapshot describes.
+    books_per_genre = models.JSONField(default=dict) #: Mapping of genre names to book counts.
+    authors_per_nationality = models.JSONField(default=dict) #: Mapping of nationality names to author counts.
+    total_books = models.PositiveIntegerField(default=0) #: Number of books in the catalog.
+    total_authors = models.PositiveIntegerField(default=0) #: Number of authors in the catalog.
+    adapted_books = models.PositiveIntegerField(default=0) #: Number of books adapted to film.
+    taken_at = models.DateTimeField(auto_now=True) #: When the snapshot was last written.
+
+    objects = StatisticManager() #: Manager taking and reading snapshots.
 
     class Meta:
         """Model metadata for :class:`Statistic`.
@@ -220,16 +917,243 @@ class Statistic(models.Model):
         Provides a human-friendly verbose name for the admin.
         """
         verbose_name_plural = "Statistics"
+        ordering = ["-date"]
+
+    @property
+    def adaptation_ratio(self):
+        """Share of books adapted to film.
+
+        Returns
+        -------
+        float
+            Between 0 and 1; 0 for an empty catalog.
+        """
+        return self.adapted_books / self.total_books if self.total_books else 0.0
 
     def __str__(self):
         """Return a short summary used in admin lists.
 
-        The string includes counts for stored mappings to make instances
-        identifiable in the admin without expanding the JSON blob.
+        Returns
+        -------
+        str
+            Statistics of the snapshot's date.
+        """
+        return f"{self._meta.verbose_name_plural} {self.date:%Y-%m-%d}"
+
+
+class BookCheckpoint(models.Model):
+    """Periodic snapshot of a book's state rebuilt from the audit trail.
+
+    Checkpoints bound the number of ``LogEntry`` rows that must be replayed
+    to reconstruct a book as of a past timestamp: replay always starts at
+    the newest checkpoint taken at or before the requested moment.
+    """
+    object_pk = models.CharField(max_length=255) #: Primary key of the book, stored like ``LogEntry.object_pk``.
+    log_entry_id = models.BigIntegerField() #: Id of the last audit entry folded into ``state``.
+    timestamp = models.DateTimeField() #: Timestamp of the last audit entry folded into ``state``.
+    state = models.JSONField(null=True) #: Book fields as of ``timestamp``; ``None`` when the book was deleted.
+
+    class Meta:
+        """Model metadata for :class:`BookCheckpoint`."""
+        ordering = ['object_pk', '-timestamp'] #: Newest checkpoint first for each book.
+        indexes = [
+            models.Index(fields=['object_pk', 'timestamp'], name='bookcheckpoint_pk_ts'),
+        ] #: Supports "latest checkpoint at or before" lookups.
+
+    def __str__(self):
+        """Return a short description of the checkpoint.
+
+        Returns
+        -------
+        str
+            String in the format "Book <pk> @ <timestamp>".
+        """
+        return f"Book {self.object_pk} @ {self.timestamp:%Y-%m-%d %H:%M:%S}"
+
+
+
+class ImportRunManager(models.Manager):
+    """Manager for :class:`ImportRun` with the start/resume entry point."""
+
+    def start(self, command, file_name, file_hash, total_rows, user=None, resume=False):
+        """Start a new import run, or pick up the last unfinished one.
+
+        Parameters
+        ----------
+        command : str
+            Name of the importing management command.
+        file_name : str
+            Name of the imported file, for display.
+        file_hash : str
+            SHA-256 of the imported file.
+        total_rows : int
+            Number of data rows in the file.
+        user : django.contrib.auth.models.User, optional
+            The user running the import.
+        resume : bool, optional
+            When True and an unfinished run of the same command over the
+            same file exists, that run is returned instead of a new one.
+
+        Returns
+        -------
+        ImportRun
+            The run to record progress on; its ``last_row`` is the first
+            frame row still to be imported.
+        """
+        if resume:
+            run = (
+                self.filter(
+                    command=command,
+                    file_hash=file_hash,
+                    status__in=[ImportRun.Status.RUNNING, ImportRun.Status.FAILED],
+                )
+                .order_by("-started_at", "-pk")
+                .first()
+            )
+            if run is not None:
+                run.status = ImportRun.Status.RUNNING
+                run.save(update_fields=["status", "updated_at"])
+                return run
+
+        return self.create(
+            command=command,
+            file_name=file_name,
+            file_hash=file_hash,
+            total_rows=total_rows,
+            user=user,
+        )
+
+
+class ImportRun(models.Model):
+    """Progress checkpoint of one spreadsheet import.
+
+    Importers commit rows in chunks and advance ``last_row`` in the same
+    transaction, so after a crash the run can be resumed right after the
+    last committed chunk without re-reading the committed rows.
+    """
+
+    class Status(models.TextChoices):
+        """Lifecycle states of an import run."""
+        RUNNING = "running", "Running"
+        COMPLETED = "completed", "Completed"
+        FAILED = "failed", "Failed"
+        VALIDATED = "validated", "Validated only"
+
+    command = models.CharField(max_length=100) #: Name of the importing management command.
+    file_name = models.CharField(max_length=255) #: Name of the imported file.
+    file_hash = models.CharField(max_length=64) #: SHA-256 of the imported file; identifies the file on resume.
+    user = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True) #: User who started the run.
+    status = models.CharField(max_length=10, choices=Status.choices, default=Status.RUNNING) #: Current state of the run.
+    total_rows = models.PositiveIntegerField(default=0) #: Number of data rows in the file.
+    last_row = models.PositiveIntegerField(default=0) #: Number of leading rows already committed.
+    started_at = models.DateTimeField(auto_now_add=True) #: When the run was started.
+    updated_at = models.DateTimeField(auto_now=True) #: When progress was last recorded.
+    log_file = models.FileField(upload_to='import_logs/', blank=True) #: CSV with every message of the run.
+
+    objects = ImportRunManager()
+
+    class Meta:
+        """Model metadata for :class:`ImportRun`."""
+        ordering = ['-started_at'] #: Newest runs first.
+        indexes = [
+            models.Index(fields=['command', 'file_hash'], name='importrun_command_hash'),
+        ] #: Supports finding the run to resume.
+
+    def __str__(self):
+        """Return a short description of the run.
+
+        Returns
+        -------
+        str
+            String in the format "<command> <file> (<last>/<total>, <status>)".
+        """
+        return f"{self.command} {self.file_name} ({self.last_row}/{self.total_rows}, {self.status})"
+
+    def checkpoint(self, last_row):
+        """Record that the leading ``last_row`` rows are committed.
+
+        Call inside the transaction that committed them.
+
+        Parameters
+        ----------
+        last_row : int
+            Number of leading frame rows processed so far.
+
+        Returns
+        -------
+        None
+        """
+        self.last_row = last_row
+        self.save(update_fields=["last_row", "updated_at"])
+
+    def finish(self, status=Status.COMPLETED):
+        """Mark the run as completed (or failed).
+
+        Parameters
+        ----------
+        status : str, optional
+            Final status; one of :class:`ImportRun.Status`.
+
+        Returns
+        -------
+        None
+        """
+        self.status = status
+        self.save(update_fields=["status", "updated_at"])
+
+
+class IsbnReallocation(models.Model):
+    """Status of one background ISBN re-allocation.
+
+    :meth:`bookprocess.services.BookBulkService.schedule_author_isbn_reallocation`
+    records a row before handing a prolific author's books to a
+    background thread, so a run that failed, or died with its process,
+    stays visible in the admin and can be started again.
+    """
+
+    class Status(models.TextChoices):
+        """Lifecycle states of a re-allocation."""
+        RUNNING = "running", "Running"
+        COMPLETED = "completed", "Completed"
+        FAILED = "failed", "Failed"
+
+    author = models.ForeignKey(Author, on_delete=models.CASCADE, related_name="isbn_reallocations") #: Author whose books are renumbered.
+    user = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True) #: User whose change started the run.
+    status = models.CharField(max_length=10, choices=Status.choices, default=Status.RUNNING) #: Current state of the run.
+    renumbered = models.PositiveIntegerField(default=0) #: Number of books that received a new ISBN.
+    error = models.TextField(blank=True) #: Exception that ended a failed run.
+    started_at = models.DateTimeField(auto_now_add=True) #: When the run was scheduled.
+    updated_at = models.DateTimeField(auto_now=True) #: When the status last changed.
+
+    class Meta:
+        """Model metadata for :class:`IsbnReallocation`."""
+        ordering = ['-started_at'] #: Newest runs first.
+
+    def __str__(self):
+        """Return a short description of the run.
 
         Returns
         -------
         str
-            Statistics
+            String in the format "ISBNs of <author> (<status>)".
+        """
+        return f"ISBNs of {self.author} ({self.status})"
+
+    def finish(self, status=Status.COMPLETED, renumbered=0, error=""):
+        """Record the outcome of the run.
+
+        Parameters
+        ----------
+        status : str, optional
+            Final status; one of :class:`IsbnReallocation.Status`.
+        renumbered : int, optional
+            Number of books that received a new ISBN.
+        error : str, optional
+            Description of the failure.
+
+        Returns
+        -------
+        None
         """
-        return self._meta.verbose_name_plural
+        self.status, self.renumbered, self.error = status, renumbered, error
+        self.save(update_fields=["status", "renumbered", "error", "updated_at"])
@@ -0,0 +1,302 @@
+"""Keep lookup tables and user roles in sync with declarative data files.
+
+Genres, nationalities and the permission groups are defined in JSON
+files under ``bookprocess/data``. Syncing a table reads its current rows
+in one query, diffs them against the file by a natural key and writes the
+difference with ``bulk_create``/``bulk_update``; audit entries for the
+lookup models are written in bulk as well. Running a sync twice leaves
+the second run with nothing to do, so it is cheap enough to run on every
+start of the application.
+
+Rows present in the database but absent from the file are reported as
+drift and only deleted when pruning is requested. Every sync returns a
+:class:`SyncReport` whose messages the commands hand to
+:func:`bookprocess.utils.notify`.
+"""
+
+from json import loads
+from pathlib import Path
+
+from auditlog.context import set_actor
+from django.contrib.auth.models import Group, Permission
+from django.db import transaction
+from django.db.models import ProtectedError
+
+from bookprocess.models import Genre, Nationality
+from bookprocess.services import AuditLogService
+
+REFERENCE_DIR = Path(__file__).resolve().parent / "data" #: Folder holding the reference data files.
+
+#: Reference tables synced by :func:`sync_reference`: file stem -> (model, natural key).
+REFERENCE_MODELS = {
+    "genres": (Genre, "name"),
+    "nationalities": (Nationality, "code"),
+}
+
+
+class SyncReport:
+    """Differences found (and applied) by one sync.
+
+    Parameters
+    ----------
+    label : str
+        Plural name of the synced rows, used in messages.
+    """
+
+    def __init__(self, label):
+        self.label = label
+        self.created = [] #: Descriptions of rows created from the file.
+        self.updated = [] #: Descriptions of rows changed to match the file.
+        self.unchanged = 0 #: Number of rows already matching the file.
+        self.extra = [] #: Descriptions of rows missing from the file (drift).
+        self.deleted = [] #: Descriptions of extra rows deleted by pruning.
+        self.errors = [] #: Problems that prevented part of the sync.
+        self.applied = False #: Whether the differences were written.
+
+    @property
+    def in_sync(self):
+        """Whether the database matched the file before the sync.
+
+        Returns
+        -------
+        bool
+        """
+        return not (self.created or self.updated or self.extra or self.errors)
+
+    def messages(self):
+        """Return the report as ``(message, level)`` pairs.
+
+        Returns
+        -------
+        list of tuple
+            One message per difference followed by a summary line.
+        """
+        create, update = ("Created", "Updated") if self.applied else ("Would create", "Would update")
+        out = [(f"{create} {item}", "success") for item in self.created]
+        out += [(f"{update} {item}", "success") for item in self.updated]
+        out += [(f"Deleted {item}", "success") for item in self.deleted]
+        out += [
+            (f"{item} is not in the reference data", "warning")
+            for item in self.extra if item not in self.deleted
+        ]
+        out += [(item, "error") for item in self.errors]
+        out.append((
+            f"{self.label.capitalize()}: {len(self.created)} created, {len(self.updated)} updated, "
+            f"{len(self.deleted)} deleted, {self.unchanged} unchanged",
+            "info",
+        ))
+        return out
+
+
+def load_reference(name):
+    """Read one reference data file.
+
+    Parameters
+    ----------
+    name : str
+        File stem inside :data:`REFERENCE_DIR`, e.g. ``"genres"``.
+
+    Returns
+    -------
+    list or dict
+        The decoded JSON document.
+    """
+    return loads((REFERENCE_DIR / f"{name}.json").read_text(encoding="utf-8"))
+
+
+def sync_rows(model, key, rows, user=None, prune=False, apply=True):
+    """Make the rows of ``model`` match ``rows``.
+
+    Parameters
+    ----------
+    model : type[django.db.models.Model]
+        Lookup model registered with ``auditlog``.
+    key : str
+        Unique field identifying a row in the file and the database.
+    rows : list of dict
+        Wanted rows; each maps field names (including ``key``) to values.
+    user : django.contrib.auth.models.User, optional
+        Audit actor.
+    prune : bool, optional
+        Delete rows that are not in ``rows``. Rows still referenced by
+        other records are kept and reported as errors.
+    apply : bool, optional
+        When false only report the drift, without writing anything.
+
+    Returns
+    -------
+    SyncReport
+    """
+    report = SyncReport(model._meta.verbose_name_plural)
+    existing = model.objects.in_bulk(field_name=key)
+    wanted = {row[key]: row for row in rows}
+
+    to_create, to_update, updates, fields = [], [], [], set()
+    for value, row in wanted.items():
+        obj = existing.get(value)
+        if obj is None:
+            obj = model(**row)
+            to_create.append(obj)
+            report.created.append(f"{model._meta.verbose_name} '{obj}'")
+            continue
+
+        changes = {
+            field: [str(getattr(obj, field)), str(new)]
+            for field, new in row.items()
+            if getattr(obj, field) != new
+        }
+        if not changes:
+            report.unchanged += 1
+            continue
+        for field in changes:
+            setattr(obj, field, row[field])
+        fields.update(changes)
+        to_update.append(obj)
+        updates.append((obj, changes))
+        report.updated.append(
+            f"{model._meta.verbose_name} '{value}': "
+            + ", ".join(f"{field} '{old}' -> '{new}'" for field, (old, new) in changes.items())
+        )
+
+    extra = [obj for value, obj in existing.items() if value not in wanted]
+    report.extra = [f"{model._meta.verbose_name} '{obj}'" for obj in extra]
+
+    if not apply:
+        return report
+
+    with transaction.atomic():
+        if to_create:
+            model.objects.bulk_create(to_create)
+            AuditLogService.log_bulk_creations(user, to_create)
+        if to_update:
+            model.objects.bulk_update(to_update, sorted(fields))
+            AuditLogService.log_bulk_updates(user, updates)
+    report.applied = True
+
+    if prune:
+        for obj, description in zip(extra, report.extra):
+            try:
+                with transaction.atomic(), set_actor(user):
+                    obj.delete()
+            except ProtectedError:
+                report.errors.append(f"Cannot delete {description}: it is still in use")
+            else:
+                report.deleted.append(description)
+    return report
+
+
+def sync_reference(name, user=None, prune=False, apply=True):
+    """Sync one of the :data:`REFERENCE_MODELS` with its data file.
+
+    Parameters
+    ----------
+    name : str
+        Key of :data:`REFERENCE_MODELS`.
+    user : django.contrib.auth.models.User, optional
+        Audit actor.
+    prune : bool, optional
+        Delete rows missing from the file.
+    apply : bool, optional
+        When false only report the drift.
+
+    Returns
+    -------
+    SyncReport
+    """
+    model, key = REFERENCE_MODELS[name]
+    return sync_rows(model, key, load_reference(name), user=user, prune=prune, apply=apply)
+
+
+def sync_roles(roles=None, prune=False, apply=True):
+    """Make the permission groups match the roles file.
+
+    Each role maps ``"app_label.model"`` to the permission actions its
+    group is granted, e.g. ``{"bookprocess.book": ["view", "change"]}``.
+    Permissions a group holds beyond its role are revoked.
+
+    Parameters
+    ----------
+    roles : dict, optional
+        Role definitions; defaults to the ``roles`` data file.
+    prune : bool, optional
+        Delete groups that are not defined in ``roles``.
+    apply : bool, optional
+        When false only report the drift.
+
+    Returns
+    -------
+    SyncReport
+    """
+    if roles is None:
+        roles = load_reference("roles")
+    report = SyncReport("groups")
+
+    wanted_codes = {
+        name: {
+            (label.split(".", 1)[0], f"{action}_{label.split('.', 1)[1]}")
+            for label, actions in models.items()
+            for action in actions
+        }
+        for name, models in roles.items()
+    }
+    all_codes = set().union(*wanted_codes.values())
+    permissions = {
+        (app_label, codename): pk
+        for pk, app_label, codename in Permission.objects.filter(
+            content_type__app_label__in={app for app, _ in all_codes},
+            codename__in={code for _, code in all_codes},
+        ).values_list("pk", "content_type__app_label", "codename")
+    }
+    for app_label, codename in sorted(all_codes - permissions.keys()):
+        report.errors.append(f"Missing permission: {app_label}.{codename}")
+
+    groups = Group.objects.in_bulk(field_name="name")
+    Through = Group.permissions.through
+    names = {pk: f"{app}.{code}" for (app, code), pk in permissions.items()}
+    current = {}
+    for group_id, permission_id, app_label, codename in Through.objects.values_list(
+        "group_id", "permission_id", "permission__content_type__app_label", "permission__codename"
+    ):
+        current.setdefault(group_id, set()).add(permission_id)
+        names[permission_id] = f"{app_label}.{codename}"
+
+    new_groups = [Group(name=name) for name in roles if name not in groups]
+    report.created = [f"group '{group.name}'" for group in new_groups]
+    changes = {}
+    for name, codes in wanted_codes.items():
+        wanted = {permissions[code] for code in codes if code in permissions}
+        group = groups.get(name)
+        held = current.get(group.pk, set()) if group else set()
+        added, removed = wanted - held, held - wanted
+        if added or removed:
+            changes[name] = (added, removed)
+        if group is None:
+            continue
+        if added or removed:
+            parts = [f"+{names[pk]}" for pk in sorted(added)] + [f"-{names[pk]}" for pk in sorted(removed)]
+            report.updated.append(f"group '{name}': {', '.join(parts)}")
+        else:
+            report.unchanged += 1
+
+    extra = [group for name, group in groups.items() if name not in roles]
+    report.extra = [f"group '{group.name}'" for group in extra]
+
+    if not apply:
+        return report
+
+    with transaction.atomic():
+        Group.objects.bulk_create(new_groups)
+        groups.update({group.name: group for group in new_groups})
+        links = []
+        for name, (added, removed) in changes.items():
+            group = groups[name]
+            links += [Through(group_id=group.pk, permission_id=pk) for pk in added]
+            if removed:
+                Through.objects.filter(group_id=group.pk, permission_id__in=removed).delete()
+        Through.objects.bulk_create(links)
+        report.applied = True
+
+        if prune and extra:
+            Group.objects.filter(pk__in=[group.pk for group in extra]).delete()
+            report.deleted = list(report.extra)
+    return report
@@ -1,12 +1,32 @@
 """This module provides wrapper around the ``auditlog`` app to
-record audit entries for book-related events.
+record audit entries for book-related events and to reconstruct books
+as they were at a past moment from those entries.
 """
 
+from copy import copy
+from itertools import groupby
+from logging import getLogger
+from json import loads
+from operator import itemgetter
+from threading import Thread
+
+from auditlog.context import disable_auditlog
+from auditlog.diff import model_instance_diff
 from auditlog.models import LogEntry
+from auditlog.registry import auditlog
 from django.contrib.contenttypes.models import ContentType
+from django.db import connection, transaction
+from django.db.models.deletion import Collector
+from django.db.models import Count, F, OuterRef, Q, Subquery
 from django.utils import timezone
 
-from bookprocess.utils import serialize_model_instance
+from bookprocess.models import Author, Book, BookAuthor, BookCheckpoint, IsbnReallocation
+from bookprocess.signals import deferred_refresh, queue_refresh
+from bookprocess.utils import allocate_isbns, serialize_model_instance
+
+CHECKPOINT_INTERVAL = 50 #: Number of audit entries replayed on top of a checkpoint before a new one is written.
+
+logger = getLogger(__name__) #: Logger for the failures of background jobs.
 
 
 class AuditLogService:
@@ -42,6 +62,51 @@ class AuditLogService:
         actor=user,
         timestamp=timezone.now(),
         )
+        BookHistoryService.checkpoint_if_needed(book.pk)
+
+    @staticmethod
+    def log_book_creations(user, books):
+        """Record the CREATE audit entries of many new books in one query.
+
+        The books are re-loaded together with their relations in one
+        query per relation and serialized like
+        :meth:`log_book_creation` does for a single book. New books are
+        far from the checkpoint interval, so no checkpoint is taken.
+
+        Parameters
+        ----------
+        user : django.contrib.auth.models.User
+            The responsible for the creation.
+        books : Iterable[Book]
+            Saved Book instances.
+
+        Returns
+        -------
+        None
+        """
+        opts = Book._meta
+        loaded = (
+            Book.objects
+            .select_related(*[f.name for f in opts.fields if f.many_to_one])
+            .prefetch_related(*[f.name for f in opts.many_to_many])
+            .filter(pk__in=[book.pk for book in books])
+            .order_by("pk")
+        )
+        content_type = ContentType.objects.get_for_model(Book)
+        now = timezone.now()
+        LogEntry.objects.bulk_create(
+            LogEntry(
+                content_type=content_type,
+                object_pk=str(book.pk),
+                object_id=book.pk,
+                object_repr=str(book),
+                action=LogEntry.Action.CREATE,
+                changes={key: [None, value] for key, value in serialize_model_instance(book, refetch=False).items()},
+                actor=user,
+                timestamp=now,
+            )
+            for book in loaded
+        )
 
     @staticmethod
     def log_book_update(user, book, changes):
@@ -71,3 +136,755 @@ class AuditLogService:
             actor=user,
             timestamp=timezone.now(),
         )
+        BookHistoryService.checkpoint_if_needed(book.pk)
+
+
+    @staticmethod
+    def log_bulk_updates(user, updates):
+        """Record one UPDATE audit entry per changed instance in one query.
+
+        Used by code paths that save with ``bulk_update`` and therefore
+        bypass the automatic ``auditlog`` entries.
+
+        Parameters
+        ----------
+        user : django.contrib.auth.models.User
+            Acting user to attribute the updates to.
+        updates : Iterable[tuple]
+            ``(instance, changes)`` pairs where ``changes`` maps field ->
+            [old, new]; pairs with no changes are ignored.
+
+        Returns
+        -------
+        None
+        """
+        now = timezone.now()
+        entries = [
+            LogEntry(
+                content_type=ContentType.objects.get_for_model(instance),
+                object_pk=str(instance.pk),
+                object_id=instance.pk,
+                object_repr=str(instance),
+                action=LogEntry.Action.UPDATE,
+                changes=changes,
+                actor=user,
+                timestamp=now,
+            )
+            for instance, changes in updates
+            if changes
+        ]
+        LogEntry.objects.bulk_create(entries)
+        book_type = ContentType.objects.get_for_model(Book)
+        BookHistoryService.checkpoint_books_if_needed(
+            entry.object_pk for entry in entries if entry.content_type == book_type
+        )
+
+    @staticmethod
+    def log_bulk_creations(user, instances):
+        """Record one CREATE audit entry per instance in one query.
+
+        Counterpart of :meth:`log_bulk_updates` for rows saved with
+        ``bulk_create``. Only used for lookup models; books keep their
+        history checkpoints through :meth:`log_book_creation`.
+
+        Parameters
+        ----------
+        user : django.contrib.auth.models.User
+            Acting user to attribute the creations to.
+        instances : Iterable[django.db.models.Model]
+            Saved instances of a model registered with ``auditlog``.
+
+        Returns
+        -------
+        None
+        """
+        now = timezone.now()
+        LogEntry.objects.bulk_create(
+            LogEntry(
+                content_type=ContentType.objects.get_for_model(instance),
+                object_pk=str(instance.pk),
+                object_id=instance.pk,
+                object_repr=str(instance),
+                action=LogEntry.Action.CREATE,
+                changes=model_instance_diff(None, instance),
+                actor=user,
+                timestamp=now,
+            )
+            for instance in instances
+        )
+
+    @staticmethod
+    def log_bulk_deletions(user, instances):
+        """Record one DELETE audit entry per instance in one query.
+
+        Counterpart of :meth:`log_bulk_creations` for rows removed by
+        :meth:`delete_queryset`. The entries match the ones ``auditlog``
+        writes from its ``post_delete`` receiver.
+
+        Parameters
+        ----------
+        user : django.contrib.auth.models.User
+            Acting user to attribute the deletions to.
+        instances : Iterable[django.db.models.Model]
+            Instances about to be deleted, of models registered with
+            ``auditlog``.
+
+        Returns
+        -------
+        None
+        """
+        now = timezone.now()
+        LogEntry.objects.bulk_create(
+            LogEntry(
+                content_type=ContentType.objects.get_for_model(instance),
+                object_pk=str(instance.pk),
+                object_id=instance.pk,
+                object_repr=str(instance),
+                action=LogEntry.Action.DELETE,
+                changes=model_instance_diff(instance, None),
+                actor=user,
+                timestamp=now,
+            )
+            for instance in instances
+        )
+
+    @staticmethod
+    def delete_queryset(user, queryset):
+        """Delete ``queryset`` and its cascades with audit entries written in bulk.
+
+        Django's deletion collector gathers the doomed rows of every model
+        in one query per model (and batch), including the cascade from
+        books to their ``BookAuthor`` rows. The audited ones are logged
+        with :meth:`log_bulk_deletions` before the rows are deleted, and
+        ``auditlog``'s per-row receiver is disabled while the collector
+        runs, so the audit trail costs one ``bulk_create`` instead of one
+        ``INSERT`` per object. Counter caches are refreshed once when the
+        deletion finishes, all in the same transaction.
+
+        Parameters
+        ----------
+        user : django.contrib.auth.models.User
+            Acting user to attribute the deletions to.
+        queryset : django.db.models.query.QuerySet
+            Rows to delete.
+
+        Returns
+        -------
+        tuple
+            ``(deleted, per_model)`` as returned by ``QuerySet.delete()``.
+
+        Raises
+        ------
+        django.db.models.ProtectedError
+            When a protected relation still references one of the rows.
+        """
+        with transaction.atomic(using=queryset.db), deferred_refresh():
+            collector = Collector(using=queryset.db, origin=queryset)
+            collector.collect(queryset.order_by())
+            for model, instances in collector.data.items():
+                if auditlog.contains(model):
+                    AuditLogService.log_bulk_deletions(user, instances)
+            with disable_auditlog():
+                return collector.delete()
+
+
+class BookBulkService:
+    """Bulk edits of many books at once.
+
+    Every operation loads the affected books in one query, saves them
+    with ``bulk_update`` and records their audit entries with
+    :meth:`AuditLogService.log_bulk_updates`, all in one transaction.
+    """
+
+    #: Books written per ``bulk_update`` query.
+    BATCH_SIZE = 500
+
+    @classmethod
+    def _save(cls, user, books, field, apply):
+        """Apply ``apply`` to every book and save the ones that changed.
+
+        Parameters
+        ----------
+        user : django.contrib.auth.models.User
+            Acting user to attribute the updates to.
+        books : list of Book
+            Books to edit.
+        field : str
+            The edited field.
+        apply : Callable[[Book], None]
+            Sets the new value on a book.
+
+        Returns
+        -------
+        list of tuple
+            ``(book, changes)`` for every book that changed.
+        """
+        updates = []
+        for book in books:
+            before = copy(book)
+            apply(book)
+            changes = model_instance_diff(before, book, fields_to_check=[field])
+            if changes:
+                updates.append((book, changes))
+        Book.objects.bulk_update([book for book, _ in updates], [field], batch_size=cls.BATCH_SIZE)
+        AuditLogService.log_bulk_updates(user, updates)
+        return updates
+
+    @classmethod
+    def reassign_genre(cls, user, queryset, genre):
+        """Move books to another genre.
+
+        Parameters
+        ----------
+        user : django.contrib.auth.models.User
+            Acting user to attribute the updates to.
+        queryset : django.db.models.query.QuerySet
+            Books to reclassify.
+        genre : bookprocess.models.Genre
+            The new genre.
+
+        Returns
+        -------
+        int
+            Number of books whose genre changed.
+        """
+        with transaction.atomic(), deferred_refresh():
+            books = list(queryset.exclude(genre=genre).select_related("genre").order_by("pk"))
+            touched = {genre.pk, *(book.genre_id for book in books)}
+            updates = cls._save(user, books, "genre", lambda book: setattr(book, "genre", genre))
+            if updates:
+                queue_refresh(genres=touched)
+        return len(updates)
+
+    @classmethod
+    def regenerate_isbns(cls, user, queryset):
+        """Give books new ISBNs seeded with their first author's nationality.
+
+        The ISBNs are drawn with :func:`bookprocess.utils.allocate_isbns`,
+        which checks uniqueness for a whole batch per query.
+
+        Parameters
+        ----------
+        user : django.contrib.auth.models.User
+            Acting user to attribute the updates to.
+        queryset : django.db.models.query.QuerySet
+            Books to renumber.
+
+        Returns
+        -------
+        int
+            Number of books that received a new ISBN.
+        """
+        with transaction.atomic():
+            books = list(queryset.select_related("primary_nationality").order_by("pk"))
+            isbns = iter(allocate_isbns(
+                book.primary_nationality.code if book.primary_nationality_id else None for book in books
+            ))
+            return len(cls._save(user, books, "isbn", lambda book: setattr(book, "isbn", next(isbns))))
+
+
+    @classmethod
+    def create_books(cls, user, author, rows):
+        """Create books credited to one author, all-or-nothing.
+
+        ISBNs seeded with the author's nationality are allocated for the
+        whole batch; the books, their author links and their audit entries
+        are then inserted with ``bulk_create`` in the same transaction,
+        and the counter caches refreshed once. When the transaction fails
+        the covers already written to storage are deleted again.
+
+        Parameters
+        ----------
+        user : django.contrib.auth.models.User
+            The responsible for the creation.
+        author : bookprocess.models.Author
+            Sole author of every book.
+        rows : list of dict
+            Validated ``Book`` field values, one dict per book.
+
+        Returns
+        -------
+        list of Book
+            The created books.
+
+        Raises
+        ------
+        django.db.IntegrityError
+            When an allocated ISBN was taken concurrently; nothing is kept.
+        """
+        if not rows:
+            return []
+        books = []
+        try:
+            with transaction.atomic(), deferred_refresh():
+                isbns = allocate_isbns([author.nationality.code] * len(rows))
+                books = [
+                    Book(**row, isbn=isbn, primary_nationality_id=author.nationality_id)
+                    for row, isbn in zip(rows, isbns)
+                ]
+                Book.objects.bulk_create(books)
+                BookAuthor.objects.attach_to_books(books, [author])
+                queue_refresh(genres={book.genre_id for book in books})
+                AuditLogService.log_book_creations(user, books)
+        except Exception:
+            cls._delete_stored_covers(books)
+            raise
+        return books
+
+    @staticmethod
+    def _delete_stored_covers(books):
+        """Delete the covers ``bulk_create`` already wrote for books that were rolled back.
+
+        Parameters
+        ----------
+        books : Iterable[Book]
+            The unsaved books.
+
+        Returns
+        -------
+        None
+        """
+        for book in books:
+            if book.cover and book.cover._committed:
+                book.cover.storage.delete(book.cover.name)
+
+    #: Authors first on more books than this get their ISBNs re-allocated in the background.
+    REALLOCATE_INLINE_LIMIT = 200
+
+    @classmethod
+    def reallocate_author_isbns(cls, user, author):
+        """Re-allocate the ISBNs of an author's books after a nationality change.
+
+        Only the books ``author`` is first on whose ISBN country segment
+        no longer matches are renumbered, in one transaction. The books'
+        ``primary_nationality`` must already reflect the change.
+
+        Parameters
+        ----------
+        user : django.contrib.auth.models.User
+            Acting user to attribute the updates to.
+        author : bookprocess.models.Author, int or Iterable[int]
+            The author, its primary key, or the primary keys of several
+            authors whose nationality changed.
+
+        Returns
+        -------
+        int
+            Number of books that received a new ISBN.
+        """
+        return cls.regenerate_isbns(user, Book.objects.isbn_mismatches(Book.objects.first_authored_by(author)))
+
+    @classmethod
+    def schedule_author_isbn_reallocation(cls, user, author):
+        """Run :meth:`reallocate_author_isbns` now or, for prolific authors, in the background.
+
+        Authors first on at most :attr:`REALLOCATE_INLINE_LIMIT` books are
+        handled in the current transaction. For the others an
+        :class:`~bookprocess.models.IsbnReallocation` row is recorded and a
+        background thread started once the current transaction commits,
+        so the request returns immediately.
+
+        Parameters
+        ----------
+        user : django.contrib.auth.models.User
+            Acting user to attribute the updates to.
+        author : bookprocess.models.Author
+            The author whose nationality changed.
+
+        Returns
+        -------
+        int or None
+            Number of renumbered books, or ``None`` when the work was
+            handed to a background thread.
+        """
+        if Book.objects.first_authored_by(author).count() <= cls.REALLOCATE_INLINE_LIMIT:
+            return cls.reallocate_author_isbns(user, author)
+
+        run = IsbnReallocation.objects.create(author=author, user=user)
+        transaction.on_commit(lambda: Thread(
+            target=cls._reallocate_in_background,
+            args=(run.pk,),
+            name=f"isbn-reallocation-{author.pk}",
+            daemon=True,
+        ).start())
+        return None
+
+    @classmethod
+    def _reallocate_in_background(cls, run_id):
+        """Thread target of :meth:`schedule_author_isbn_reallocation`.
+
+        A failure is logged and recorded on the run instead of being lost
+        with the thread.
+
+        Parameters
+        ----------
+        run_id : int
+            Primary key of the :class:`~bookprocess.models.IsbnReallocation`.
+
+        Returns
+        -------
+        None
+        """
+        run = None
+        try:
+            run = IsbnReallocation.objects.select_related("user").get(pk=run_id)
+            run.finish(renumbered=cls.reallocate_author_isbns(run.user, run.author_id))
+        except Exception as e:
+            logger.exception("Re-allocating ISBNs failed (run %s)", run_id)
+            if run is not None:
+                run.finish(IsbnReallocation.Status.FAILED, error=f"{type(e).__name__}: {e}")
+        finally:
+            connection.close()
+
+    @classmethod
+    def retry_isbn_reallocations(cls, user, runs):
+        """Start the failed re-allocations among ``runs`` again.
+
+        Each author is scheduled once through
+        :meth:`schedule_author_isbn_reallocation`; the failed rows are
+        kept as history.
+
+        Parameters
+        ----------
+        user : django.contrib.auth.models.User
+            Acting user to attribute the updates to.
+        runs : django.db.models.query.QuerySet
+            :class:`~bookprocess.models.IsbnReallocation` rows.
+
+        Returns
+        -------
+        int
+            Number of authors scheduled again.
+        """
+        authors = Author.objects.filter(
+            pk__in=runs.filter(status=IsbnReallocation.Status.FAILED).values("author_id")
+        )
+        count = 0
+        for author in authors:
+            cls.schedule_author_isbn_reallocation(user, author)
+            count += 1
+        return count
+
+
+class BookHistoryService:
+    """Rebuild past book states by replaying audit entries over checkpoints.
+
+    Every audit entry for a book stores ``{field: [old, new]}`` pairs, so a
+    book's state at a moment is the fold of its entries up to that moment.
+    :class:`bookprocess.models.BookCheckpoint` rows store that fold every
+    :data:`CHECKPOINT_INTERVAL` entries, which keeps the replay for a single
+    book bounded no matter how many times it was edited.
+    """
+
+    @staticmethod
+    def _entries():
+        """Return the audit entries recorded for books.
+
+        Returns
+        -------
+        django.db.models.query.QuerySet
+            ``LogEntry`` rows whose content type is :class:`Book`.
+        """
+        return LogEntry.objects.filter(content_type=ContentType.objects.get_for_model(Book))
+
+    @classmethod
+    def _entries_since_checkpoint(cls, as_of=None):
+        """Return book audit entries not yet folded into a checkpoint.
+
+        Parameters
+        ----------
+        as_of : datetime.datetime, optional
+            When given only checkpoints and entries at or before this
+            moment are considered.
+
+        Returns
+        -------
+        django.db.models.query.QuerySet
+            Entries newer than the latest applicable checkpoint of their book.
+        """
+        newest = BookCheckpoint.objects.filter(object_pk=OuterRef("object_pk"))
+        entries = cls._entries()
+        if as_of is not None:
+            newest = newest.filter(timestamp__lte=as_of)
+            entries = entries.filter(timestamp__lte=as_of)
+        newest_id = newest.order_by("-timestamp", "-log_entry_id").values("log_entry_id")[:1]
+
+        return entries.annotate(checkpoint_id=Subquery(newest_id)).filter(
+            Q(checkpoint_id__isnull=True) | Q(id__gt=F("checkpoint_id"))
+        )
+
+    @staticmethod
+    def _newest_checkpoints(as_of=None):
+        """Return the newest checkpoint of every book.
+
+        Parameters
+        ----------
+        as_of : datetime.datetime, optional
+            When given only checkpoints taken at or before this moment count.
+
+        Returns
+        -------
+        django.db.models.query.QuerySet
+            One :class:`BookCheckpoint` per book.
+        """
+        candidates = BookCheckpoint.objects.all()
+        if as_of is not None:
+            candidates = candidates.filter(timestamp__lte=as_of)
+        newest = (
+            candidates.filter(object_pk=OuterRef("object_pk"))
+            .order_by("-timestamp", "-log_entry_id")
+            .values("pk")[:1]
+        )
+        return candidates.filter(pk=Subquery(newest))
+
+    @staticmethod
+    def apply_entry(state, action, changes):
+        """Fold a single audit entry into a book state.
+
+        Parameters
+        ----------
+        state : dict or None
+            State before the entry; ``None`` when the book did not exist.
+        action : int
+            One of the ``LogEntry.Action`` values.
+        changes : dict or str
+            Mapping field -> [old, new] (JSON string for legacy rows).
+
+        Returns
+        -------
+        dict or None
+            State after the entry; ``None`` once the book was deleted.
+        """
+        if action == LogEntry.Action.DELETE:
+            return None
+        if action == LogEntry.Action.ACCESS:
+            return state
+
+        state = {} if action == LogEntry.Action.CREATE or state is None else dict(state)
+
+        if isinstance(changes, str):
+            try:
+                changes = loads(changes)
+            except ValueError:
+                changes = {}
+
+        for field, values in (changes or {}).items():
+            if isinstance(values, list) and len(values) == 2:
+                state[field] = values[1]
+        return state
+
+    @classmethod
+    def book_as_of(cls, book_pk, as_of):
+        """Reconstruct a single book as it was at ``as_of``.
+
+        Parameters
+        ----------
+        book_pk : int or str
+            Primary key of the book.
+        as_of : datetime.datetime
+            Moment to reconstruct.
+
+        Returns
+        -------
+        dict or None
+            The book's fields at that moment, or ``None`` when it did not
+            exist (not created yet or already deleted).
+        """
+        checkpoint = cls._newest_checkpoints(as_of).filter(object_pk=str(book_pk)).first()
+        state = checkpoint.state if checkpoint else None
+
+        entries = (
+            cls._entries_since_checkpoint(as_of)
+            .filter(object_pk=str(book_pk))
+            .order_by("timestamp", "id")
+            .values_list("action", "changes")
+        )
+        for action, changes in entries:
+            state = cls.apply_entry(state, action, changes)
+        return state
+
+    @classmethod
+    def catalog_as_of(cls, as_of, chunk_size=2000):
+        """Reconstruct every book that existed at ``as_of``.
+
+        Checkpoints and the entries recorded after them are streamed sorted
+        by book and merged, so memory stays bounded by one book at a time.
+
+        Parameters
+        ----------
+        as_of : datetime.datetime
+            Moment to reconstruct.
+        chunk_size : int
+            Rows fetched per database round trip.
+
+        Yields
+        ------
+        tuple[str, dict]
+            ``(object_pk, state)`` for each book alive at ``as_of``.
+        """
+        checkpoints = (
+            cls._newest_checkpoints(as_of)
+            .order_by("object_pk")
+            .values_list("object_pk", "state")
+            .iterator(chunk_size=chunk_size)
+        )
+        entries = (
+            cls._entries_since_checkpoint(as_of)
+            .order_by("object_pk", "timestamp", "id")
+            .values_list("object_pk", "action", "changes")
+            .iterator(chunk_size=chunk_size)
+        )
+        groups = groupby(entries, key=itemgetter(0))
+
+        checkpoint = next(checkpoints, None)
+        group = next(groups, None)
+        while checkpoint is not None or group is not None:
+            if group is None or (checkpoint is not None and checkpoint[0] <= group[0]):
+                object_pk, state = checkpoint
+                checkpoint = next(checkpoints, None)
+            else:
+                object_pk, state = group[0], None
+
+            if group is not None and group[0] == object_pk:
+                for _, action, changes in group[1]:
+                    state = cls.apply_entry(state, action, changes)
+                group = next(groups, None)
+
+            if state is not None:
+                yield object_pk, state
+
+    @classmethod
+    def checkpoint_if_needed(cls, book_pk, interval=CHECKPOINT_INTERVAL):
+        """Write a checkpoint once enough entries piled up for a book.
+
+        Parameters
+        ----------
+        book_pk : int or str
+            Primary key of the book that was just audited.
+        interval : int
+            Number of pending entries that triggers a new checkpoint.
+
+        Returns
+        -------
+        BookCheckpoint or None
+            The created checkpoint, or ``None`` when none was needed.
+        """
+        created = cls.checkpoint_books_if_needed([book_pk], interval)
+        return created[0] if created else None
+
+    @classmethod
+    def checkpoint_books_if_needed(cls, book_pks, interval=CHECKPOINT_INTERVAL):
+        """Write checkpoints for the books among ``book_pks`` with enough pending entries.
+
+        The pending entries of all books are counted in one grouped query;
+        only the books at or over ``interval`` are folded, and their
+        checkpoints are written with one ``bulk_create``.
+
+        Parameters
+        ----------
+        book_pks : Iterable[int or str]
+            Primary keys of the books that were just audited.
+        interval : int
+            Number of pending entries that triggers a new checkpoint.
+
+        Returns
+        -------
+        list of BookCheckpoint
+            The created checkpoints.
+        """
+        book_pks = {str(pk) for pk in book_pks}
+        if not book_pks:
+            return []
+
+        pending = cls._entries_since_checkpoint()
+        due = [
+            object_pk
+            for object_pk, count in pending.filter(object_pk__in=book_pks)
+            .order_by().values("object_pk").annotate(count=Count("id")).values_list("object_pk", "count")
+            if count >= interval
+        ]
+        if not due:
+            return []
+
+        states = dict(cls._newest_checkpoints().filter(object_pk__in=due).values_list("object_pk", "state"))
+        entries = (
+            pending.filter(object_pk__in=due)
+            .order_by("object_pk", "timestamp", "id")
+            .values_list("object_pk", "id", "timestamp", "action", "changes")
+        )
+        checkpoints = []
+        for object_pk, rows in groupby(entries, key=itemgetter(0)):
+            state = states.get(object_pk)
+            for _, entry_id, timestamp, action, changes in rows:
+                state = cls.apply_entry(state, action, changes)
+            checkpoints.append(BookCheckpoint(
+                object_pk=object_pk,
+                log_entry_id=entry_id,
+                timestamp=timestamp,
+                state=state,
+            ))
+        return BookCheckpoint.objects.bulk_create(checkpoints)
+
+    @classmethod
+    def build_checkpoints(cls, interval=CHECKPOINT_INTERVAL, batch_size=500):
+        """Write the missing checkpoints for every book in one streaming pass.
+
+        Used to backfill checkpoints for entries that were not written
+        through :class:`AuditLogService` (for example auditlog's own
+        signal-based entries created by the importers). Like
+        :meth:`catalog_as_of`, the newest checkpoints and the pending
+        entries are streamed sorted by book and merged, so memory stays
+        bounded by one book and one batch.
+
+        Parameters
+        ----------
+        interval : int
+            Number of entries folded into each checkpoint.
+        batch_size : int
+            Number of checkpoints inserted per ``bulk_create`` call.
+
+        Returns
+        -------
+        int
+            Number of checkpoints created.
+        """
+        checkpoints = (
+            cls._newest_checkpoints()
+            .order_by("object_pk")
+            .values_list("object_pk", "state")
+            .iterator(chunk_size=batch_size)
+        )
+        entries = (
+            cls._entries_since_checkpoint()
+            .order_by("object_pk", "timestamp", "id")
+            .values_list("object_pk", "id", "timestamp", "action", "changes")
+            .iterator(chunk_size=batch_size)
+        )
+
+        created = 0
+        batch = []
+        checkpoint = next(checkpoints, None)
+        for object_pk, rows in groupby(entries, key=itemgetter(0)):
+            while checkpoint is not None and checkpoint[0] < object_pk:
+                checkpoint = next(checkpoints, None)
+            state = checkpoint[1] if checkpoint is not None and checkpoint[0] == object_pk else None
+            pending = 0
+            for _, entry_id, timestamp, action, changes in rows:
+                state = cls.apply_entry(state, action, changes)
+                pending += 1
+                if pending == interval:
+                    batch.append(BookCheckpoint(
+                        object_pk=object_pk,
+                        log_entry_id=entry_id,
+                        timestamp=timestamp,
+                        state=state,
+                    ))
+                    pending = 0
+
+            if len(batch) >= batch_size:
+                BookCheckpoint.objects.bulk_create(batch)
+                created += len(batch)
+                batch = []
+
+        BookCheckpoint.objects.bulk_create(batch)
+        return created + len(batch)
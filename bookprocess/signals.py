@@ -0,0 +1,230 @@
+"""Signal handlers keeping denormalized columns in sync.
+
+Two kinds of derived data are maintained here:
+
+- ``Book.primary_nationality`` mirrors the nationality of a book's first
+  author;
+- the counter-cache columns of :class:`~bookprocess.models.Author`,
+  :class:`~bookprocess.models.Genre` and
+  :class:`~bookprocess.models.Nationality`.
+
+Handlers only queue the affected primary keys through
+:func:`queue_refresh`; the refresh itself is one UPDATE per model. Inside
+:func:`deferred_refresh` the queue is flushed once when the block exits,
+which keeps imports and bulk deletes from issuing one UPDATE per row.
+Code paths that bypass signals (``bulk_create``, ``bulk_update``,
+``QuerySet.update``) call :func:`queue_refresh` themselves.
+"""
+from contextlib import contextmanager
+from threading import local
+
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .models import Author, Book, BookAuthor, Genre, Nationality
+
+REFRESH_BATCH_SIZE = 500 #: Maximum number of primary keys per refresh UPDATE.
+_pending = local()
+
+
+def _batches(ids):
+    """Split primary keys into lists small enough for an ``IN`` clause.
+
+    Parameters
+    ----------
+    ids : Iterable[int]
+        Primary keys to split.
+
+    Yields
+    ------
+    list[int]
+        Consecutive batches of at most :data:`REFRESH_BATCH_SIZE` keys.
+    """
+    ids = sorted(pk for pk in ids if pk is not None)
+    for start in range(0, len(ids), REFRESH_BATCH_SIZE):
+        yield ids[start:start + REFRESH_BATCH_SIZE]
+
+
+def _flush(queue):
+    """Run the refresh UPDATEs for everything queued.
+
+    Parameters
+    ----------
+    queue : dict[str, set]
+        Pending primary keys, see :func:`queue_refresh`.
+
+    Returns
+    -------
+    None
+    """
+    authors = set(queue["authors"])
+    for batch in _batches(queue["book_authors"]):
+        authors.update(BookAuthor.objects.filter(book_id__in=batch).values_list("author_id", flat=True))
+
+    for batch in _batches(queue["books"]):
+        Book.objects.refresh_primary_nationality(batch)
+    for batch in _batches(authors):
+        Author.objects.refresh_counters(batch)
+    for batch in _batches(queue["genres"]):
+        Genre.objects.refresh_counters(batch)
+    for batch in _batches(queue["nationalities"]):
+        Nationality.objects.refresh_counters(batch)
+
+
+@contextmanager
+def deferred_refresh():
+    """Batch the refresh work queued inside the block until it exits.
+
+    Nested blocks share the outermost batch.
+
+    Yields
+    ------
+    None
+    """
+    if getattr(_pending, "queue", None) is not None:
+        yield
+        return
+
+    _pending.queue = {key: set() for key in ("books", "book_authors", "authors", "genres", "nationalities")}
+    try:
+        yield
+    finally:
+        queue, _pending.queue = _pending.queue, None
+        _flush(queue)
+
+
+def queue_refresh(books=(), book_authors=(), authors=(), genres=(), nationalities=()):
+    """Queue derived columns for a refresh.
+
+    Outside :func:`deferred_refresh` the refresh runs immediately.
+
+    Parameters
+    ----------
+    books : Iterable[int]
+        Books whose first author may have changed.
+    book_authors : Iterable[int]
+        Books whose author list changed; the counters of all their
+        current authors are refreshed.
+    authors : Iterable[int]
+        Authors whose book counters changed.
+    genres : Iterable[int]
+        Genres whose book count changed.
+    nationalities : Iterable[int]
+        Nationalities whose author count changed.
+
+    Returns
+    -------
+    None
+    """
+    with deferred_refresh():
+        queue = _pending.queue
+        queue["books"].update(books)
+        queue["book_authors"].update(book_authors)
+        queue["authors"].update(authors)
+        queue["genres"].update(genres)
+        queue["nationalities"].update(nationalities)
+
+
+def _stored_value(instance, field, update_fields=None):
+    """Return a foreign key id as currently stored for ``instance``.
+
+    Parameters
+    ----------
+    instance : django.db.models.Model
+        The instance about to be saved.
+    field : str
+        Name of the foreign key field.
+    update_fields : Iterable[str], optional
+        The ``update_fields`` of the save; when the field is not part of
+        them the in-memory value is returned without a query.
+
+    Returns
+    -------
+    Optional[int]
+        The stored id, or ``None`` for unsaved instances.
+    """
+    attname = f"{field}_id"
+    if update_fields is not None and field not in update_fields and attname not in update_fields:
+        return getattr(instance, attname)
+    if instance.pk is None:
+        return None
+    return type(instance).objects.filter(pk=instance.pk).values_list(attname, flat=True).first()
+
+
+@receiver(pre_save, sender=BookAuthor)
+def book_author_before(sender, instance, update_fields=None, **kwargs):
+    """Remember the stored author so a re-pointed relation refreshes both."""
+    instance._stored_author_id = _stored_value(instance, "author", update_fields)
+
+
+@receiver(post_save, sender=BookAuthor)
+@receiver(post_delete, sender=BookAuthor)
+def book_author_changed(sender, instance, **kwargs):
+    """Refresh the book and the authors affected by a single relation."""
+    queue_refresh(
+        books=[instance.book_id],
+        book_authors=[instance.book_id],
+        authors=[instance.author_id, getattr(instance, "_stored_author_id", None)],
+    )
+
+
+@receiver(m2m_changed, sender=Book.authors.through)
+def book_authors_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    """Refresh books and authors whose links changed through ``Book.authors``."""
+    if action == "pre_clear":
+        related = instance.books if reverse else instance.authors
+        instance._cleared_pks = list(related.values_list("pk", flat=True))
+        return
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+
+    related = getattr(instance, "_cleared_pks", ()) if action == "post_clear" else (pk_set or ())
+    if reverse:
+        queue_refresh(books=related, book_authors=related, authors=[instance.pk])
+    else:
+        queue_refresh(books=[instance.pk], book_authors=[instance.pk], authors=related)
+
+
+@receiver(pre_save, sender=Book)
+def book_before(sender, instance, update_fields=None, **kwargs):
+    """Remember the stored genre so a genre change refreshes both genres."""
+    instance._stored_genre_id = _stored_value(instance, "genre", update_fields)
+
+
+@receiver(post_save, sender=Book)
+def book_saved(sender, instance, created, **kwargs):
+    """Refresh the genre counters after a book was created or re-classified."""
+    stored = getattr(instance, "_stored_genre_id", None)
+    if created or stored != instance.genre_id:
+        queue_refresh(genres=[instance.genre_id, stored])
+
+
+@receiver(post_delete, sender=Book)
+def book_deleted(sender, instance, **kwargs):
+    """Refresh the genre counter of a deleted book."""
+    queue_refresh(genres=[instance.genre_id])
+
+
+@receiver(pre_save, sender=Author)
+def author_before(sender, instance, update_fields=None, **kwargs):
+    """Remember the stored nationality so ``post_save`` can detect a change."""
+    instance._stored_nationality_id = _stored_value(instance, "nationality", update_fields)
+
+
+@receiver(post_save, sender=Author)
+def author_saved(sender, instance, created, **kwargs):
+    """Refresh nationality counters and the books of a re-classified author."""
+    stored = getattr(instance, "_stored_nationality_id", None)
+    if created:
+        queue_refresh(nationalities=[instance.nationality_id])
+    elif stored != instance.nationality_id:
+        queue_refresh(
+            books=Book.objects.filter(bookauthor__author=instance).values_list("pk", flat=True),
+            nationalities=[instance.nationality_id, stored],
+        )
+
+
+@receiver(post_delete, sender=Author)
+def author_deleted(sender, instance, **kwargs):
+    """Refresh the nationality counter of a deleted author."""
+    queue_refresh(nationalities=[instance.nationality_id])
@@ -0,0 +1,170 @@
+"""Single-pass author statistics.
+
+An author's solo and co-authored book counts depend on how many authors
+each of their books has. Computing that number in a correlated subquery
+per author (or per ``BookAuthor`` row) makes the database revisit the
+link table for every row it produces.
+
+:func:`author_book_counts` computes the authors-per-book count once, in a
+grouped common table expression over ``BookAuthor``, joins it back to
+the link table and derives every counter with grouped conditional counts
+in one scan. :class:`~bookprocess.models.AuthorManager` uses it to
+refresh the author counter caches; the ``benchmark_author_stats`` command
+compares it with the earlier query plans.
+"""
+
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.models import Case, Count, IntegerField, Sum, When
+
+from bookprocess.models import Author, Book, BookAuthor
+
+#: Rows fetched from the cursor at a time.
+FETCH_SIZE = 2000
+
+#: Author counts in one scan; the optional filters restrict both the CTE and the join.
+AUTHOR_BOOK_COUNTS_SQL = """
+WITH book_sizes AS (
+    SELECT {book}, COUNT(*) AS num_authors
+    FROM {table}{book_filter}
+    GROUP BY {book}
+)
+SELECT link.{author},
+       COUNT(*),
+       SUM(CASE WHEN book_sizes.num_authors = 1 THEN 1 ELSE 0 END),
+       SUM(CASE WHEN book_sizes.num_authors > 1 THEN 1 ELSE 0 END)
+FROM {table} link
+JOIN book_sizes ON book_sizes.{book} = link.{book}{author_filter}
+GROUP BY link.{author}
+"""
+
+
+def author_book_counts_sql(author_ids=None, connection=None):
+    """Return the single-pass counting query and its parameters.
+
+    Parameters
+    ----------
+    author_ids : list of int, optional
+        Restrict the result to these authors; every author when ``None``.
+        Only the books of these authors are counted.
+    connection : django.db.backends.base.base.BaseDatabaseWrapper, optional
+        Connection whose quoting rules are used; the default database's
+        when omitted.
+
+    Returns
+    -------
+    tuple
+        ``(sql, params)`` selecting ``(author_id, book_count,
+        solo_book_count, coauthored_book_count)`` per author with at
+        least one book.
+    """
+    qn = (connection or connections[DEFAULT_DB_ALIAS]).ops.quote_name
+    table = qn(BookAuthor._meta.db_table)
+    book = qn(BookAuthor._meta.get_field("book").column)
+    author = qn(BookAuthor._meta.get_field("author").column)
+
+    book_filter = author_filter = ""
+    params = []
+    if author_ids is not None:
+        placeholders = ", ".join(["%s"] * len(author_ids))
+        book_filter = f"\n    WHERE {book} IN (SELECT {book} FROM {table} WHERE {author} IN ({placeholders}))"
+        author_filter = f"\nWHERE link.{author} IN ({placeholders})"
+        params = [*author_ids, *author_ids]
+
+    sql = AUTHOR_BOOK_COUNTS_SQL.format(
+        table=table, book=book, author=author, book_filter=book_filter, author_filter=author_filter
+    )
+    return sql, params
+
+
+def author_book_counts(author_ids=None, using=DEFAULT_DB_ALIAS):
+    """Yield the book counters of authors, computed in one scan.
+
+    Parameters
+    ----------
+    author_ids : Iterable[int], optional
+        Restrict the result to these authors; every author when ``None``.
+    using : str, optional
+        Database alias to query.
+
+    Yields
+    ------
+    tuple
+        ``(author_id, book_count, solo_book_count, coauthored_book_count)``
+        for every author with at least one book; authors without books
+        are not yielded.
+    """
+    if author_ids is not None:
+        author_ids = list(author_ids)
+        if not author_ids:
+            return
+    connection = connections[using]
+    sql, params = author_book_counts_sql(author_ids, connection)
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        while rows := cursor.fetchmany(FETCH_SIZE):
+            yield from rows
+
+
+def refresh_author_counters(ids=None, using=DEFAULT_DB_ALIAS, batch_size=500):
+    """Rewrite the author counter caches that differ from their true value.
+
+    Parameters
+    ----------
+    ids : Iterable[int], optional
+        Authors to refresh; every author when ``None``.
+    using : str, optional
+        Database alias to use.
+    batch_size : int, optional
+        Rows written per ``bulk_update``.
+
+    Returns
+    -------
+    int
+        Number of authors whose counters changed.
+    """
+    if ids is not None:
+        ids = list(ids)
+    counts = {row[0]: row[1:] for row in author_book_counts(ids, using)}
+
+    authors = Author.objects.using(using).order_by()
+    if ids is not None:
+        authors = authors.filter(pk__in=ids)
+    changed = []
+    for pk, *stored in authors.values_list("pk", *Author.counter_fields).iterator():
+        actual = counts.get(pk, (0, 0, 0))
+        if tuple(stored) != tuple(actual):
+            changed.append(Author(pk=pk, **dict(zip(Author.counter_fields, actual))))
+
+    Author.objects.using(using).bulk_update(changed, Author.counter_fields, batch_size=batch_size)
+    return len(changed)
+
+
+def legacy_author_stats_queryset():
+    """Return the author statistics query the statistics page used to run.
+
+    Each author's counts were ``Sum(Case(When(books__in=...)))`` over a
+    subquery annotating every book with its number of authors. Kept only
+    so ``benchmark_author_stats`` can compare against it.
+
+    Returns
+    -------
+    django.db.models.query.QuerySet
+        ``(pk, solo_books, coauthored_books)`` tuples per author.
+    """
+    books_with_author_count = Book.objects.annotate(num_authors=Count("authors"))
+    return Author.objects.order_by().annotate(
+        solo_books=Sum(
+            Case(
+                When(books__in=books_with_author_count.filter(num_authors=1), then=1),
+                default=0,
+                output_field=IntegerField(),
+            )
+        ),
+        coauthored_books=Sum(
+            Case(
+                When(books__in=books_with_author_count.filter(num_authors__gt=1), then=1),
+                default=0,
+                output_field=IntegerField(),
+            )
+        ),
+    ).values_list("pk", "solo_books", "coauthored_books")
@@ -13,17 +13,75 @@ provided by Django's test runner; they are intentionally small and
 fast so they can run during development.
 """
 
-from django.test import TestCase
-from django.db import IntegrityError
+from csv import reader
+from datetime import date, time, timedelta
+from io import BytesIO, StringIO
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from types import SimpleNamespace
+from unittest import mock
+from zipfile import ZIP_DEFLATED, ZipFile
+
+from auditlog.context import disable_auditlog
+from auditlog.models import LogEntry
+from openpyxl import load_workbook
+from pandas import DataFrame, read_excel
+from PIL import Image
+from django.contrib import admin
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group, Permission
+from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.files.uploadhandler import SkipFile, StopUpload
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import IntegrityError, connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
 
+from bookprocess import archives, validation
+from .exports import EXPORT_COLUMNS
+from .importing import file_sha256
 from .models import (
     Book,
     Genre,
     Author,
     Nationality,
     BookAuthor,
+    BookCheckpoint,
+    IsbnReallocation,
+    ImportRun,
+    Statistic,
 )
+from .reference import load_reference
+from .services import AuditLogService, BookBulkService, BookHistoryService
+from .statistics import author_book_counts, refresh_author_counters
+from .uploads import COVER_MAX_DIMENSION, CappedUploadHandler
+from .utils import parse_as_of
+from .validation import validate_author_frame, validate_book_frame
+
+
+class AdminTestCase(TestCase):
+    """Base class for admin tests: a logged-in superuser and a small catalog.
+
+    The superuser :attr:`user`, the genre :attr:`genre` ("Fiction"), the
+    nationality :attr:`romania` ("606") and its author :attr:`author`
+    ("Ion Pop") are created once per class.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create the superuser, genre, nationality and author shared by the tests."""
+        cls.user = get_user_model().objects.create_superuser("admin", "admin@example.com", "pw")
+        cls.genre = Genre.objects.create(name="Fiction")
+        cls.romania = Nationality.objects.create(name="Romania", code="606")
+        cls.author = Author.objects.create(first_name="Ion", last_name="Pop", nationality=cls.romania)
+
+    def setUp(self):
+        """Log in the superuser."""
+        self.client.force_login(self.user)
 
 
 class NationalityTests(TestCase):
@@ -179,3 +237,1186 @@ class BookAuthorTests(TestCase):
         BookAuthor.objects.create(book=book, author=a, order=0)
         with self.assertRaises(IntegrityError):
             BookAuthor.objects.create(book=book, author=a, order=1)
+
+    def test_manager_attach_appends_after_existing(self):
+        """attach appends new authors after the current last one and skips duplicates."""
+        n = Nationality.objects.create(name="N4", code="604")
+        a1 = Author.objects.create(first_name="A", last_name="One", nationality=n)
+        a2 = Author.objects.create(first_name="B", last_name="Two", nationality=n)
+        book = Book.objects.create(title="Attach", genre=Genre.objects.create(name="A"))
+
+        BookAuthor.objects.attach(book, [a1])
+        created = BookAuthor.objects.attach(book, [a1, a2])
+
+        self.assertEqual([link.author_id for link in created], [a2.pk])
+        self.assertEqual(list(book.bookauthor_set.values_list("author_id", "order")), [(a1.pk, 1), (a2.pk, 2)])
+
+    def test_manager_replace_and_reorder(self):
+        """replace sets the exact author list and reorder renumbers it in place."""
+        n = Nationality.objects.create(name="N5", code="605")
+        a1, a2, a3 = (Author.objects.create(first_name=f"F{i}", last_name="L", nationality=n) for i in range(3))
+        book = Book.objects.create(title="Replace", genre=Genre.objects.create(name="R"))
+        BookAuthor.objects.attach(book, [a1, a2])
+
+        BookAuthor.objects.replace(book, [a3, a1])
+        self.assertEqual(book.ordered_authors(), [a3, a1])
+
+        self.assertEqual(BookAuthor.objects.reorder(book, [a1]), 2)
+        self.assertEqual(book.ordered_authors(), [a1, a3])
+
+
+class PrimaryNationalityTests(TestCase):
+    """Unit tests for the denormalized ``Book.primary_nationality`` column.
+
+    The column must follow the first author through the batched manager,
+    single-row saves, ``Book.authors`` and author nationality changes.
+    """
+
+    def setUp(self):
+        """Create two nationalities, two authors and a book."""
+        self.ro = Nationality.objects.create(name="Romania", code="606")
+        self.gr = Nationality.objects.create(name="Greece", code="618")
+        self.a1 = Author.objects.create(first_name="Ion", last_name="Pop", nationality=self.ro)
+        self.a2 = Author.objects.create(first_name="Nikos", last_name="Kazantzakis", nationality=self.gr)
+        self.book = Book.objects.create(title="Denorm", genre=Genre.objects.create(name="D"), isbn="9786060000003")
+
+    def _stored(self):
+        """Return the primary nationality id stored in the database."""
+        return Book.objects.values_list("primary_nationality_id", flat=True).get(pk=self.book.pk)
+
+    def test_manager_keeps_first_author_nationality(self):
+        """attach and replace update the column and the in-memory instance."""
+        BookAuthor.objects.attach(self.book, [self.a1, self.a2])
+        self.assertEqual(self.book.primary_nationality_id, self.ro.pk)
+        self.assertEqual(self._stored(), self.ro.pk)
+
+        BookAuthor.objects.replace(self.book, [self.a2])
+        self.assertEqual(self.book.primary_nationality_id, self.gr.pk)
+        self.assertEqual(self._stored(), self.gr.pk)
+
+        BookAuthor.objects.replace(self.book, [])
+        self.assertIsNone(self._stored())
+
+    def test_signals_follow_relations_and_author_nationality(self):
+        """Single-row relations and author nationality edits refresh the column."""
+        self.book.authors.add(self.a2)
+        self.assertEqual(self._stored(), self.gr.pk)
+
+        self.a2.nationality = self.ro
+        self.a2.save()
+        self.assertEqual(self._stored(), self.ro.pk)
+
+        BookAuthor.objects.filter(book=self.book).delete()
+        self.assertIsNone(self._stored())
+
+    def test_books_list_filters_on_primary_nationality(self):
+        """The public list filters by the first author's nationality only."""
+        BookAuthor.objects.attach(self.book, [self.a2, self.a1])
+        response = self.client.get("/books/", {"nationality": self.gr.pk})
+        self.assertEqual(list(response.context["page_obj"]), [self.book])
+        response = self.client.get("/books/", {"nationality": self.ro.pk})
+        self.assertEqual(list(response.context["page_obj"]), [])
+
+
+class CounterCacheTests(TestCase):
+    """Unit tests for the counter-cache columns.
+
+    Checks that the counters follow relation and classification changes
+    and that drift is detected and repaired.
+    """
+
+    def setUp(self):
+        """Create a nationality, a genre and two authors."""
+        self.nat = Nationality.objects.create(name="Counted", code="607")
+        self.genre = Genre.objects.create(name="Counted")
+        self.a1 = Author.objects.create(first_name="Solo", last_name="Writer", nationality=self.nat)
+        self.a2 = Author.objects.create(first_name="Co", last_name="Writer", nationality=self.nat)
+
+    def test_counters_follow_changes(self):
+        """Book, author and nationality counters track creates, links and moves."""
+        solo = Book.objects.create(title="Solo", genre=self.genre, isbn="9786070000001")
+        duo = Book.objects.create(title="Duo", genre=self.genre, isbn="9786070000002")
+        BookAuthor.objects.attach(solo, [self.a1])
+        BookAuthor.objects.attach(duo, [self.a1, self.a2])
+
+        self.a1.refresh_from_db()
+        self.assertEqual((self.a1.book_count, self.a1.solo_book_count, self.a1.coauthored_book_count), (2, 1, 1))
+        self.genre.refresh_from_db()
+        self.assertEqual(self.genre.book_count, 2)
+        self.nat.refresh_from_db()
+        self.assertEqual(self.nat.author_count, 2)
+
+        BookAuthor.objects.replace(duo, [self.a2])
+        other = Genre.objects.create(name="Other")
+        duo.genre = other
+        duo.save()
+
+        self.a1.refresh_from_db()
+        self.a2.refresh_from_db()
+        self.assertEqual((self.a1.book_count, self.a1.solo_book_count, self.a1.coauthored_book_count), (1, 1, 0))
+        self.assertEqual((self.a2.solo_book_count, self.a2.coauthored_book_count), (1, 0))
+        self.assertEqual(Genre.objects.get(pk=self.genre.pk).book_count, 1)
+        self.assertEqual(Genre.objects.get(pk=other.pk).book_count, 1)
+
+    def test_stale_instance_save_keeps_counters(self):
+        """Saving an instance loaded before a counter change does not reset it."""
+        book = Book.objects.create(title="Keep", genre=self.genre, isbn="9786070000003")
+        BookAuthor.objects.attach(book, [self.a1])
+
+        self.a1.first_name = "Renamed"
+        self.a1.save()
+        self.assertEqual(Author.objects.get(pk=self.a1.pk).book_count, 1)
+
+    def test_counter_drift_and_repair(self):
+        """counter_drift lists rows out of sync and refresh_counters fixes them."""
+        Genre.objects.filter(pk=self.genre.pk).update(book_count=7)
+
+        drifted = list(Genre.objects.counter_drift())
+        self.assertEqual([(g.pk, g.actual_book_count) for g in drifted], [(self.genre.pk, 0)])
+
+        Genre.objects.refresh_counters([self.genre.pk])
+        self.assertFalse(Genre.objects.counter_drift().exists())
+
+
+class BookHistoryTests(TestCase):
+    """Unit tests for :class:`bookprocess.services.BookHistoryService`.
+
+    Audit entries are written with explicit timestamps so that the
+    reconstruction can be checked at well-known moments.
+    """
+
+    def setUp(self):
+        """Create a book without auditlog noise and a reference moment."""
+        with disable_auditlog():
+            self.book = Book.objects.create(title="Old", genre=Genre.objects.create(name="H"), isbn="9786060000001")
+        self.start = timezone.now() - timedelta(days=10)
+
+    def _log(self, action, changes, days):
+        """Write an audit entry for the test book ``days`` after ``self.start``."""
+        return LogEntry.objects.create(
+            content_type=ContentType.objects.get_for_model(Book),
+            object_pk=str(self.book.pk),
+            object_repr=str(self.book),
+            action=action,
+            changes=changes,
+            timestamp=self.start + timedelta(days=days),
+        )
+
+    def test_book_as_of_replays_entries(self):
+        """book_as_of returns the state valid at the requested moment."""
+        self._log(LogEntry.Action.CREATE, {"title": [None, "Old"], "isbn": [None, "9786060000001"]}, 0)
+        self._log(LogEntry.Action.UPDATE, {"title": ["Old", "New"]}, 2)
+        self._log(LogEntry.Action.DELETE, {}, 4)
+
+        self.assertIsNone(BookHistoryService.book_as_of(self.book.pk, self.start - timedelta(days=1)))
+        self.assertEqual(BookHistoryService.book_as_of(self.book.pk, self.start + timedelta(days=1))["title"], "Old")
+        state = BookHistoryService.book_as_of(self.book.pk, self.start + timedelta(days=3))
+        self.assertEqual(state, {"title": "New", "isbn": "9786060000001"})
+        self.assertIsNone(BookHistoryService.book_as_of(self.book.pk, self.start + timedelta(days=5)))
+
+    def test_checkpoint_bounds_replay(self):
+        """A checkpoint folds pending entries and later replays start from it."""
+        self._log(LogEntry.Action.CREATE, {"title": [None, "Old"]}, 0)
+        self._log(LogEntry.Action.UPDATE, {"title": ["Old", "Mid"]}, 1)
+        checkpoint = BookHistoryService.checkpoint_if_needed(self.book.pk, interval=2)
+
+        self.assertEqual(checkpoint.state, {"title": "Mid"})
+        self.assertIsNone(BookHistoryService.checkpoint_if_needed(self.book.pk, interval=2))
+
+        LogEntry.objects.filter(pk__lte=checkpoint.log_entry_id).delete()
+        self._log(LogEntry.Action.UPDATE, {"title": ["Mid", "New"]}, 2)
+        self.assertEqual(BookHistoryService.book_as_of(self.book.pk, self.start + timedelta(days=3))["title"], "New")
+
+    def test_bulk_updates_checkpoint_in_one_pass(self):
+        """Bulk audit entries are counted per book in one query and checkpointed together."""
+        with disable_auditlog():
+            books = [
+                Book.objects.create(title=f"B{i}", genre=self.book.genre, isbn=f"978606000{i:04d}")
+                for i in range(2, 32)
+            ]
+        with self.assertNumQueries(2):
+            AuditLogService.log_bulk_updates(None, [(book, {"title": ["A", book.title]}) for book in books])
+
+        self._log(LogEntry.Action.UPDATE, {"title": ["A", "Old"]}, 0)
+        self._log(LogEntry.Action.UPDATE, {"title": ["Old", "Mid"]}, 1)
+        created = BookHistoryService.checkpoint_books_if_needed([self.book.pk, *(b.pk for b in books)], interval=2)
+        self.assertEqual([(c.object_pk, c.state) for c in created], [(str(self.book.pk), {"title": "Mid"})])
+
+    def test_build_checkpoints_merges_existing_checkpoints(self):
+        """Backfilled checkpoints continue from each book's newest checkpoint."""
+        with disable_auditlog():
+            other = Book.objects.create(title="Other", genre=self.book.genre, isbn="9786060000002")
+        self._log(LogEntry.Action.CREATE, {"title": [None, "Old"], "isbn": [None, "1"]}, 0)
+        BookHistoryService.checkpoint_if_needed(self.book.pk, interval=1)
+        self._log(LogEntry.Action.UPDATE, {"title": ["Old", "Mid"]}, 1)
+        self._log(LogEntry.Action.UPDATE, {"title": ["Mid", "New"]}, 2)
+        for days, title in enumerate(["A", "B", "C"]):
+            LogEntry.objects.create(
+                content_type=ContentType.objects.get_for_model(Book), object_pk=str(other.pk),
+                object_repr="Other", action=LogEntry.Action.UPDATE, changes={"title": ["", title]},
+                timestamp=self.start + timedelta(days=days),
+            )
+
+        self.assertEqual(BookHistoryService.build_checkpoints(interval=2, batch_size=1), 2)
+        states = dict(BookHistoryService._newest_checkpoints().values_list("object_pk", "state"))
+        self.assertEqual(states, {str(self.book.pk): {"title": "New", "isbn": "1"}, str(other.pk): {"title": "B"}})
+
+    def test_parse_as_of(self):
+        """Plain dates mean the end of the day; impossible dates are rejected."""
+        moment = timezone.localtime(parse_as_of("2025-01-31"))
+        self.assertEqual((moment.date().isoformat(), moment.time()), ("2025-01-31", time.max))
+        self.assertEqual(timezone.localtime(parse_as_of("2025-01-31T12:00")).hour, 12)
+        for value in ("2025-02-30", "2025-01-31T25:00", "yesterday", ""):
+            self.assertIsNone(parse_as_of(value), value)
+
+    def test_as_of_view_requires_view_permission(self):
+        """Staff without the book view permission cannot read past states."""
+        user = get_user_model().objects.create_user("staff", password="pw", is_staff=True)
+        self.client.force_login(user)
+        url = f"/admin/bookprocess/book/{self.book.pk}/as-of/"
+        self.assertEqual(self.client.get(url).status_code, 403)
+
+        user.user_permissions.add(Permission.objects.get(codename="view_book"))
+        self.assertEqual(self.client.get(url, {"as_of": "2025-02-30"}).status_code, 200)
+
+    def test_catalog_as_of_merges_checkpoints_and_entries(self):
+        """catalog_as_of yields every living book, with or without a checkpoint."""
+        with disable_auditlog():
+            other = Book.objects.create(title="Other", genre=self.book.genre, isbn="9786060000002")
+        self._log(LogEntry.Action.CREATE, {"title": [None, "Old"]}, 0)
+        BookHistoryService.checkpoint_if_needed(self.book.pk, interval=1)
+        LogEntry.objects.create(
+            content_type=ContentType.objects.get_for_model(Book),
+            object_pk=str(other.pk),
+            object_repr=str(other),
+            action=LogEntry.Action.CREATE,
+            changes={"title": [None, "Other"]},
+            timestamp=self.start,
+        )
+
+        catalog = dict(BookHistoryService.catalog_as_of(self.start + timedelta(days=1)))
+        self.assertEqual(catalog, {str(self.book.pk): {"title": "Old"}, str(other.pk): {"title": "Other"}})
+        self.assertEqual(BookCheckpoint.objects.count(), 1)
+
+
+class ImportValidationTests(TestCase):
+    """Unit tests for the whole-frame importer validation."""
+
+    def test_book_frame_reports_first_failure_per_row(self):
+        """Each invalid row gets the message of its first failing check."""
+        base = {"title": "T", "adapted": "no", "film_title": "", "cover_path": "",
+                "authors": "Ion Pop", "nationalities": "Romania", "genre": "Fiction"}
+        df = DataFrame([
+            dict(base, isbn="978-606-1234567"),
+            dict(base, isbn="9786061234567"),
+            dict(base, isbn="97860", title=""),
+            dict(base, isbn="9786061111111", authors="A, B"),
+            dict(base, isbn="9789731111111"),
+            dict(base, isbn="9786062222222", genre="Poetry"),
+            dict(base, isbn="9786063333333"),
+        ])
+
+        rows = validate_book_frame(df, {"Romania": 606}, {"Fiction"}, {"9786063333333"})
+
+        self.assertEqual(list(rows["isbn"][:2]), ["9786061234567", "9786061234567"])
+        self.assertEqual(list(rows["error"]), [
+            None,
+            "Row 3: ISBN 9786061234567 already exists, skipping",
+            "Row 4: title missing, skipping",
+            "Row 5: authors count != nationalities count",
+            "Row 6: ISBN code 973 != primary author Ion Pop code 606",
+            "Row 7: Genre 'Poetry' not found",
+            "Row 8: ISBN 9786063333333 already exists, skipping",
+        ])
+
+    def test_partitioned_validation_matches_single_pass(self):
+        """Validating in worker processes gives the same rows, including cross-partition duplicates."""
+        df = DataFrame([
+            {"title": f"T{i}", "isbn": f"97860612345{i % 7:02d}", "adapted": "no", "film_title": "",
+             "cover_path": "", "authors": "Ion Pop", "nationalities": "Romania",
+             "genre": "Fiction" if i % 5 else "Poetry"}
+            for i in range(40)
+        ])
+        args = ({"Romania": 606}, {"Fiction"}, set())
+        expected = validate_book_frame(df, *args)
+
+        with mock.patch.object(validation, "PARTITION_MIN_ROWS", 0):
+            rows = validation.validate_in_partitions(validate_book_frame, df, 3, *args)
+
+        self.assertEqual(list(rows.index), list(expected.index))
+        self.assertEqual(list(rows["error"]), list(expected["error"]))
+        self.assertEqual(rows["error"].isna().sum(), 7)
+
+    def test_author_frame(self):
+        """Author rows are checked for blanks, letters and known nationalities."""
+        df = DataFrame({
+            "author": ["Ion Pop", None, "1234", "Ana Blandiana"],
+            "nationality": ["Romania", "Romania", "Romania", "Atlantis"],
+        })
+
+        rows = validate_author_frame(df, {"Romania"})
+
+        self.assertEqual(list(rows["error"]), [
+            None,
+            "Row 3: author missing, skipping",
+            "Row 4: author name '1234' contains no letters, skipping",
+            "Row 5: Nationality 'Atlantis' not found, skipping",
+        ])
+
+
+class ImportArchiveTests(TestCase):
+    """Tests for importing books and covers straight from a ZIP."""
+
+    def _zip(self, members):
+        """Return an in-memory ZIP built from ``{name: bytes}``."""
+        buffer = BytesIO()
+        with ZipFile(buffer, "w", ZIP_DEFLATED) as zf:
+            for name, data in members.items():
+                zf.writestr(name, data)
+        buffer.seek(0)
+        return buffer
+
+    def test_import_streams_cover_from_zip(self):
+        """The sheet and its covers are read from the archive without extracting it."""
+        Genre.objects.create(name="Fiction")
+        Nationality.objects.create(name="Romania", code="606")
+        sheet = BytesIO()
+        DataFrame([{
+            "title": "Zipped", "isbn": "9786061234567", "adapted": "no", "film_title": "",
+            "cover_path": "covers/zipped.png", "authors": "Ion Pop",
+            "nationalities": "Romania", "genre": "Fiction",
+        }]).to_excel(sheet, index=False)
+        image = BytesIO()
+        Image.new("RGB", (4, 4)).save(image, "PNG")
+
+        with TemporaryDirectory() as tmp, override_settings(MEDIA_ROOT=tmp):
+            archive = Path(tmp) / "import.zip"
+            archive.write_bytes(self._zip({
+                "books.xlsx": sheet.getvalue(),
+                "covers/zipped.png": image.getvalue(),
+            }).getvalue())
+
+            call_command("admin_init_book", str(archive))
+
+            book = Book.objects.get(isbn="9786061234567")
+            self.assertTrue(book.cover.name.startswith("covers/zipped"))
+            self.assertTrue((Path(tmp) / book.cover.name).exists())
+            self.assertFalse((Path(tmp) / "import").exists())
+
+    def test_invalid_cover_is_skipped(self):
+        """A cover that is not an image is reported and the book imported without it."""
+        Genre.objects.create(name="Fiction")
+        Nationality.objects.create(name="Romania", code="606")
+        sheet = BytesIO()
+        DataFrame([
+            {"title": f"Book {i}", "isbn": f"978606123456{i}", "adapted": "no", "film_title": "",
+             "cover_path": "broken.png", "authors": "Ion Pop", "nationalities": "Romania",
+             "genre": "Fiction"}
+            for i in range(3)
+        ]).to_excel(sheet, index=False)
+
+        with TemporaryDirectory() as tmp, override_settings(MEDIA_ROOT=tmp):
+            archive = Path(tmp) / "import.zip"
+            archive.write_bytes(self._zip({"books.xlsx": sheet.getvalue(), "broken.png": b"text"}).getvalue())
+            out = StringIO()
+
+            call_command("admin_init_book", str(archive), "--cover-workers", "2", stdout=out)
+
+            self.assertEqual(Book.objects.filter(cover="").count(), 3)
+            self.assertIn("Row 2: cover 'broken.png' is not a valid image", out.getvalue())
+            self.assertFalse((Path(tmp) / "covers").exists())
+
+    def test_archive_limits(self):
+        """Archives over the member count or ratio limits are rejected."""
+        with mock.patch.object(archives, "MAX_MEMBERS", 1):
+            with self.assertRaisesRegex(ValueError, "members"):
+                archives.ImportArchive(self._zip({"a.xlsx": b"a", "b.png": b"b"}))
+
+        with self.assertRaisesRegex(ValueError, "compression ratio"):
+            archives.ImportArchive(self._zip({"bomb.png": b"\0" * (1024 * 1024)}))
+
+        with archives.ImportArchive(self._zip({"books.xlsx": b"x", "c/a.png": b"y"})) as archive:
+            self.assertEqual(archive.excel_member(), "books.xlsx")
+            self.assertEqual(archive.resolve("a.png", "c/books.xlsx"), "c/a.png")
+            self.assertIsNone(archive.resolve("../etc/passwd", "books.xlsx"))
+
+
+class ImportRunTests(TestCase):
+    """Tests for checkpointed, resumable imports."""
+
+    def setUp(self):
+        """Write a three-row author sheet to a temporary file."""
+        Nationality.objects.create(name="Romania", code="606")
+        self.tmp = TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        media = override_settings(MEDIA_ROOT=self.tmp.name)
+        media.enable()
+        self.addCleanup(media.disable)
+        self.path = Path(self.tmp.name) / "authors.xlsx"
+        DataFrame({
+            "author": ["Ion Pop", "Ana Blandiana", "Mircea Eliade"],
+            "nationality": ["Romania"] * 3,
+        }).to_excel(self.path, index=False)
+
+    def _run(self, *args):
+        """Run the author importer and return its output."""
+        out = StringIO()
+        call_command("admin_init_author", str(self.path), *args, stdout=out)
+        return out.getvalue()
+
+    def test_run_is_recorded(self):
+        """A finished import records the file hash and all rows as committed."""
+        self._run()
+
+        run = ImportRun.objects.get()
+        self.assertEqual(run.command, "admin_init_author")
+        self.assertEqual(run.file_hash, file_sha256(self.path))
+        self.assertEqual((run.last_row, run.total_rows, run.status), (3, 3, ImportRun.Status.COMPLETED))
+
+    def test_validate_only_writes_nothing(self):
+        """--validate-only reports invalid rows and creates no author."""
+        DataFrame({
+            "author": ["Ion Pop", "1234", "Ana Blandiana"],
+            "nationality": ["Romania", "Romania", "Atlantis"],
+        }).to_excel(self.path, index=False)
+
+        output = self._run("--validate-only")
+
+        self.assertIn("Row 3: author name '1234' contains no letters", output)
+        self.assertIn("Row 4: Nationality 'Atlantis' not found", output)
+        self.assertIn("3 rows checked, 1 valid, 2 invalid", output)
+        self.assertFalse(Author.objects.exists())
+        self.assertEqual(ImportRun.objects.get().status, ImportRun.Status.VALIDATED)
+
+    def test_resume_skips_committed_rows(self):
+        """--resume continues after the last committed row of an unfinished run."""
+        Author.objects.create(first_name="Ion", last_name="Pop", nationality=Nationality.objects.get())
+        Author.objects.create(first_name="Ana", last_name="Blandiana", nationality=Nationality.objects.get())
+        run = ImportRun.objects.create(
+            command="admin_init_author", file_name="authors.xlsx", file_hash=file_sha256(self.path),
+            total_rows=3, last_row=2, status=ImportRun.Status.FAILED,
+        )
+
+        output = self._run("--resume")
+
+        self.assertNotIn("Row 2:", output)
+        self.assertNotIn("Row 3:", output)
+        self.assertIn("Row 4: Created author 'Mircea Eliade'", output)
+        run.refresh_from_db()
+        self.assertEqual((run.last_row, run.status), (3, ImportRun.Status.COMPLETED))
+        self.assertEqual(ImportRun.objects.count(), 1)
+
+
+class UpsertImportTests(TestCase):
+    """Tests for the fingerprint-based ``--upsert`` import mode."""
+
+    def setUp(self):
+        """Create the lookups and a temporary folder for sheets."""
+        Genre.objects.create(name="Fiction")
+        Genre.objects.create(name="Poetry")
+        Nationality.objects.create(name="Romania", code="606")
+        Nationality.objects.create(name="Moldova", code="607")
+        self.tmp = TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        media = override_settings(MEDIA_ROOT=self.tmp.name)
+        media.enable()
+        self.addCleanup(media.disable)
+
+    def _import(self, command, rows, *args):
+        """Write ``rows`` to a sheet, run ``command`` on it and return its output."""
+        path = Path(self.tmp.name) / f"{command}.xlsx"
+        DataFrame(rows).to_excel(path, index=False)
+        out = StringIO()
+        call_command(command, str(path), *args, stdout=out)
+        return out.getvalue()
+
+    def test_book_upsert_applies_only_changes(self):
+        """Changed rows are updated and audited once; unchanged rows are skipped."""
+        rows = [
+            {"title": f"Book {i}", "isbn": f"978606123456{i}", "adapted": "no", "film_title": "",
+             "cover_path": "", "authors": "Ion Pop", "nationalities": "Romania", "genre": "Fiction"}
+            for i in range(3)
+        ]
+        self._import("admin_init_book", rows)
+        rows[1] = dict(rows[1], title="Renamed", genre="Poetry", authors="Ion Pop, Ana Blandiana",
+                       nationalities="Romania, Romania")
+
+        output = self._import("admin_init_book", rows, "--upsert")
+
+        self.assertIn("1 updated, 2 unchanged", output)
+        book = Book.objects.get(isbn="9786061234561")
+        self.assertEqual((book.title, book.genre.name), ("Renamed", "Poetry"))
+        self.assertEqual([str(a) for a in book.ordered_authors()], ["Ion Pop", "Ana Blandiana"])
+        self.assertEqual(Genre.objects.get(name="Poetry").book_count, 1)
+        entries = LogEntry.objects.filter(
+            content_type=ContentType.objects.get_for_model(Book), action=LogEntry.Action.UPDATE
+        )
+        self.assertEqual(entries.count(), 1)
+        self.assertEqual(set(entries.get().changes), {"title", "genre", "authors"})
+
+        output = self._import("admin_init_book", rows, "--upsert")
+        self.assertIn("0 updated, 3 unchanged", output)
+
+    def test_author_upsert_moves_nationality(self):
+        """An author whose row changed gets the new nationality and counters follow."""
+        self._import("admin_init_author", {"author": ["Ion Pop"], "nationality": ["Romania"]})
+
+        output = self._import("admin_init_author", {"author": ["Ion Pop"], "nationality": ["Moldova"]}, "--upsert")
+
+        self.assertIn("Row 2: Updated author 'Ion Pop' (Moldova)", output)
+        self.assertEqual(Author.objects.get().nationality.name, "Moldova")
+        self.assertEqual(Nationality.objects.get(name="Moldova").author_count, 1)
+        self.assertEqual(Nationality.objects.get(name="Romania").author_count, 0)
+
+
+class ImportResultTests(TestCase):
+    """Tests for the aggregated importer output shown in the admin."""
+
+    def test_admin_shows_summary_and_serves_log(self):
+        """An admin import adds one summary message and a downloadable CSV log."""
+        Nationality.objects.create(name="Romania", code="606")
+        user = get_user_model().objects.create_superuser("admin", "admin@example.com", "pw")
+        self.client.force_login(user)
+        sheet = BytesIO()
+        DataFrame({
+            "author": [f"Author Number{i}" for i in range(30)] + ["1234"],
+            "nationality": ["Romania"] * 31,
+        }).to_excel(sheet, index=False)
+
+        with TemporaryDirectory() as tmp, override_settings(MEDIA_ROOT=tmp):
+            response = self.client.post(
+                "/admin/bookprocess/author/populate-author/",
+                {"file": SimpleUploadedFile("authors.xlsx", sheet.getvalue())},
+                follow=True,
+            )
+
+            shown = [str(m) for m in response.context["messages"]]
+            self.assertEqual(len(shown), 1)
+            self.assertIn("Import finished: 30 success, 1 warning", shown[0])
+            self.assertIn("contains no letters", shown[0])
+
+            run = ImportRun.objects.get()
+            log = self.client.get(f"/admin/bookprocess/author/import-log/{run.pk}/")
+            rows = list(reader(b"".join(log.streaming_content).decode().splitlines()))
+            self.assertEqual(len(rows), 32)
+            self.assertEqual(rows[-1][1:], ["warning", "Row 32: author name '1234' contains no letters, skipping"])
+
+
+class ExportBundleTests(TestCase):
+    """Tests for the import-compatible export bundle."""
+
+    def setUp(self):
+        """Import two books, one with a cover, into a temporary media folder."""
+        Genre.objects.create(name="Fiction")
+        Nationality.objects.create(name="Romania", code="606")
+        Nationality.objects.create(name="Moldova", code="607")
+        self.tmp = TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        media = override_settings(MEDIA_ROOT=self.tmp.name)
+        media.enable()
+        self.addCleanup(media.disable)
+
+        self.folder = Path(self.tmp.name)
+        Image.new("RGB", (4, 4), "red").save(self.folder / "cover.png")
+        DataFrame([
+            {"title": "Miorita", "isbn": "9786061234560", "adapted": "yes", "film_title": "Miorita",
+             "cover_path": "cover.png", "authors": "Ion Pop, Ana Blandiana", "nationalities": "Romania, Moldova",
+             "genre": "Fiction"},
+            {"title": "Plumb", "isbn": "9786071234561", "adapted": "no", "film_title": "",
+             "cover_path": "", "authors": "Ana Blandiana", "nationalities": "Moldova", "genre": "Fiction"},
+        ]).to_excel(self.folder / "books.xlsx", index=False)
+        call_command("admin_init_book", str(self.folder / "books.xlsx"), stdout=StringIO())
+
+    def test_bundle_round_trips_through_importer(self):
+        """An exported bundle recreates the same books, authors and covers."""
+        bundle = self.folder / "export.zip"
+        out = StringIO()
+        call_command("export_books", str(bundle), stdout=out)
+        self.assertIn("Exported 2 book(s) and 1 cover(s)", out.getvalue())
+
+        with ZipFile(bundle) as zf:
+            sheet = read_excel(zf.open("books.xlsx"), dtype=str, keep_default_na=False)
+            self.assertEqual(list(sheet.columns), list(EXPORT_COLUMNS))
+            self.assertIn(sheet["cover_path"][0], zf.namelist())
+        self.assertEqual(sheet["authors"][0], "Ion Pop,Ana Blandiana")
+
+        Book.objects.all().delete()
+        call_command("admin_init_book", str(bundle), stdout=StringIO())
+
+        book = Book.objects.get(isbn="9786061234560")
+        self.assertEqual((book.title, book.adapted, book.film_title), ("Miorita", True, "Miorita"))
+        self.assertEqual([str(a) for a in book.ordered_authors()], ["Ion Pop", "Ana Blandiana"])
+        self.assertTrue(book.cover and book.cover.storage.exists(book.cover.name))
+        self.assertFalse(Book.objects.get(isbn="9786071234561").cover)
+
+    def test_admin_action_downloads_selection(self):
+        """The changelist action returns a ZIP holding only the selected books."""
+        admin_user = get_user_model().objects.create_superuser("admin", "admin@example.com", "pw")
+        self.client.force_login(admin_user)
+        book = Book.objects.get(isbn="9786071234561")
+
+        response = self.client.post(
+            "/admin/bookprocess/book/",
+            {"action": "export_as_import_bundle", "_selected_action": [book.pk]},
+        )
+
+        self.assertEqual(response["Content-Type"], "application/zip")
+        with ZipFile(BytesIO(b"".join(response.streaming_content))) as zf:
+            sheet = read_excel(zf.open("books.xlsx"), dtype=str, keep_default_na=False)
+            self.assertEqual(zf.namelist(), ["books.xlsx"])
+        self.assertEqual(list(sheet["title"]), ["Plumb"])
+
+
+class ReferenceSyncTests(TestCase):
+    """Tests for syncing lookup tables and roles with the reference data files."""
+
+    def _sync(self, *args):
+        """Run ``sync_reference_data`` and return its output."""
+        out = StringIO()
+        call_command("sync_reference_data", *args, stdout=out)
+        return out.getvalue()
+
+    def test_sync_is_idempotent(self):
+        """A second sync finds nothing to do and ``--check`` passes."""
+        with self.assertRaises(CommandError):
+            self._sync("--check")
+        self.assertFalse(Genre.objects.exists())
+
+        self._sync()
+        self.assertEqual(Genre.objects.count(), len(load_reference("genres")))
+        self.assertEqual(Nationality.objects.get(code="606").name, "Romania")
+        self.assertTrue(Group.objects.get(name="auditor").permissions.filter(codename="view_logentry").exists())
+        self.assertEqual(
+            LogEntry.objects.filter(content_type=ContentType.objects.get_for_model(Genre)).count(),
+            Genre.objects.count(),
+        )
+
+        output = self._sync("--check")
+        self.assertIn("Genres: 0 created, 0 updated, 0 deleted", output)
+        self.assertIn("Groups: 0 created, 0 updated, 0 deleted, 2 unchanged", output)
+
+    def test_drift_is_repaired_and_pruned(self):
+        """Changed rows are restored; extra rows are only pruned when unused."""
+        self._sync()
+        Nationality.objects.filter(code="606").update(name="Romania (old)")
+        Genre.objects.create(name="Unused")
+        used = Genre.objects.create(name="Used")
+        romania = Nationality.objects.get(code="606")
+        author = Author.objects.create(first_name="Ion", last_name="Pop", nationality=romania)
+        book = Book.objects.create(title="Miorita", genre=used)
+        BookAuthor.objects.create(book=book, author=author, order=0)
+        Group.objects.get(name="auditor").permissions.add(Permission.objects.get(codename="view_book"))
+
+        output = self._sync("--prune")
+
+        self.assertIn("Updated nationality '606': name 'Romania (old)' -> 'Romania'", output)
+        self.assertIn("Deleted genre 'Unused'", output)
+        self.assertIn("Cannot delete genre 'Used': it is still in use", output)
+        self.assertIn("Updated group 'auditor': -bookprocess.view_book", output)
+        self.assertEqual(Nationality.objects.get(code="606").name, "Romania")
+        self.assertEqual(list(Genre.objects.filter(name__in=["Unused", "Used"]).values_list("name", flat=True)), ["Used"])
+        self.assertEqual(
+            list(Group.objects.get(name="auditor").permissions.values_list("codename", flat=True)),
+            ["view_logentry"],
+        )
+
+
+    def test_administrators_can_retry_isbn_reallocations(self):
+        """The administrator role sees failed background re-allocations and may retry them."""
+        self._sync()
+        user = get_user_model().objects.create_user("staff", password="pw", is_staff=True)
+        user.groups.add(Group.objects.get(name="administrator"))
+        self.client.force_login(user)
+
+        response = self.client.get("/admin/bookprocess/isbnreallocation/")
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("retry", dict(response.context["action_form"].fields["action"].choices))
+
+
+class StatisticsExportTests(AdminTestCase):
+    """Tests for the streamed statistics exports."""
+
+    def setUp(self):
+        """Log in and give the author a solo book."""
+        super().setUp()
+        BookAuthor.objects.create(book=Book.objects.create(title="Miorita", genre=self.genre), author=self.author, order=0)
+
+    def test_csv_is_streamed(self):
+        """The CSV export is a streaming response holding every section."""
+        response = self.client.get("/admin/bookprocess/statistic/", {"export": "csv"})
+
+        self.assertTrue(response.streaming)
+        rows = list(reader(b"".join(response.streaming_content).decode("utf-8-sig").splitlines()))
+        self.assertIn(["Fiction", "1"], rows)
+        self.assertIn(["Romania", "1"], rows)
+        self.assertIn(["Ion Pop", "1", "0"], rows)
+
+    def test_xlsx_has_one_sheet_per_section(self):
+        """The XLSX export puts each section on its own sheet."""
+        response = self.client.get("/admin/bookprocess/statistic/", {"export": "xlsx"})
+
+        workbook = load_workbook(BytesIO(b"".join(response.streaming_content)))
+        self.assertEqual(workbook.sheetnames, ["Books per Genre", "Authors per Nationality", "Author Statistics"])
+        rows = list(workbook["Author Statistics"].iter_rows(values_only=True))
+        self.assertEqual(rows, [("Author", "Solo Books", "Co-authored Books"), ("Ion Pop", 1, 0)])
+
+
+class AuthorStatsEndpointTests(AdminTestCase):
+    """Tests for the paginated author statistics endpoint."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Add authors with different solo counts."""
+        super().setUpTestData()
+        Author.objects.bulk_create(
+            Author(first_name=f"Author{i:02d}", last_name="Pop", nationality=cls.romania, solo_book_count=i)
+            for i in range(1, 26)
+        )
+
+    def test_pages_are_sorted_in_sql(self):
+        """A page holds ``page_size`` rows in the requested order."""
+        response = self.client.get(
+            "/admin/bookprocess/statistic/author-stats/", {"sort": "-solo_books", "page": 2, "page_size": 10}
+        )
+
+        data = response.json()
+        self.assertEqual((data["count"], data["num_pages"], data["page"]), (26, 3, 2))
+        self.assertEqual([row["solo_books"] for row in data["results"]], list(range(15, 5, -1)))
+
+    def test_search_and_summary(self):
+        """Search filters by name and the changelist only renders the top authors."""
+        response = self.client.get("/admin/bookprocess/statistic/author-stats/", {"q": "author07 pop"})
+        self.assertEqual([row["author"] for row in response.json()["results"]], ["Author07 Pop"])
+
+        page = self.client.get("/admin/bookprocess/statistic/")
+        self.assertEqual(len(page.context["author_stats"]), 10)
+
+
+class StatisticSnapshotTests(AdminTestCase):
+    """Tests for the daily statistics snapshots."""
+
+    def setUp(self):
+        """Log in and create one adapted and one plain book."""
+        super().setUp()
+        for isbn, title, adapted in (("9786060000101", "Miorita", True), ("9786060000102", "Plumb", False)):
+            book = Book.objects.create(
+                title=title, genre=self.genre, isbn=isbn, adapted=adapted, film_title=title if adapted else ""
+            )
+            BookAuthor.objects.create(book=book, author=self.author, order=0)
+
+    def test_snapshot_is_one_row_per_day(self):
+        """Snapshotting twice on the same day refreshes the same row."""
+        call_command("snapshot_statistics", "--date", "2026-01-01", stdout=StringIO())
+        Book.objects.get(title="Plumb").delete()
+        out = StringIO()
+        call_command("snapshot_statistics", "--date", "2026-01-01", stdout=out)
+
+        self.assertIn("1 book(s), 1 author(s), 100% adapted", out.getvalue())
+        snapshot = Statistic.objects.get()
+        self.assertEqual(snapshot.date, date(2026, 1, 1))
+        self.assertEqual((snapshot.books_per_genre, snapshot.authors_per_nationality), ({"Fiction": 1}, {"Romania": 1}))
+
+    def test_deltas_compare_periods(self):
+        """Deltas compare the latest snapshot with the one a period earlier."""
+        Statistic.objects.snapshot(date(2026, 1, 1))
+        Book.objects.create(title="Nou", genre=Genre.objects.create(name="Poetry"), isbn="9786060000103")
+        Statistic.objects.snapshot(date(2026, 1, 8))
+
+        deltas = Statistic.objects.deltas(7)
+
+        self.assertEqual(deltas["previous"].date, date(2026, 1, 1))
+        self.assertEqual(deltas["totals"]["Books"], (3, 1))
+        self.assertEqual(deltas["genres"], {"Fiction": (2, 0), "Poetry": (1, 1)})
+        self.assertIsNone(Statistic.objects.deltas(30))
+        self.assertEqual(
+            [s.date for s in Statistic.objects.trend(days=3, until=date(2026, 1, 8))], [date(2026, 1, 8)]
+        )
+
+    def test_trend_days_are_clamped(self):
+        """An out-of-range ``?days=`` falls back to the longest trend period."""
+        response = self.client.get("/admin/bookprocess/statistic/", {"days": "1000000"})
+        self.assertEqual(response.context["trend_days"], 3650)
+
+
+class AuthorStatisticsQueryTests(TestCase):
+    """Tests for the single-pass author statistics query."""
+
+    def test_counts_match_correlated_expressions(self):
+        """Single-pass counts and refreshes agree with the correlated expressions."""
+        genre = Genre.objects.create(name="Fiction")
+        romania = Nationality.objects.create(name="Romania", code="606")
+        ion, ana, idle = (
+            Author.objects.create(first_name=name, last_name="Pop", nationality=romania)
+            for name in ("Ion", "Ana", "Idle")
+        )
+        solo = Book.objects.create(title="Solo", genre=genre, isbn="9786060000201")
+        duo = Book.objects.create(title="Duo", genre=genre, isbn="9786060000202")
+        BookAuthor.objects.attach(solo, [ion])
+        BookAuthor.objects.attach(duo, [ion, ana])
+
+        self.assertEqual(sorted(author_book_counts()), sorted([(ion.pk, 2, 1, 1), (ana.pk, 1, 0, 1)]))
+        self.assertEqual(list(author_book_counts([ana.pk])), [(ana.pk, 1, 0, 1)])
+
+        Author.objects.update(book_count=7, solo_book_count=7, coauthored_book_count=7)
+        self.assertEqual(refresh_author_counters(), 3)
+        self.assertFalse(Author.objects.counter_drift().exists())
+        self.assertEqual(refresh_author_counters([idle.pk]), 0)
+
+    def test_benchmark_plans_agree(self):
+        """The benchmark builds its own database and all plans return the same counts."""
+        out = StringIO()
+        call_command("benchmark_author_stats", "--sizes", "200", stdout=out)
+
+        self.assertRegex(out.getvalue(), r"\n\s+200\s+\d+\s+20\s+\S+s\s+\S+s\s+\S+s")
+        self.assertFalse(Author.objects.exists())
+
+
+class ChangelistPaginationTests(AdminTestCase):
+    """Tests for the request-scoped page size and estimated changelist counts."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Add a few nationalities."""
+        super().setUpTestData()
+        Nationality.objects.bulk_create(Nationality(name=f"Country {i:02d}", code=f"{i:03d}") for i in range(24))
+
+    def test_page_size_is_request_scoped(self):
+        """A requested page size applies to that request only and stays in the page links."""
+        response = self.client.get("/admin/bookprocess/nationality/", {"list_per_page": 20})
+        self.assertEqual(len(response.context["cl"].result_list), 20)
+        self.assertIn("list_per_page=20", response.context["cl"].get_query_string({"p": 2}))
+        self.assertEqual(admin.site._registry[Nationality].list_per_page, 10)
+
+        response = self.client.get("/admin/bookprocess/nationality/")
+        self.assertEqual(len(response.context["cl"].result_list), 10)
+
+    def test_large_tables_are_estimated(self):
+        """Unfiltered counts past the threshold come from the ANALYZE statistics unless an exact count is asked for."""
+        model_admin = admin.site._registry[Nationality]
+        with mock.patch.object(model_admin, "estimated_count_threshold", 20):
+            Nationality.objects.filter(code="000").delete()
+            with connection.cursor() as cursor:
+                cursor.execute("ANALYZE")
+            Nationality.objects.filter(code__in=["001", "002"]).delete()
+            cl = self.client.get("/admin/bookprocess/nationality/").context["cl"]
+            self.assertTrue(cl.count_estimated)
+            self.assertEqual(cl.result_count, 24)
+            self.assertIsNone(cl.full_result_count)
+
+            cl = self.client.get("/admin/bookprocess/nationality/", {"exact_count": 1}).context["cl"]
+            self.assertEqual((cl.count_estimated, cl.result_count), (False, 22))
+
+            cl = self.client.get("/admin/bookprocess/nationality/", {"q": "Country 07"}).context["cl"]
+            self.assertEqual((cl.count_estimated, cl.result_count), (False, 1))
+
+
+class BulkDeleteAuditTests(AdminTestCase):
+    """Tests for the set-based admin delete path."""
+
+    def setUp(self):
+        """Log in and create three books sharing the author."""
+        super().setUp()
+        for i in range(3):
+            book = Book.objects.create(title=f"Book {i}", genre=self.genre, isbn=f"978606000020{i}")
+            BookAuthor.objects.create(book=book, author=self.author, order=0)
+
+    def test_audit_entries_are_bulk_inserted(self):
+        """Deleted books are logged with one INSERT and the link rows cascade."""
+        book_type = ContentType.objects.get_for_model(Book)
+        doomed = Book.objects.filter(title__in=["Book 0", "Book 1"])
+        with CaptureQueriesContext(connection) as queries:
+            deleted, per_model = AuditLogService.delete_queryset(self.user, doomed)
+
+        self.assertEqual(per_model, {"bookprocess.BookAuthor": 2, "bookprocess.Book": 2})
+        self.assertEqual(sum('INSERT INTO "auditlog_logentry"' in q["sql"] for q in queries.captured_queries), 1)
+        entries = LogEntry.objects.filter(content_type=book_type, action=LogEntry.Action.DELETE)
+        self.assertEqual(
+            sorted(entries.values_list("object_repr", flat=True)),
+            ["Book 0 (9786060000200)", "Book 1 (9786060000201)"],
+        )
+        self.assertEqual({entry.actor for entry in entries}, {self.user})
+        self.assertEqual(entries.first().changes_dict["title"][1], "None")
+
+    def test_admin_action_refreshes_counters(self):
+        """The admin's delete action keeps the counter caches in sync."""
+        self.client.post(
+            "/admin/bookprocess/book/",
+            {"action": "delete_selected", "_selected_action": list(Book.objects.values_list("pk", flat=True)), "post": "yes"},
+        )
+
+        self.assertFalse(Book.objects.exists())
+        self.author.refresh_from_db()
+        self.genre.refresh_from_db()
+        self.assertEqual((self.author.book_count, self.genre.book_count), (0, 0))
+
+
+class BookBulkActionTests(AdminTestCase):
+    """Tests for the genre reassignment and ISBN regeneration actions."""
+
+    def setUp(self):
+        """Log in and create books by the Romanian author."""
+        super().setUp()
+        self.poetry = Genre.objects.create(name="Poetry")
+        for title, isbn in (("Matching", "9786060000301"), ("Stale", "9789730000302")):
+            book = Book.objects.create(title=title, genre=self.genre, isbn=isbn)
+            BookAuthor.objects.create(book=book, author=self.author, order=0)
+
+    def test_reassign_genre(self):
+        """The action asks for a genre, then moves the books with audit entries."""
+        data = {"action": "reassign_genre", "_selected_action": list(Book.objects.values_list("pk", flat=True))}
+        confirm = self.client.post("/admin/bookprocess/book/", data)
+        self.assertContains(confirm, "Move 2 books")
+
+        self.client.post("/admin/bookprocess/book/", {**data, "apply": "1", "genre": self.poetry.pk})
+
+        self.assertEqual(set(Book.objects.values_list("genre", flat=True)), {self.poetry.pk})
+        self.poetry.refresh_from_db()
+        self.genre.refresh_from_db()
+        self.assertEqual((self.genre.book_count, self.poetry.book_count), (0, 2))
+        self.assertEqual(LogEntry.objects.filter(action=LogEntry.Action.UPDATE, changes__has_key="genre").count(), 2)
+
+    def test_regenerate_mismatched_isbns(self):
+        """Only books whose ISBN country differs from the first author are renumbered."""
+        self.assertEqual(list(Book.objects.isbn_mismatches().values_list("title", flat=True)), ["Stale"])
+        response = self.client.get("/admin/bookprocess/book/", {"isbn_country": "mismatch"})
+        self.assertEqual([book.title for book in response.context["cl"].result_list], ["Stale"])
+
+        self.client.post(
+            "/admin/bookprocess/book/",
+            {"action": "regenerate_mismatched_isbns", "_selected_action": list(Book.objects.values_list("pk", flat=True))},
+        )
+
+        self.assertEqual(Book.objects.get(title="Matching").isbn, "9786060000301")
+        stale = Book.objects.get(title="Stale")
+        self.assertEqual(stale.isbn[3:6], "606")
+        self.assertFalse(Book.objects.isbn_mismatches().exists())
+        entry = LogEntry.objects.get(action=LogEntry.Action.UPDATE, object_pk=str(stale.pk))
+        self.assertEqual(entry.changes_dict["isbn"], ["9789730000302", stale.isbn])
+
+
+class AuthorIsbnReallocationTests(AdminTestCase):
+    """Tests for the ISBN re-allocation after an author's nationality changes."""
+
+    def setUp(self):
+        """Log in and make the author first on one book and second on another."""
+        super().setUp()
+        self.moldova = Nationality.objects.create(name="Moldova", code="607")
+        other = Author.objects.create(first_name="Ana", last_name="Rus", nationality=self.romania)
+        for title, isbn, authors in (
+            ("Own", "9786060000401", [self.author, other]),
+            ("Guest", "9786060000402", [other, self.author]),
+        ):
+            book = Book.objects.create(title=title, genre=self.genre, isbn=isbn)
+            for order, author in enumerate(authors, 1):
+                BookAuthor.objects.create(book=book, author=author, order=order)
+
+    def test_admin_change_reallocates_first_authored_books(self):
+        """Changing the nationality in the admin renumbers only the books the author is first on."""
+        page = self.client.get(f"/admin/bookprocess/author/{self.author.pk}/change/")
+        self.assertIn("nationality", page.context["adminform"].form.fields)
+
+        self.client.post(f"/admin/bookprocess/author/{self.author.pk}/change/", {
+            "first_name": "Ion", "last_name": "Pop", "nationality": self.moldova.pk,
+            "bookauthor_set-TOTAL_FORMS": 0, "bookauthor_set-INITIAL_FORMS": 0,
+        })
+
+        self.assertEqual(Book.objects.get(title="Own").isbn[3:6], "607")
+        self.assertEqual(Book.objects.get(title="Guest").isbn, "9786060000402")
+        self.assertTrue(LogEntry.objects.filter(action=LogEntry.Action.UPDATE, changes__has_key="isbn").exists())
+
+    def test_prolific_authors_are_handled_in_the_background(self):
+        """Past the inline limit the work is deferred to a thread started on commit."""
+        Author.objects.filter(pk=self.author.pk).update(nationality=self.moldova)
+        Book.objects.refresh_primary_nationality(Book.objects.values("pk"))
+        with (
+            mock.patch.object(BookBulkService, "REALLOCATE_INLINE_LIMIT", 0),
+            mock.patch("bookprocess.services.Thread") as thread,
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            self.assertIsNone(BookBulkService.schedule_author_isbn_reallocation(self.user, self.author))
+
+        thread.return_value.start.assert_called_once()
+        run = IsbnReallocation.objects.get()
+        self.assertEqual((thread.call_args.kwargs["args"], run.author, run.status), ((run.pk,), self.author, "running"))
+
+        with mock.patch("bookprocess.services.connection"):
+            BookBulkService._reallocate_in_background(run.pk)
+        run.refresh_from_db()
+        self.assertEqual((run.status, run.renumbered), ("completed", 1))
+        self.assertEqual(Book.objects.get(title="Own").isbn[3:6], "607")
+
+    def test_background_failures_are_recorded(self):
+        """A failing background run is logged and marked failed, and can be retried."""
+        run = IsbnReallocation.objects.create(author=self.author, user=self.user)
+        with (
+            mock.patch("bookprocess.services.connection"),
+            mock.patch.object(BookBulkService, "reallocate_author_isbns", side_effect=RuntimeError("clash")),
+            self.assertLogs("bookprocess.services", "ERROR"),
+        ):
+            BookBulkService._reallocate_in_background(run.pk)
+        run.refresh_from_db()
+        self.assertEqual((run.status, run.error), ("failed", "RuntimeError: clash"))
+
+        with mock.patch.object(BookBulkService, "schedule_author_isbn_reallocation") as schedule:
+            self.assertEqual(BookBulkService.retry_isbn_reallocations(self.user, IsbnReallocation.objects.all()), 1)
+        schedule.assert_called_once_with(self.user, self.author)
+
+
+    def test_import_upsert_reallocates_first_authored_books(self):
+        """Moving an author with the importer's ``--upsert`` renumbers their books as well."""
+        with TemporaryDirectory() as tmp, override_settings(MEDIA_ROOT=tmp):
+            path = Path(tmp) / "authors.xlsx"
+            DataFrame({"author": ["Ion Pop"], "nationality": ["Moldova"]}).to_excel(path, index=False)
+            call_command("admin_init_author", str(path), "--upsert", stdout=StringIO())
+
+        own = Book.objects.get(title="Own")
+        self.assertEqual((own.isbn[3:6], own.primary_nationality), ("607", self.moldova))
+        self.assertEqual(Book.objects.get(title="Guest").isbn, "9786060000402")
+
+
+class AddMultipleBooksTests(AdminTestCase):
+    """Tests for the batched add-multiple-books admin view."""
+
+    def test_books_are_created_in_bulk(self):
+        """All books, links, counters and audit entries are written together."""
+        data = {"author": self.author.pk}
+        for index, title in enumerate(["One", "Two", "Three"]):
+            data.update({f"book_{index}_title": title, f"book_{index}_genre": self.genre.pk})
+        with self.assertNumQueries(23):
+            response = self.client.post("/admin/bookprocess/book/multiple/", data)
+
+        self.assertEqual(response.status_code, 302)
+        books = Book.objects.order_by("pk")
+        self.assertEqual([book.title for book in books], ["One", "Two", "Three"])
+        self.assertTrue(all(book.isbn[3:6] == "606" and book.primary_nationality_id for book in books))
+        self.author.refresh_from_db()
+        self.genre.refresh_from_db()
+        self.assertEqual((self.author.book_count, self.genre.book_count), (3, 3))
+        entry = LogEntry.objects.get_for_object(books[0]).get(action=LogEntry.Action.CREATE)
+        self.assertEqual(entry.changes_dict["authors"], [None, "Ion Pop"])
+
+    def test_invalid_entry_saves_nothing(self):
+        """One invalid entry rejects the whole batch."""
+        response = self.client.post("/admin/bookprocess/book/multiple/", {
+            "author": self.author.pk,
+            "book_0_title": "Good", "book_0_genre": self.genre.pk,
+            "book_1_title": "Bad", "book_1_genre": "999",
+        })
+
+        self.assertContains(response, "Book 2 (&#x27;Bad&#x27;): choose a valid genre.")
+        self.assertFalse(Book.objects.exists())
+
+
+class CoverUploadTests(AdminTestCase):
+    """Tests for the streaming cover upload handlers of the add-multiple-books view."""
+
+    def setUp(self):
+        """Log in and use a temporary media root."""
+        super().setUp()
+        self.tmp = TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        media = override_settings(MEDIA_ROOT=self.tmp.name)
+        media.enable()
+        self.addCleanup(media.disable)
+
+    def post(self, **covers):
+        """Post one book per cover to the add-multiple-books view."""
+        data = {"author": self.author.pk}
+        for index, (name, content) in enumerate(covers.items()):
+            data.update({
+                f"book_{index}_title": name,
+                f"book_{index}_genre": self.genre.pk,
+                f"book_{index}_cover": SimpleUploadedFile(f"{name}.png", content, content_type="image/png"),
+            })
+        return self.client.post("/admin/bookprocess/book/multiple/", data)
+
+    def test_large_covers_are_downscaled(self):
+        """Covers are spooled to disk, stored and downscaled past the size limit."""
+        images = {}
+        for name, size in (("small", (40, 60)), ("large", (COVER_MAX_DIMENSION * 2, 100))):
+            buffer = BytesIO()
+            Image.new("RGB", size, "red").save(buffer, format="PNG")
+            images[name] = buffer.getvalue()
+
+        self.assertEqual(self.post(**images).status_code, 302)
+
+        with Image.open(Book.objects.get(title="small").cover.path) as cover:
+            self.assertEqual(cover.size, (40, 60))
+        with Image.open(Book.objects.get(title="large").cover.path) as cover:
+            self.assertEqual(cover.size, (COVER_MAX_DIMENSION, 50))
+
+    def test_invalid_cover_rejects_the_batch(self):
+        """A part that is not an image is dropped while streaming and nothing is saved."""
+        buffer = BytesIO()
+        Image.new("RGB", (10, 10)).save(buffer, format="PNG")
+        response = self.post(good=buffer.getvalue(), bad=b"not an image " * 100)
+
+        self.assertContains(response, "&#x27;bad.png&#x27; is not a valid image.")
+        self.assertFalse(Book.objects.exists())
+
+    def test_isbn_clash_rolls_back_and_removes_covers(self):
+        """An ISBN taken meanwhile re-renders the form and leaves no books or covers behind."""
+        taken = Book.objects.create(title="Taken", genre=self.genre, isbn="9786060000999")
+        buffer = BytesIO()
+        Image.new("RGB", (10, 10)).save(buffer, format="PNG")
+        with mock.patch("bookprocess.services.allocate_isbns", return_value=[taken.isbn, "9786060000998"]):
+            response = self.post(first=buffer.getvalue(), second=buffer.getvalue())
+
+        self.assertContains(response, "was taken meanwhile")
+        self.assertEqual(list(Book.objects.all()), [taken])
+        self.assertEqual(list(Path(self.tmp.name).rglob("*.png")), [])
+
+    def test_size_caps(self):
+        """Files and request bodies past their caps are reported."""
+        request = SimpleNamespace(upload_errors=[])
+        handler = CappedUploadHandler(request, max_file_size=10, max_total_size=15)
+        handler.new_file("book_0_cover", "a.png", "image/png", None)
+        handler.receive_data_chunk(b"x" * 8, 0)
+        with self.assertRaises(SkipFile):
+            handler.receive_data_chunk(b"x" * 4, 8)
+        handler.new_file("book_1_cover", "b.png", "image/png", None)
+        with self.assertRaises(StopUpload):
+            handler.receive_data_chunk(b"x" * 4, 0)
+        self.assertEqual(request.upload_errors, ["'a.png' is larger than 0 MB.", "The upload is larger than 0 MB."])
+
+
+class AuthorSearchTests(AdminTestCase):
+    """Tests for the normalized author name index and the author picker."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Add an author whose name needs normalizing."""
+        super().setUpTestData()
+        cls.stefan = Author.objects.create(first_name="Ștefan", last_name="O'Neill", nationality=cls.romania)
+
+    def test_search_matches_name_prefixes(self):
+        """Searches ignore accents, case and punctuation and accept either name order."""
+        self.assertEqual(self.stefan.search_name, "o neill stefan")
+        self.assertEqual(list(Author.objects.search("oneill")), [])
+        self.assertEqual(list(Author.objects.search("O'NEILL st")), [self.stefan])
+        self.assertEqual(list(Author.objects.search("stefan o")), [self.stefan])
+        self.assertEqual(list(Author.objects.search("p")), [self.author])
+
+        self.author.last_name = "Popescu"
+        self.author.save(update_fields=["last_name"])
+        self.assertEqual(Author.objects.get(pk=self.author.pk).search_name, "popescu ion")
+
+    def test_autocomplete_endpoint(self):
+        """The admin autocomplete view pages through the indexed search."""
+        response = self.client.get("/admin/autocomplete/", {
+            "app_label": "bookprocess", "model_name": "bookauthor", "field_name": "author", "term": "ion p",
+        })
+        self.assertEqual(response.json()["results"], [{"id": str(self.author.pk), "text": "Ion Pop"}])
+
+    def test_changelist_keeps_substring_search(self):
+        """The author changelist still finds first names and parts of last names."""
+        for term in ("Ion", "op"):
+            response = self.client.get("/admin/bookprocess/author/", {"q": term})
+            self.assertEqual(list(response.context["cl"].result_list), [self.author], term)
+
+    def test_form_renders_only_the_selected_author(self):
+        """The add-multiple-books page does not list every author."""
+        with self.assertNumQueries(3):
+            response = self.client.get("/admin/bookprocess/book/multiple/")
+        self.assertContains(response, "admin-autocomplete")
+        self.assertNotContains(response, "Ion Pop")
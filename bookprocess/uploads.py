@@ -0,0 +1,334 @@
+"""Upload handlers for the admin views that receive large multipart POSTs.
+
+Django's default handlers keep every upload smaller than
+``FILE_UPLOAD_MAX_MEMORY_SIZE`` in memory until the whole request has
+been parsed, so a form with two hundred covers can hold hundreds of
+megabytes per worker. The handlers installed by :func:`install_upload_handlers`
+instead:
+
+- enforce a per-file and a total size cap while the body is read
+  (:class:`CappedUploadHandler`);
+- spool every cover part to a temporary file on disk, check its image
+  header from the first chunks and validate and downscale it as soon as
+  the part ends, before the next part is read (:class:`CoverUploadHandler`);
+- spool every other file to disk (Django's ``TemporaryFileUploadHandler``).
+
+Problems are collected in ``request.upload_errors`` instead of raising,
+so the view can report them next to its other validation errors.
+"""
+
+import re
+
+from django.core.files.uploadedfile import TemporaryUploadedFile
+from django.core.files.uploadhandler import (
+    FileUploadHandler,
+    SkipFile,
+    StopFutureHandlers,
+    StopUpload,
+    TemporaryFileUploadHandler,
+)
+from PIL import Image, ImageFile
+
+COVER_FIELD = re.compile(r"^book_\d+_cover$") #: Names of the cover file fields of the add-multiple-books form.
+MAX_COVER_SIZE = 10 * 1024 * 1024 #: Largest accepted cover file, in bytes.
+MAX_COVERS_UPLOAD_SIZE = 512 * 1024 * 1024 #: Largest accepted add-multiple-books request body, in bytes.
+MAX_IMPORT_SIZE = 1024 * 1024 * 1024 #: Largest accepted import file, in bytes.
+MAX_COVER_PIXELS = 50_000_000 #: Covers with more pixels are rejected before they are decoded.
+COVER_MAX_DIMENSION = 1600 #: Covers larger than this many pixels on either side are downscaled.
+HEADER_PROBE_SIZE = 256 * 1024 #: Bytes of a cover read without finding an image header before it is rejected.
+
+
+def install_upload_handlers(request, max_file_size, max_total_size):
+    """Replace the upload handlers of ``request`` with the streaming pipeline.
+
+    Must be called before ``request.POST`` or ``request.FILES`` is read.
+
+    Parameters
+    ----------
+    request : django.http.HttpRequest
+        The incoming request.
+    max_file_size : int
+        Largest accepted file, in bytes.
+    max_total_size : int
+        Largest accepted total of all files, in bytes.
+
+    Returns
+    -------
+    None
+    """
+    request.upload_errors = []
+    request.upload_handlers = [
+        CappedUploadHandler(request, max_file_size=max_file_size, max_total_size=max_total_size),
+        CoverUploadHandler(request),
+        TemporaryFileUploadHandler(request),
+    ]
+
+
+class CappedUploadHandler(FileUploadHandler):
+    """Reject files and request bodies past a size limit while they stream in.
+
+    A file over ``max_file_size`` is skipped; once the files together
+    exceed ``max_total_size`` the rest of the body is discarded.
+
+    Parameters
+    ----------
+    request : django.http.HttpRequest
+        The incoming request.
+    max_file_size : int
+        Largest accepted file, in bytes.
+    max_total_size : int
+        Largest accepted total of all files, in bytes.
+    """
+
+    def __init__(self, request=None, max_file_size=MAX_COVER_SIZE, max_total_size=MAX_COVERS_UPLOAD_SIZE):
+        super().__init__(request)
+        self.max_file_size = max_file_size
+        self.max_total_size = max_total_size
+        self.total_size = 0 #: Bytes of file data received so far.
+
+    def new_file(self, *args, **kwargs):
+        """Start counting the size of a new file.
+
+        Returns
+        -------
+        None
+        """
+        super().new_file(*args, **kwargs)
+        self.file_size = 0
+
+    def receive_data_chunk(self, raw_data, start):
+        """Count ``raw_data`` against the caps and pass it on.
+
+        Parameters
+        ----------
+        raw_data : bytes
+            The chunk.
+        start : int
+            Offset of the chunk in the file.
+
+        Returns
+        -------
+        bytes
+            ``raw_data`` unchanged.
+
+        Raises
+        ------
+        django.core.files.uploadhandler.SkipFile
+            When the file is larger than ``max_file_size``.
+        django.core.files.uploadhandler.StopUpload
+            When the files together are larger than ``max_total_size``.
+        """
+        self.file_size += len(raw_data)
+        self.total_size += len(raw_data)
+        if self.total_size > self.max_total_size:
+            self.request.upload_errors.append(
+                f"The upload is larger than {self.max_total_size // (1024 * 1024)} MB."
+            )
+            raise StopUpload(connection_reset=False)
+        if self.file_size > self.max_file_size:
+            self.request.upload_errors.append(
+                f"'{self.file_name}' is larger than {self.max_file_size // (1024 * 1024)} MB."
+            )
+            raise SkipFile()
+        return raw_data
+
+    def file_complete(self, file_size):
+        """Leave the file to the next handler.
+
+        Returns
+        -------
+        None
+        """
+        return None
+
+
+class CoverUploadHandler(FileUploadHandler):
+    """Spool cover images to disk, validating and downscaling each one as it ends.
+
+    The first chunks of a cover are fed to :class:`PIL.ImageFile.Parser`
+    until the image header is known, so a file that is not an image, or
+    has too many pixels, is dropped before the rest of it is read. When
+    the part ends the spooled file is verified and, when larger than
+    :data:`COVER_MAX_DIMENSION`, replaced by a downscaled copy, so at most
+    one cover is decoded at a time.
+    """
+
+    def new_file(self, field_name, *args, **kwargs):
+        """Take over the cover fields and leave the others to later handlers.
+
+        Parameters
+        ----------
+        field_name : str
+            Name of the form field.
+        *args, **kwargs
+            The remaining ``new_file`` arguments.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        django.core.files.uploadhandler.StopFutureHandlers
+            For cover fields, which this handler stores itself.
+        """
+        super().new_file(field_name, *args, **kwargs)
+        self.activated = bool(COVER_FIELD.match(field_name))
+        if not self.activated:
+            return
+        self.file = TemporaryUploadedFile(self.file_name, self.content_type, 0, self.charset, self.content_type_extra)
+        self.parser = ImageFile.Parser()
+        self.probed = 0
+        raise StopFutureHandlers()
+
+    def receive_data_chunk(self, raw_data, start):
+        """Write a cover chunk to the spool, checking the image header on the way.
+
+        Parameters
+        ----------
+        raw_data : bytes
+            The chunk.
+        start : int
+            Offset of the chunk in the file.
+
+        Returns
+        -------
+        bytes or None
+            ``raw_data`` for other fields, ``None`` for covers.
+
+        Raises
+        ------
+        django.core.files.uploadhandler.SkipFile
+            When the cover is not an image or has too many pixels.
+        """
+        if not self.activated:
+            return raw_data
+
+        if self.parser is not None:
+            self._probe(raw_data)
+        self.file.write(raw_data)
+        return None
+
+    def _probe(self, raw_data):
+        """Feed ``raw_data`` to the header parser until the image size is known.
+
+        Parameters
+        ----------
+        raw_data : bytes
+            The chunk.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        django.core.files.uploadhandler.SkipFile
+            When the header is invalid, missing or announces too many pixels.
+        """
+        self.probed += len(raw_data)
+        try:
+            self.parser.feed(raw_data)
+        except Exception:
+            self._reject("is not a valid image")
+        image = self.parser.image
+        if image is None:
+            if self.probed > HEADER_PROBE_SIZE:
+                self._reject("is not a valid image")
+            return
+
+        self.parser = None
+        width, height = image.size
+        if width * height > MAX_COVER_PIXELS:
+            self._reject(f"is too large ({width}x{height} pixels)")
+
+    def _reject(self, reason):
+        """Record why the current cover is dropped and skip the rest of it.
+
+        Parameters
+        ----------
+        reason : str
+            Completes the sentence "'<file name>' ...".
+
+        Raises
+        ------
+        django.core.files.uploadhandler.SkipFile
+            Always.
+        """
+        self.parser = None
+        self.request.upload_errors.append(f"'{self.file_name}' {reason}.")
+        raise SkipFile()
+
+    def file_complete(self, file_size):
+        """Validate and, if needed, downscale the spooled cover.
+
+        Parameters
+        ----------
+        file_size : int
+            Size of the cover, in bytes.
+
+        Returns
+        -------
+        django.core.files.uploadedfile.TemporaryUploadedFile or None
+            The cover, or ``None`` for fields other handlers store.
+        """
+        if not self.activated:
+            return None
+        self.activated = False
+
+        self.file.size = file_size
+        if self.parser is not None:
+            self.request.upload_errors.append(f"'{self.file_name}' is not a valid image.")
+            self.parser = None
+        else:
+            try:
+                self.file = downscale_cover(self.file)
+            except Exception as e:
+                self.request.upload_errors.append(f"'{self.file_name}' is not a valid image ({e}).")
+        self.file.seek(0)
+        return self.file
+
+
+def downscale_cover(upload, max_dimension=COVER_MAX_DIMENSION):
+    """Verify a spooled cover and downscale it when it is too large.
+
+    JPEG images are decoded with Pillow's draft mode, which scales them
+    down by a power of two while decoding instead of decoding them in
+    full first.
+
+    Parameters
+    ----------
+    upload : django.core.files.uploadedfile.TemporaryUploadedFile
+        The spooled cover.
+    max_dimension : int, optional
+        Largest allowed width and height, in pixels.
+
+    Returns
+    -------
+    django.core.files.uploadedfile.TemporaryUploadedFile
+        ``upload`` itself, or a new spooled file with the downscaled image.
+
+    Raises
+    ------
+    Exception
+        Whatever Pillow raises for a broken image.
+    """
+    upload.seek(0)
+    with Image.open(upload) as image:
+        image.verify()
+
+    upload.seek(0)
+    with Image.open(upload) as image:
+        if max(image.size) <= max_dimension:
+            return upload
+        image_format = image.format
+        image.draft(image.mode, (max_dimension, max_dimension))
+        image.thumbnail((max_dimension, max_dimension))
+        resized = TemporaryUploadedFile(
+            upload.name, upload.content_type, 0, upload.charset, upload.content_type_extra
+        )
+        image.save(resized, format=image_format)
+
+    resized.size = resized.tell()
+    upload.close()
+    return resized
@@ -1,12 +1,16 @@
 """Utility helpers for ISBN generation, model serialization and messaging.
 """
 
+from datetime import datetime, time
 from random import choice, randint
 from typing import Optional
+from unicodedata import combining, normalize
 from django.apps import apps
 from django.contrib import messages
 from django.db.models import ForeignKey, ManyToManyField
 from django.db.models.fields.files import ImageFieldFile, FieldFile
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
 
 PREFIXES = ['978', '979'] #: Allowed ISBN-13 prefixes.
 
@@ -115,6 +119,10 @@ def _get_book_model():
 
 def _get_main_author_code_from_book(book_instance) -> Optional[str]:
     """Extract the primary author's nationality code from a Book instance.
+
+    The denormalized ``primary_nationality`` column is used when it is
+    set; otherwise the first author is looked up through ``BookAuthor``.
+
     Parameters
     ----------
     book_instance
@@ -126,6 +134,9 @@ def _get_main_author_code_from_book(book_instance) -> Optional[str]:
         The 3-character nationality code extracted from the chosen
         author, or ``None`` if no author or nationality is available.
     """
+    if getattr(book_instance, "primary_nationality_id", None):
+        return book_instance.primary_nationality.code
+
     try:
         BookAuthor = apps.get_model("bookprocess", "BookAuthor")
     except LookupError:
@@ -147,6 +158,23 @@ def _get_main_author_code_from_book(book_instance) -> Optional[str]:
 
     return None
 
+def isbn_nat_code(nat_code: Optional[str]) -> str:
+    """Return the country segment an ISBN gets for a nationality code.
+
+    Parameters
+    ----------
+    nat_code : Optional[str]
+        Nationality code, normalized with :func:`_normalize_nat_code`.
+
+    Returns
+    -------
+    str
+        The normalized code, or ``'000'`` when it is not allowed as an
+        ISBN seed.
+    """
+    nat = _normalize_nat_code(nat_code)
+    return nat if _is_allowed_nat_code(nat) else "000"
+
 def generate_unique_isbn_for_nationality(nat_code: Optional[str], max_tries: int = 5000) -> str:
     """Generate a unique ISBN-13 string using a nationality code seed.
 
@@ -168,9 +196,7 @@ def generate_unique_isbn_for_nationality(nat_code: Optional[str], max_tries: int
     str
         A unique, 13-character ISBN string.
     """
-    nat = _normalize_nat_code(nat_code)
-    if not _is_allowed_nat_code(nat):
-        nat = "000"
+    nat = isbn_nat_code(nat_code)
 
     Book = _get_book_model()
 
@@ -186,6 +212,64 @@ def generate_unique_isbn_for_nationality(nat_code: Optional[str], max_tries: int
     raise RuntimeError("Nu am reușit să genereze un ISBN unic în limita încercărilor.")
 
 
+def allocate_isbns(nat_codes, max_rounds: int = 50, batch_size: int = 500) -> list:
+    """Generate unique ISBN-13s for many books at once.
+
+    Candidates are drawn for every code and checked against the stored
+    ISBNs with one query per ``batch_size`` candidates; only the ones
+    that collide (with the database or with each other) are drawn again.
+
+    Parameters
+    ----------
+    nat_codes : Iterable[Optional[str]]
+        Nationality code of each book, see :func:`isbn_nat_code`.
+    max_rounds : int
+        Maximum number of redraws before giving up.
+    batch_size : int
+        Candidates checked per query.
+
+    Returns
+    -------
+    list of str
+        One unique ISBN per code, in the same order.
+
+    Raises
+    ------
+    RuntimeError
+        When unique ISBNs could not be found within ``max_rounds``.
+    """
+    Book = _get_book_model()
+    nats = [isbn_nat_code(code) for code in nat_codes]
+    result = [None] * len(nats)
+    pending = list(range(len(nats)))
+    taken = set()
+
+    for _ in range(max_rounds):
+        if not pending:
+            return result
+        candidates = {}
+        for index in pending:
+            first12 = choice(PREFIXES) + nats[index] + f"{randint(0, 999999):06d}"
+            isbn13 = first12 + isbn13_check_digit(first12)
+            if isbn13 not in taken and isbn13 not in candidates:
+                candidates[isbn13] = index
+        drawn = list(candidates)
+        existing = set()
+        for start in range(0, len(drawn), batch_size):
+            existing.update(
+                Book.objects.filter(isbn__in=drawn[start:start + batch_size]).values_list("isbn", flat=True)
+            )
+        for isbn13, index in candidates.items():
+            if isbn13 not in existing:
+                result[index] = isbn13
+                taken.add(isbn13)
+        pending = [index for index in pending if result[index] is None]
+
+    if pending:
+        raise RuntimeError("Nu am reușit să genereze un ISBN unic în limita încercărilor.")
+    return result
+
+
 def generate_unique_isbn_from_book(book_instance, nat_code_override: Optional[str] = None) -> str:
     """Generate a unique ISBN-13 for a Book instance.
 
@@ -220,6 +304,27 @@ def generate_unique_isbn_from_book(book_instance, nat_code_override: Optional[st
 
     return generate_unique_isbn_for_nationality("000")
 
+def normalize_search_name(*parts: str) -> str:
+    """Return the form of a name that author searches compare against.
+
+    Accents are stripped, the text is case-folded and runs of whitespace
+    and punctuation collapse to a single space, so ``"Ștefan  O'Neill"``
+    and ``"stefan o neill"`` normalize to the same string.
+
+    Parameters
+    ----------
+    *parts : str
+        Pieces of the name, joined with spaces.
+
+    Returns
+    -------
+    str
+        The normalized name (possibly empty).
+    """
+    text = normalize("NFKD", " ".join(part or "" for part in parts))
+    text = "".join(ch for ch in text if not combining(ch)).casefold()
+    return " ".join("".join(ch if ch.isalnum() else " " for ch in text).split())
+
 def represent_related(obj):
     """Return a human-friendly representation for a related object.
 
@@ -248,7 +353,7 @@ def represent_related(obj):
             return val
     return str(obj)
 
-def serialize_model_instance(instance):
+def serialize_model_instance(instance, refetch=True):
     """Serialize a Django model instance into a human-readable dict.
 
     The serializer converts foreign keys into a representative string
@@ -262,6 +367,10 @@ def serialize_model_instance(instance):
     ----------
     instance
         A saved Django model instance (must have a valid ``pk``).
+    refetch : bool
+        Re-load the instance first. Pass ``False`` for instances that
+        were loaded with their relations already joined and prefetched,
+        e.g. many at once.
 
     Returns
     -------
@@ -272,12 +381,13 @@ def serialize_model_instance(instance):
     data = {}
     opts = instance._meta
 
-    instance = (
-        instance.__class__.objects
-        .select_related(*[f.name for f in opts.fields if isinstance(f, ForeignKey)])
-        .prefetch_related(*[f.name for f in opts.many_to_many])
-        .get(pk=instance.pk)
-    )
+    if refetch:
+        instance = (
+            instance.__class__.objects
+            .select_related(*[f.name for f in opts.fields if isinstance(f, ForeignKey)])
+            .prefetch_related(*[f.name for f in opts.many_to_many])
+            .get(pk=instance.pk)
+        )
 
     for field in opts.get_fields():
         if field.auto_created and not field.concrete:
@@ -298,6 +408,36 @@ def serialize_model_instance(instance):
 
     return data
 
+def parse_as_of(value):
+    """Parse a date or datetime string into an aware datetime.
+
+    A plain date refers to the end of that day.
+
+    Parameters
+    ----------
+    value : str
+        ISO formatted date (``2025-01-31``) or datetime
+        (``2025-01-31T12:00``).
+
+    Returns
+    -------
+    datetime.datetime or None
+        An aware datetime, or ``None`` when ``value`` is malformed or names
+        a date or time that does not exist (``2025-02-30``).
+    """
+    value = (value or "").strip()
+    try:
+        # parse_datetime also accepts a plain date (as midnight), so dates go first.
+        day = parse_date(value)
+        moment = datetime.combine(day, time.max) if day else parse_datetime(value)
+    except ValueError:
+        return None
+    if moment is None:
+        return None
+    if timezone.is_naive(moment):
+        moment = timezone.make_aware(moment)
+    return moment
+
 def notify(request=None, command=None, msg="", level="info"):
     """Display a message via Django messages or a management command.
 
@@ -319,8 +459,17 @@ def notify(request=None, command=None, msg="", level="info"):
         The message text to display.
     level : str
         One of ``'info'``, ``'success'``, ``'warning'`` or ``'error'``.
+
+    Notes
+    -----
+    When ``command`` has a ``result`` collector (see
+    :class:`bookprocess.importing.ImportResult`) the message is handed to
+    it instead.
     """
-    if request is not None:
+    result = getattr(command, "result", None)
+    if result is not None:
+        result.add(msg, level)
+    elif request is not None:
         level_fn = getattr(messages, level, messages.info)
         level_fn(request, msg)
     elif command is not None:
@@ -0,0 +1,326 @@
+"""Whole-frame validation for the spreadsheet importers.
+
+The importers used to check every row in Python before touching the
+database. The functions below run the same checks as column operations
+over the whole ``DataFrame`` and return one error message per row (or
+``None`` for rows that may be imported). Only the first failing check is
+reported for a row, in the same order and wording the importers used.
+
+Lookups that need the database (existing nationalities, genres and
+ISBNs) are passed in as plain collections so validation itself performs
+no queries. That also makes the validators safe to run in worker
+processes over slices of a large sheet, see :func:`validate_in_partitions`.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+
+from pandas import DataFrame, Series, concat
+
+#: Columns whose values are required for every book row, in report order.
+BOOK_REQUIRED_FIELDS = ("title", "isbn", "authors", "nationalities", "genre", "adapted")
+
+#: Raw ``adapted`` values treated as true.
+TRUTHY_VALUES = ("true", "1", "yes")
+
+#: Frames smaller than this are validated in-process even when workers are requested.
+PARTITION_MIN_ROWS = 10000
+
+
+def _text_column(df, name):
+    """Return column ``name`` as stripped strings, blank when absent.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Frame read from the spreadsheet.
+    name : str
+        Column name.
+
+    Returns
+    -------
+    pandas.Series
+        String series aligned with ``df.index``; missing cells are ``""``.
+    """
+    if name not in df.columns:
+        return Series("", index=df.index, dtype=object)
+    return df[name].fillna("").astype(str).str.strip()
+
+
+def _split_list_column(series):
+    """Normalize a comma-separated column so items are joined by bare commas.
+
+    Surrounding whitespace and empty items are dropped, which matches
+    ``[x.strip() for x in raw.split(",") if x.strip()]`` applied per cell.
+
+    Parameters
+    ----------
+    series : pandas.Series
+        Raw comma-separated strings.
+
+    Returns
+    -------
+    tuple of pandas.Series
+        The normalized strings, the number of items per row and the first
+        item per row.
+    """
+    normalized = (
+        series.str.replace(r"\s*,[\s,]*", ",", regex=True)
+        .str.strip(",")
+    )
+    counts = normalized.str.count(",") + 1
+    counts = counts.where(normalized != "", 0)
+    first = normalized.str.split(",", n=1).str[0].fillna("")
+    return normalized, counts, first
+
+
+def _flag(errors, mask, messages):
+    """Record ``messages`` for rows in ``mask`` that have no error yet.
+
+    Parameters
+    ----------
+    errors : pandas.Series
+        Object series of error messages, ``None`` where the row is valid.
+        Updated in place.
+    mask : pandas.Series
+        Boolean series selecting the failing rows.
+    messages : pandas.Series or str
+        Message per row (or one message for all rows).
+
+    Returns
+    -------
+    None
+    """
+    target = mask & errors.isna()
+    if target.any():
+        if isinstance(messages, Series):
+            errors[target] = messages[target]
+        else:
+            errors[target] = messages
+
+
+def row_numbers(df):
+    """Return the spreadsheet row number of every frame row as strings.
+
+    Row 1 holds the header, so the first data row is row 2.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Frame read from the spreadsheet with its default index.
+
+    Returns
+    -------
+    pandas.Series
+        ``"Row <n>"`` labels aligned with ``df.index``.
+    """
+    return "Row " + Series(df.index + 2, index=df.index).astype(str)
+
+
+def normalize_isbn_series(series):
+    """Normalize raw ISBN cells to 13-digit string candidates.
+
+    Column version of the per-cell conversion: a trailing ``".0"`` left
+    by numeric cells is removed along with spaces and dashes.
+
+    Parameters
+    ----------
+    series : pandas.Series
+        Raw ISBN cells.
+
+    Returns
+    -------
+    pandas.Series
+        Cleaned strings; blank cells become ``""``.
+    """
+    cleaned = series.fillna("").astype(str).str.strip()
+    cleaned = cleaned.str.replace(r"\.0$", "", regex=True)
+    return cleaned.str.replace(r"[ \-]", "", regex=True)
+
+
+def validate_book_frame(df, nationality_codes, genre_names, existing_isbns=()):
+    """Validate a book spreadsheet in one pass.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Frame read from the spreadsheet.
+    nationality_codes : dict
+        Mapping of nationality name to its numeric code.
+    genre_names : collection of str
+        Names of the existing genres.
+    existing_isbns : collection of str, optional
+        ISBNs already stored; rows reusing them are rejected, as are
+        repeats of an ISBN earlier in the same file.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Normalized columns (``title``, ``isbn``, ``adapted``,
+        ``film_title``, ``cover_path``, ``authors``, ``nationalities``,
+        ``genre``) plus ``error``, the message for rows that must be
+        skipped and ``None`` otherwise.
+    """
+    rows = row_numbers(df)
+    raw_adapted = _text_column(df, "adapted")
+    out = DataFrame(
+        {
+            "title": _text_column(df, "title"),
+            "isbn": normalize_isbn_series(df["isbn"]) if "isbn" in df.columns else _text_column(df, "isbn"),
+            "adapted": raw_adapted.str.lower().isin(TRUTHY_VALUES),
+            "film_title": _text_column(df, "film_title"),
+            "cover_path": _text_column(df, "cover_path"),
+            "authors": _text_column(df, "authors"),
+            "nationalities": _text_column(df, "nationalities"),
+            "genre": _text_column(df, "genre"),
+        },
+        index=df.index,
+    )
+    errors = Series(None, index=df.index, dtype=object)
+
+    required = {field: out[field] for field in BOOK_REQUIRED_FIELDS if field != "adapted"}
+    required["adapted"] = raw_adapted
+    for field in BOOK_REQUIRED_FIELDS:
+        value = required[field]
+        _flag(errors, (value == "") | (value.str.lower() == "nan"), rows + f": {field} missing, skipping")
+    film = out["film_title"]
+    _flag(errors, out["adapted"] & ((film == "") | (film.str.lower() == "nan")), rows + ": film_title missing, skipping")
+
+    isbn = out["isbn"]
+    valid_isbn = isbn.str.fullmatch(r"\d{13}", na=False)
+    _flag(errors, ~valid_isbn, rows + ": Invalid ISBN '" + isbn + "'")
+
+    out["authors"], author_counts, first_author = _split_list_column(out["authors"])
+    out["nationalities"], nationality_counts, first_nationality = _split_list_column(out["nationalities"])
+    _flag(errors, author_counts != nationality_counts, rows + ": authors count != nationalities count")
+
+    primary_code = first_nationality.map(
+        {name: str(code).zfill(3) for name, code in nationality_codes.items()}
+    )
+    _flag(
+        errors,
+        primary_code.isna(),
+        rows + ": Primary nationality '" + first_nationality + "' not found",
+    )
+
+    isbn_code = isbn.str.slice(3, 6)
+    _flag(
+        errors,
+        primary_code.notna() & (primary_code != isbn_code),
+        rows + ": ISBN code " + isbn_code + " != primary author " + first_author
+        + " code " + first_nationality.map(nationality_codes).astype(str),
+    )
+
+    _flag(errors, ~out["genre"].isin(list(genre_names)), rows + ": Genre '" + out["genre"] + "' not found")
+
+    _flag(errors, isbn.isin(list(existing_isbns)), rows + ": ISBN " + isbn + " already exists, skipping")
+
+    out["error"] = errors.where(errors.notna(), None)
+    return flag_repeated_isbns(out)
+
+
+def flag_repeated_isbns(rows):
+    """Reject valid rows repeating the ISBN of an earlier valid row.
+
+    Only rows that would otherwise be imported claim their ISBN, so a
+    rejected row does not shadow a later valid one. Applying the check
+    again to already checked rows changes nothing, which lets
+    partitioned validation re-run it over the combined partitions.
+
+    Parameters
+    ----------
+    rows : pandas.DataFrame
+        Output of :func:`validate_book_frame`; updated in place.
+
+    Returns
+    -------
+    pandas.DataFrame
+        ``rows``.
+    """
+    candidate = rows["isbn"].where(rows["error"].isna())
+    repeated = candidate.notna() & candidate.duplicated()
+    if repeated.any():
+        labels = row_numbers(rows)
+        rows.loc[repeated, "error"] = (labels + ": ISBN " + rows["isbn"] + " already exists, skipping")[repeated]
+    return rows
+
+
+def validate_in_partitions(validate, df, workers, *args):
+    """Run a frame validator over row partitions in a process pool.
+
+    Each worker validates one contiguous slice and returns its compact
+    normalized rows; the slices are combined in their original order, so
+    the result does not depend on which worker finishes first.
+
+    Parameters
+    ----------
+    validate : callable
+        :func:`validate_book_frame` or :func:`validate_author_frame`.
+    df : pandas.DataFrame
+        Frame read from the spreadsheet.
+    workers : int
+        Number of worker processes; ``1`` or less validates in-process.
+    *args
+        Lookups passed on to ``validate``.
+
+    Returns
+    -------
+    pandas.DataFrame
+        The validated rows, as ``validate`` would return them for ``df``.
+    """
+    if workers <= 1 or len(df) < PARTITION_MIN_ROWS:
+        return validate(df, *args)
+
+    size = -(-len(df) // workers)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(validate, df.iloc[start:start + size], *args)
+            for start in range(0, len(df), size)
+        ]
+        rows = concat([future.result() for future in futures])
+
+    if validate is validate_book_frame:
+        flag_repeated_isbns(rows)
+    return rows
+
+
+def validate_author_frame(df, nationality_names):
+    """Validate an author spreadsheet in one pass.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Frame read from the spreadsheet.
+    nationality_names : collection of str
+        Names of the existing nationalities.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Stripped ``author`` and ``nationality`` columns plus ``error``,
+        the message for rows that must be skipped and ``None`` otherwise.
+    """
+    rows = row_numbers(df)
+    out = DataFrame(
+        {
+            "author": _text_column(df, "author"),
+            "nationality": _text_column(df, "nationality"),
+        },
+        index=df.index,
+    )
+    errors = Series(None, index=df.index, dtype=object)
+
+    _flag(errors, out["author"] == "", rows + ": author missing, skipping")
+    _flag(errors, out["nationality"] == "", rows + ": nationality missing, skipping")
+    _flag(
+        errors,
+        ~out["author"].str.contains(r"[^\W\d_]", regex=True),
+        rows + ": author name '" + out["author"] + "' contains no letters, skipping",
+    )
+    _flag(
+        errors,
+        ~out["nationality"].isin(list(nationality_names)),
+        rows + ": Nationality '" + out["nationality"] + "' not found, skipping",
+    )
+
+    out["error"] = errors.where(errors.notna(), None)
+    return out
@@ -63,7 +63,7 @@ def books_list_view(request):
 
     nationality_filter = request.GET.get('nationality', '').strip()
     if nationality_filter:
-        books = books.filter(bookauthor__author__nationality_id=nationality_filter).distinct()
+        books = books.filter(primary_nationality_id=nationality_filter)
 
     genres = Genre.objects.all().order_by('name')
 
@@ -9,6 +9,7 @@ datas = [
     ('bookprocess/templates', 'bookprocess/templates'),
     ('bookprocess/static', 'bookprocess/static'),
     ('media','media'),
+    ('bookprocess/data', 'bookprocess/data'),
     ('staticfiles', 'staticfiles'),
     ('favicon.ico', '.'),
     ('favicon.png', '.'),